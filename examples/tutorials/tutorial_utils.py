@@ -14,17 +14,25 @@ plt.rcParams["font.family"] = "serif"
 plt.rcParams["font.size"] = 20
 
 
+def _get_time_in_sfts(timestamps):
+    """Time axis of a spectrogram in units of (1800s) SFTs since the first one.
+
+    Single precision is plenty for plotting.
+    """
+    return ((timestamps - timestamps[0]) / 1800).astype(np.float32)
+
+
 def plot_real_imag_spectrograms(timestamps, frequency, fourier_data):
     fig, axs = plt.subplots(1, 2, figsize=(16, 10))
 
     for ax in axs:
         ax.set(xlabel="SFT index", ylabel="Frequency [Hz]")
 
-    time_in_days = (timestamps - timestamps[0]) / 1800
+    time_in_sfts = _get_time_in_sfts(timestamps)
 
     axs[0].set_title("SFT Real part")
     c = axs[0].pcolormesh(
-        time_in_days,
+        time_in_sfts,
         frequency,
         fourier_data.real,
         norm=colors.CenteredNorm(),
@@ -33,7 +41,7 @@ def plot_real_imag_spectrograms(timestamps, frequency, fourier_data):
 
     axs[1].set_title("SFT Imaginary part")
     c = axs[1].pcolormesh(
-        time_in_days,
+        time_in_sfts,
         frequency,
         fourier_data.imag,
         norm=colors.CenteredNorm(),
@@ -103,17 +111,17 @@ def plot_amplitude_phase_spectrograms(timestamps, frequency, fourier_data):
     for ax in axs:
         ax.set(xlabel="SFT index", ylabel="Frequency [Hz]")
 
-    time_in_days = (timestamps - timestamps[0]) / 1800
+    time_in_sfts = _get_time_in_sfts(timestamps)
 
     axs[0].set_title("SFT absolute value")
     c = axs[0].pcolormesh(
-        time_in_days, frequency, np.absolute(fourier_data), norm=colors.Normalize()
+        time_in_sfts, frequency, np.absolute(fourier_data), norm=colors.Normalize()
     )
     fig.colorbar(c, ax=axs[0], orientation="horizontal", label="Value")
 
     axs[1].set_title("SFT phase")
     c = axs[1].pcolormesh(
-        time_in_days, frequency, np.angle(fourier_data), norm=colors.CenteredNorm()
+        time_in_sfts, frequency, np.angle(fourier_data), norm=colors.CenteredNorm()
     )
 
     fig.colorbar(c, ax=axs[1], orientation="horizontal", label="Value")
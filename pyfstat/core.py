@@ -325,6 +325,7 @@ class ComputeFstat(BaseSearchClass):
         earth_ephem=None,
         sun_ephem=None,
         allowedMismatchFromSFTLength=None,
+        dFreq=0,
     ):
         """
         Parameters
@@ -440,6 +441,7 @@ class ComputeFstat(BaseSearchClass):
             Choose between implementations of the transient F-statistic functionality:
             standard `lal` implementation,
             `pycuda` for GPU version,
+            `numba` for a compiled CPU version,
             and some others only for devel/debug.
         cudaDeviceName: str
             GPU name to be matched against drv.Device output,
@@ -457,6 +459,12 @@ class ComputeFstat(BaseSearchClass):
         allowedMismatchFromSFTLength: float
             Maximum allowed mismatch from SFTs being too long
             [Default: what's hardcoded in XLALFstatMaximumSFTLength]
+        dFreq: float
+            Frequency spacing passed to lalpulsar.CreateFstatInput.
+            With the default of 0, lalpulsar can only compute a single
+            frequency bin per call.
+            If set, `get_det_stat_many()` will compute runs of points
+            with this F0 spacing in a single multi-bin call.
         """
 
         self._setup_finalizer()
@@ -656,7 +664,7 @@ class ComputeFstat(BaseSearchClass):
         ephems = lalpulsar.InitBarycenter(self.earth_ephem, self.sun_ephem)
 
         logger.info("Initialising Fstat arguments")
-        dFreq = 0
+        dFreq = getattr(self, "dFreq", 0)
         self.whatToCompute = lalpulsar.FSTATQ_2F
         if self.transientWindowType or self.computeAtoms:
             self.whatToCompute += lalpulsar.FSTATQ_ATOMS_PER_DET
@@ -764,6 +772,9 @@ class ComputeFstat(BaseSearchClass):
 
         logger.info("Initialising FstatResults")
         self.FstatResults = lalpulsar.FstatResults()
+        # Doppler point (and requested quantities) of the last ComputeFstat call,
+        # to skip recomputing at unchanged parameters
+        self._last_FstatResults_key = None
 
         # always initialise the twoFX array,
         # but only actually compute it if requested
@@ -1339,13 +1350,29 @@ class ComputeFstat(BaseSearchClass):
             argp=argp,
         )
 
-        lalpulsar.ComputeFstat(
-            Fstats=self.FstatResults,
-            input=self.FstatInput,
-            doppler=self.PulsarDopplerParams,
-            numFreqBins=1,
-            whatToCompute=self.whatToCompute,
+        # Repeated calls at the same Doppler point are common,
+        # e.g. when an MCMC only samples over transient parameters.
+        # The FstatResults (including atoms) can then be reused directly,
+        # since lalpulsar would recompute the exact same quantities.
+        FstatResults_key = (
+            tuple(self.PulsarDopplerParams.fkdot),
+            self.PulsarDopplerParams.Alpha,
+            self.PulsarDopplerParams.Delta,
+            *[
+                float(getattr(self.PulsarDopplerParams, key))
+                for key in self.binary_keys
+            ],
+            self.whatToCompute,
         )
+        if FstatResults_key != getattr(self, "_last_FstatResults_key", None):
+            lalpulsar.ComputeFstat(
+                Fstats=self.FstatResults,
+                input=self.FstatInput,
+                doppler=self.PulsarDopplerParams,
+                numFreqBins=1,
+                whatToCompute=self.whatToCompute,
+            )
+            self._last_FstatResults_key = FstatResults_key
 
         # We operate on a single frequency bin, so we grab the 0 component
         # of what is internally a twoF array.
@@ -1392,6 +1419,154 @@ class ComputeFstat(BaseSearchClass):
         self.log10BSGL = lalpulsar.ComputeBSGL(self.twoF, self.twoFX, self.BSGLSetup)
         return self.log10BSGL
 
+    def get_det_stat_many(self, params):
+        """Computes the detection statistic(s) over many parameter space points.
+
+        This is a batched version of `get_det_stat()`.
+        For a plain fully-coherent search with `self.dFreq>0`,
+        all points that only differ in F0,
+        by multiples of `self.dFreq`,
+        are computed in a single call to lalpulsar with multiple frequency bins.
+        All other points are computed one at a time through `get_det_stat()`.
+
+        Parameters
+        ----------
+        params: dict
+            A dictionary of equal-length arrays,
+            one for each parameter as supported by `get_det_stat()`.
+            Parameters that are fixed over all points can instead be given
+            as scalars, which are then not part of the grouping into runs.
+
+        Returns
+        -------
+        out: dict
+            A dictionary of arrays ordered like the input points:
+            `twoF`, the single-detector `twoF{IFO}` (if `self.singleFstats`)
+            and the main detection statistic as returned by `get_det_stat()`
+            (as `detstat`).
+        """
+        fixed = {key: val for key, val in params.items() if np.ndim(val) == 0}
+        params = {
+            key: np.atleast_1d(vals)
+            for key, vals in params.items()
+            if key not in fixed.keys()
+        }
+        npoints = len(next(iter(params.values()))) if params else 1
+        # every point is covered by exactly one run below,
+        # so the outputs need no initialisation
+        out = {"twoF": np.empty(npoints)}
+        if self.singleFstats:
+            # one row per point, so each point's twoFX is stored in a single copy;
+            # the per-detector outputs are column views of this
+            twoFX = np.empty((npoints, len(self.detector_names)))
+            for X, IFO in enumerate(self.detector_names):
+                out[f"twoF{IFO}"] = twoFX[:, X]
+        out["detstat"] = np.empty(npoints)
+        for idxs in self._get_frequency_bin_runs(params):
+            if len(idxs) == 1:
+                n = idxs[0]
+                out["detstat"][n] = self.get_det_stat(
+                    params={**fixed, **{key: vals[n] for key, vals in params.items()}}
+                )
+                out["twoF"][n] = self.twoF
+                if self.singleFstats:
+                    twoFX[n] = self.twoFX[: len(self.detector_names)]
+            else:
+                run = self._get_fullycoherent_detstats_over_bins(
+                    params={
+                        **fixed,
+                        **{key: vals[idxs[0]] for key, vals in params.items()},
+                    },
+                    numFreqBins=len(idxs),
+                )
+                for key, vals in run.items():
+                    out[key][idxs] = vals
+        return out
+
+    def _get_frequency_bin_runs(self, params):
+        """Split points into runs that can share a multi-bin F-stat call.
+
+        Each run is an array of point indices of increasing F0,
+        spaced by `self.dFreq`, with all other parameters identical.
+        Without multi-bin support, or if F0 is fixed, each run is a single point.
+        Only the varying parameters in `params` need to be given.
+        """
+        npoints = len(next(iter(params.values()))) if params else 1
+        if (
+            "F0" not in params.keys()
+            or not getattr(self, "dFreq", 0) > 0
+            or self.transientWindowType
+            or self.get_det_stat != self.get_fullycoherent_detstat
+        ):
+            return np.arange(npoints).reshape(-1, 1)
+        other_keys = [key for key in params.keys() if key != "F0"]
+        if other_keys:
+            others = np.stack([params[key] for key in other_keys], axis=-1)
+            group = np.unique(others, axis=0, return_inverse=True)[1].reshape(-1)
+        else:
+            group = np.zeros(npoints, dtype=int)
+        order = np.lexsort((params["F0"], group))
+        F0 = params["F0"][order]
+        group = group[order]
+        # position of each point on the bins grid starting at its group's lowest F0
+        first = np.concatenate(([True], np.diff(group) != 0))
+        F0start = F0[first][np.cumsum(first) - 1]
+        k = np.rint((F0 - F0start) / self.dFreq)
+        on_grid = np.abs(F0 - F0start - k * self.dFreq) <= 1e-6 * self.dFreq
+        new_run = (
+            first
+            | ~on_grid
+            | np.concatenate(([True], (np.diff(k) != 1) | ~on_grid[:-1]))
+        )
+        return np.split(order, np.flatnonzero(new_run)[1:])
+
+    def _get_fullycoherent_detstats_over_bins(self, params, numFreqBins):
+        """Computes fully-coherent statistics over a run of frequency bins.
+
+        Parameters
+        ----------
+        params: dict
+            A dictionary defining the parameter space point
+            of the lowest frequency bin.
+        numFreqBins: int
+            Number of frequency bins, spaced by `self.dFreq`.
+
+        Returns
+        -------
+        out: dict
+            A dictionary of arrays over bins, with the same keys
+            as for `get_det_stat_many()`.
+        """
+        self._set_PulsarDopplerParams(params)
+        lalpulsar.ComputeFstat(
+            Fstats=self.FstatResults,
+            input=self.FstatInput,
+            doppler=self.PulsarDopplerParams,
+            numFreqBins=numFreqBins,
+            whatToCompute=self.whatToCompute,
+        )
+        # the single-point cache must not pick up these multi-bin results
+        self._last_FstatResults_key = None
+        out = {"twoF": np.array(self.FstatResults.twoF[:numFreqBins], dtype=float)}
+        if self.singleFstats:
+            twoFX = np.zeros(
+                (numFreqBins, lalpulsar.PULSAR_MAX_DETECTORS), dtype=np.float32
+            )
+            for X in range(self.FstatResults.numDetectors):
+                twoFX[:, X] = self.FstatResults.twoFPerDet(X)[:numFreqBins]
+            for X, IFO in enumerate(self.detector_names):
+                out[f"twoF{IFO}"] = twoFX[:, X].astype(float)
+        if self.BSGL:
+            out["detstat"] = np.array(
+                [
+                    lalpulsar.ComputeBSGL(twoF, twoFX[j], self.BSGLSetup)
+                    for j, twoF in enumerate(out["twoF"])
+                ]
+            )
+        else:
+            out["detstat"] = out["twoF"]
+        return out
+
     def get_transient_detstats(
         self,
         tstart=None,
@@ -2166,6 +2341,8 @@ class SemiCoherentSearch(ComputeFstat):
             numFreqBins=1,
             whatToCompute=self.whatToCompute,
         )
+        # the single-point cache must not pick up these semi-coherent results
+        self._last_FstatResults_key = None
 
         twoF_per_segment = self._get_per_segment_twoF()
         self.twoF = twoF_per_segment.sum()
@@ -1,15 +1,20 @@
 """PyFstat search classes using grid-based methods."""
 
+import functools
 import itertools
 import logging
+import math
+import multiprocessing
 import os
 import re
+import uuid
 
 import lalpulsar
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from numpy.lib.recfunctions import structured_to_unstructured
 from tqdm import tqdm
 
 import pyfstat.utils as utils
@@ -23,6 +28,167 @@ from pyfstat.core import (
 
 logger = logging.getLogger(__name__)
 
+# Search objects set up inside pool worker processes,
+# keyed by a token unique to each GridSearch.run() call,
+# so that each worker only has to load the data once per run
+# (see GridSearch.__setstate__).
+_pool_worker_search_objects = {}
+
+# matches the width/precision numbers in fprintf formats like "%.16g"
+_FMT_DIGITS = re.compile(r"\d+")
+
+
+# CFSv2 grid file column names to PyFstat parameter names
+_CFSV2_KEY_TRANSLATION = {
+    "freq": "F0",
+    "alpha": "Alpha",
+    "delta": "Delta",
+    **{f"f{k + 1}dot": f"F{k + 1}" for k in range(lalpulsar.PULSAR_MAX_SPINS - 1)},
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _get_tolerance_from_fmt(f):
+    """Comparison tolerances `(rtol, atol)` for values printed with fprintf format f."""
+    if f.endswith("d"):
+        return 0, 0
+    elif f.endswith("g"):
+        precision = int(_FMT_DIGITS.findall(f)[-1])
+        return 10 ** (1 - precision), 0
+    elif f.endswith("f"):
+        decimals = int(_FMT_DIGITS.findall(f)[-1])
+        return 0, 10**-decimals
+    raise ValueError(
+        "Cannot parse fprintf format '{:s}' to obtain recommended tolerance.".format(f)
+    )
+
+
+class IndexedGrid:
+    """A lazy view of the Cartesian product grid over search dimensions.
+
+    This behaves like the structured array of all grid points
+    (with the last dimension varying fastest, as for `itertools.product`),
+    but computes any values on demand from the 1D coordinate arrays,
+    so that the full product grid is never held in memory.
+    """
+
+    def __init__(self, coord_arrays, keys):
+        """
+        Parameters
+        ----------
+        coord_arrays: list
+            The 1D arrays of grid points along each dimension.
+        keys: list
+            The names of the dimensions, ordered like `coord_arrays`.
+        """
+        self.coord_arrays = [np.asarray(ca) for ca in coord_arrays]
+        self.keys = list(keys)
+        self.lens = np.array([len(ca) for ca in self.coord_arrays], dtype=np.int64)
+        self.strides = np.append(np.cumprod(self.lens[:0:-1])[::-1], 1)
+        self.dtype = np.dtype(
+            {"names": self.keys, "formats": np.repeat(float, len(self.keys))}
+        )
+
+    def __len__(self):
+        return math.prod(self.lens.tolist())
+
+    def __getitem__(self, key):
+        """Get the full column of a parameter over all grid points.
+
+        The coordinates are broadcast over the full grid shape
+        (without copying) and only the final flattening allocates memory,
+        so no per-point index arithmetic is needed.
+        """
+        k = self.keys.index(key)
+        return np.meshgrid(*self.coord_arrays, indexing="ij", copy=False)[k].ravel()
+
+    def __array__(self, dtype=None, copy=None):
+        """Materialize the full structured array of grid points.
+
+        Each column is filled in place through an N-dimensional view,
+        avoiding any temporary flattened copies.
+        """
+        data = np.empty(len(self), dtype=self.dtype)
+        # contiguous, so this reshape is always a view
+        data_nd = data.reshape(self.lens)
+        cols = np.meshgrid(*self.coord_arrays, indexing="ij", copy=False)
+        for key, col in zip(self.keys, cols):
+            data_nd[key] = col
+        return data if dtype is None else data.astype(dtype)
+
+    def __iter__(self):
+        return itertools.product(*self.coord_arrays)
+
+    def get_points(self, idxs, keys=None):
+        """Get the parameter values at a set of grid points.
+
+        Parameters
+        ----------
+        idxs: np.ndarray
+            Integer row indices into the product grid.
+        keys: list or None
+            Parameters to get; if None, all dimensions.
+
+        Returns
+        -------
+        vals: dict
+            A dictionary of arrays for each of the requested `keys`.
+        """
+        if keys is None:
+            keys = self.keys
+        vals = {}
+        for key in keys:
+            k = self.keys.index(key)
+            vals[key] = self.coord_arrays[k][(idxs // self.strides[k]) % self.lens[k]]
+        return vals
+
+    def matches(self, old_data, rtol, atol):
+        """Check if another data set has the same grid points, in the same order.
+
+        Instead of comparing the full columns,
+        a few evenly spaced rows (including the first and last)
+        are first compared against the expected grid points,
+        so that most mismatches are caught without touching the full data.
+        Then the unique values of each column of `old_data`
+        are compared against the coordinate arrays,
+        bailing out at the first mismatching dimension,
+        and finally a single check verifies that the rows are in product-grid order.
+
+        Parameters
+        ----------
+        old_data: np.ndarray
+            A structured array containing at least the columns `self.keys`.
+        rtol, atol: dict
+            Relative and absolute tolerances for each key.
+
+        Returns
+        -------
+        matches: bool
+            Whether the grid points in `old_data` match this grid.
+        """
+        if len(old_data) != len(self):
+            return False
+        sample_idxs = np.unique(np.linspace(0, len(self) - 1, 16).astype(np.int64))
+        sample_points = self.get_points(sample_idxs)
+        for key in self.keys:
+            if not np.allclose(
+                old_data[key][sample_idxs],
+                sample_points[key],
+                rtol=rtol[key],
+                atol=atol[key],
+            ):
+                return False
+        flat_idxs = np.zeros(len(old_data), dtype=np.int64)
+        for key, coords, stride in zip(self.keys, self.coord_arrays, self.strides):
+            old_unique, old_pos = np.unique(old_data[key], return_inverse=True)
+            sort_idxs = np.argsort(coords, kind="stable")
+            if len(old_unique) != len(coords) or not np.allclose(
+                old_unique, coords[sort_idxs], rtol=rtol[key], atol=atol[key]
+            ):
+                return False
+            flat_idxs += sort_idxs[old_pos.reshape(-1)] * stride
+        return np.array_equal(flat_idxs, np.arange(len(old_data)))
+
 
 class GridSearch(BaseSearchClass):
     """A search evaluating the F-statistic over a regular grid in parameter space.
@@ -37,13 +203,16 @@ class GridSearch(BaseSearchClass):
     (twoF or log10BSGL) appended.
 
     NOTE: if a large number of grid points are used, checks against cached
-    data may be slow as the array is loaded into memory. To avoid this, run
-    with the `clean` option which uses a generator instead.
+    data may be slow as the old output file is loaded into memory.
+    To avoid this, run with the `clean` option.
 
     Most parameters are the same as for the `core.ComputeFstat` class,
     only the additional ones are documented here:
     """
 
+    batch_size = 10000
+    """Approximate number of grid points per `get_det_stat_many()` call."""
+
     @utils.initializer
     def __init__(
         self,
@@ -110,7 +279,15 @@ class GridSearch(BaseSearchClass):
         logger.info(f"Detection statistic set to {self.detstat}.")
         self._initiate_search_object()
         self._set_output_keys()
-        self.output_file_header = self.get_output_file_header()
+
+    @functools.cached_property
+    def output_file_header(self):
+        """Meta-information header for the output file.
+
+        Only constructed on first use, e.g. when saving results to disk,
+        as searches run with `return_data=True` never need it.
+        """
+        return self.get_output_file_header()
 
     def _set_output_keys(self):
         self.output_keys = self.search_keys.copy()
@@ -147,6 +324,7 @@ class GridSearch(BaseSearchClass):
                 assumeSqrtSX=self.assumeSqrtSX,
                 earth_ephem=self.earth_ephem,
                 sun_ephem=self.sun_ephem,
+                dFreq=self._get_F0_spacing(),
             )
         else:
             self.search = SemiCoherentSearch(
@@ -170,6 +348,20 @@ class GridSearch(BaseSearchClass):
         self.minStartTime = self.search.minStartTime
         self.maxStartTime = self.search.maxStartTime
 
+    def _get_F0_spacing(self):
+        """Get the spacing of a uniform F0 grid, or 0 if not uniform.
+
+        This allows the search object to compute neighbouring F0 values
+        in a single multi-bin call.
+        """
+        F0s = self._get_array_from_tuple(self.F0)
+        if len(F0s) < 2:
+            return 0
+        dF0 = (F0s[-1] - F0s[0]) / (len(F0s) - 1)
+        if dF0 > 0 and np.allclose(np.diff(F0s), dF0, rtol=1e-6, atol=0):
+            return dF0
+        return 0
+
     def _get_array_from_tuple(self, x):
         if len(x) == 1:
             return np.array(x)
@@ -191,9 +383,14 @@ class GridSearch(BaseSearchClass):
     def _get_input_data_array(self):
         """Set up an input data array, i.e. the product array over search dimensions.
 
-        This is a numpy structured array with named columns
-        and explicit dtype (cannot have named columns without that).
-        (Will also ensure safety when reading/saving data from/to .txt files.)
+        This is an `IndexedGrid` which behaves like a numpy structured array
+        with named columns and explicit dtype
+        (will also ensure safety when reading/saving data from/to .txt files),
+        but computes grid points on demand instead of storing them all.
+
+        Also sorts the search dimensions into active ones (more than one value)
+        and frozen ones (a single value),
+        so that only the former need to be looked up for each batch of points.
         """
         logger.info("Generating input data array")
         coord_arrays = []
@@ -202,19 +399,16 @@ class GridSearch(BaseSearchClass):
                 self._get_array_from_tuple(np.atleast_1d(getattr(self, sl)))
             )
         self.coord_arrays = coord_arrays
-        self.total_iterations = np.prod([len(ca) for ca in coord_arrays])
-
-        if not self.clean:
-            input_data = []
-            for vals in itertools.product(*coord_arrays):
-                input_data.append(vals)
-            input_dtype = np.dtype(
-                {
-                    "names": self.search_keys,
-                    "formats": np.repeat(float, len(self.search_keys)),
-                }
-            )
-            self.input_data = np.array(input_data, dtype=input_dtype)
+        self.input_data = IndexedGrid(coord_arrays, self.search_keys)
+        self.total_iterations = len(self.input_data)
+        self._active_axes = [
+            key for key, ca in zip(self.search_keys, coord_arrays) if len(ca) > 1
+        ]
+        self._frozen = {
+            key: ca[0]
+            for key, ca in zip(self.search_keys, coord_arrays)
+            if len(ca) == 1
+        }
 
     def check_old_data_is_okay_to_use(self):
         """Check if an existing output file matches this search and reuse the results.
@@ -233,8 +427,10 @@ class GridSearch(BaseSearchClass):
            matches in dimension with current grid,
            and the values in those input columns match with the current grid.
 
-        Through `utils.read_txt_file_with_header()`,
-        the existing file is read in with `np.genfromtxt()`.
+        The column names are read from the last header line first,
+        and only if there are enough columns,
+        the data is read in with pandas' fast C parser
+        (see `_read_old_data()`).
         """
         if self.clean:
             return False
@@ -275,23 +471,30 @@ class GridSearch(BaseSearchClass):
                 "Parameters string in file header matches current search setup."
             )
 
-        logger.info("Loading old data from '{:s}'.".format(self.out_file))
-        old_data = utils.read_txt_file_with_header(self.out_file, names=True)
-        if len(old_data) != len(self.input_data):
+        names = self._read_old_data_column_names()
+        if len(names) < len(self.input_data.dtype):
             logger.info(
-                "Old data found in '{:s}', but differs"
-                " in length ({:d} points in file, {:d} points requested);"
+                "Old data found in '{:s}', but has less columns ({:d})"
+                " than new input parameters grid ({:d});"
                 " continuing with grid search.".format(
-                    self.out_file, np.shape(old_data)[0], np.shape(self.input_data)[0]
+                    self.out_file, len(names), len(self.input_data.dtype)
                 )
             )
             return False
-        if len(old_data.dtype) < len(self.input_data.dtype):
+        logger.info("Loading old data from '{:s}'.".format(self.out_file))
+        old_data = self._read_old_data(names)
+        if old_data is None:
+            logger.info(
+                "Old data found in '{:s}', but could not be parsed;"
+                " continuing with grid search.".format(self.out_file)
+            )
+            return False
+        if len(old_data) != len(self.input_data):
             logger.info(
-                "Old data found in '{:s}', but has less columns ({:d})"
-                " than new input parameters grid ({:d});"
+                "Old data found in '{:s}', but differs"
+                " in length ({:d} points in file, {:d} points requested);"
                 " continuing with grid search.".format(
-                    self.out_file, np.shape(old_data)[1], np.shape(self.input_data)[1]
+                    self.out_file, len(old_data), len(self.input_data)
                 )
             )
             return False
@@ -302,15 +505,19 @@ class GridSearch(BaseSearchClass):
         # (this could in principle be cleverly predicted at this point)
         # and the np.allclose() check should safely catch those situations
         rtol, atol = self._get_tolerance_from_savetxt_fmt()
-        column_matches = [
-            np.allclose(
-                old_data[key],
-                self.input_data[key],
-                rtol=rtol[key],
-                atol=atol[key],
-            )
-            for key in self.search_keys
-        ]
+        if isinstance(self.input_data, IndexedGrid):
+            column_matches = self.input_data.matches(old_data, rtol, atol)
+        else:
+            # compare all columns in a single pass over plain 2D arrays
+            # (a view where possible) instead of strided structured-array reads
+            column_matches = np.isclose(
+                structured_to_unstructured(old_data[self.search_keys], dtype=float),
+                structured_to_unstructured(
+                    self.input_data[self.search_keys], dtype=float
+                ),
+                rtol=np.array([rtol[key] for key in self.search_keys]),
+                atol=np.array([atol[key] for key in self.search_keys]),
+            ).all(axis=0)
         if np.all(column_matches):
             logger.info(
                 "Old data found in '{:s}' with matching input parameters grid,"
@@ -318,7 +525,15 @@ class GridSearch(BaseSearchClass):
                     self.out_file, len(old_data), len(old_data.dtype)
                 )
             )
-            return old_data
+            # same column types as freshly computed results
+            # (e.g. single-precision detection statistics)
+            out_dtype = self._get_output_dtype()
+            return old_data.astype(
+                [
+                    (key, out_dtype.fields.get(key, old_data.dtype.fields[key])[0])
+                    for key in old_data.dtype.names
+                ]
+            )
         else:
             logger.info(
                 "Old data found in '{:s}', input parameters grid differs,"
@@ -327,49 +542,213 @@ class GridSearch(BaseSearchClass):
             return False
         return False
 
-    def _get_single_cand_results(self, data, n, vals):
-        """Obtain the results at each grid iteration step.
+    def _read_old_data_column_names(self, comments="#"):
+        """Get the column names from the last header line of the old output file."""
+        names = []
+        with open(self.out_file, "r") as f:
+            for line in f:
+                if not line.startswith(comments):
+                    break
+                names = line.lstrip(comments).split()
+        return names
 
-        Re-formats the input params into the format required by self.search.get_det_stat()
-        and gets additional detection statistic by-products as needed,
-        then stores them all into the right columns of the data array.
+    def _read_old_data(self, names, comments="#"):
+        """Read the old output file into a structured array.
+
+        This gives the same result as `utils.read_txt_file_with_header()`,
+        but uses pandas' C parser instead of the much slower `np.genfromtxt()`.
+
+        Parameters
+        ----------
+        names: list
+            The column names, as from `_read_old_data_column_names()`.
+        comments: str
+            The character used to indicate header lines.
+
+        Returns
+        -------
+        old_data: np.ndarray or None
+            The data as a structured array with float columns,
+            or None if the file could not be parsed.
+        """
+        try:
+            df = pd.read_csv(
+                self.out_file,
+                comment=comments,
+                sep="\\s+",
+                engine="c",
+                header=None,
+                names=names,
+                dtype=np.float64,
+            )
+        except (ValueError, pd.errors.ParserError) as e:
+            logger.info(f"Failed to parse '{self.out_file}': {e}")
+            return None
+        old_data = np.empty(
+            len(df), dtype=np.dtype({"names": names, "formats": [float] * len(names)})
+        )
+        for key in names:
+            old_data[key] = df[key].to_numpy()
+        return old_data
+
+    def _get_batches(self):
+        """Split the grid into batches of row indices of the final data array.
+
+        In the product grid, F0 varies slowest.
+        So each batch comprises a contiguous range of F0 values
+        for a contiguous block of the other dimensions,
+        allowing `self.search.get_det_stat_many()`
+        to compute runs of F0 values together.
+
+        Returns
+        -------
+        batches: list
+            A list of integer index arrays,
+            of about `self.batch_size` points each.
+        """
+        nF0 = len(self.coord_arrays[0])
+        nOther = self.total_iterations // nF0
+        nF0_batch = max(1, min(nF0, self.batch_size))
+        block = max(1, self.batch_size // nF0_batch)
+        return [
+            (
+                np.arange(F0start, min(F0start + nF0_batch, nF0))[:, None] * nOther
+                + np.arange(start, min(start + block, nOther))
+            ).ravel()
+            for start in range(0, nOther, block)
+            for F0start in range(0, nF0, nF0_batch)
+        ]
+
+    def _get_grid_points(self, idxs):
+        """Get the parameter values at rows `idxs` of the product grid.
+
+        Returns
+        -------
+        vals: dict
+            A dictionary of arrays, one for each of `self.search_keys`.
+        """
+        return self.input_data.get_points(idxs)
+
+    def _get_active_grid_points(self, idxs):
+        """Get the parameter values at rows `idxs` of the product grid.
+
+        Like `_get_grid_points()`, but frozen (single-valued) search dimensions
+        are returned as scalars instead of constant arrays.
+        """
+        vals = self.input_data.get_points(idxs, keys=self._active_axes)
+        vals.update(self._frozen)
+        return vals
+
+    def _get_batch_points(self, idxs):
+        """Get the grid points needed by `_get_batch_results()` at rows `idxs`."""
+        return self._get_active_grid_points(idxs)
+
+    def _get_pool_batch_results(self, batch):
+        """`_get_batch_results()` for an `(idxs, vals)` batch sent to a pool worker.
+
+        The workers get their grid points along with each batch,
+        as they do not have the full grid (see `__getstate__()`).
+        """
+        return self._get_batch_results(*batch)
+
+    def _get_output_dtype(self):
+        """Get the structured dtype of the inputs+outputs data array.
+
+        The detection statistic columns are stored in single precision
+        if `self.fmt_detstat` asks for no more than 7 significant digits,
+        otherwise everything is in double precision.
+        (lalpulsar computes these statistics in single precision anyway.)
+        """
+        detstat_float = float
+        if self.fmt_detstat.endswith("g"):
+            if int(_FMT_DIGITS.findall(self.fmt_detstat)[-1]) <= 7:
+                detstat_float = np.float32
+        return np.dtype(
+            {
+                "names": self.output_keys,
+                "formats": [
+                    float if key in self.search_keys else detstat_float
+                    for key in self.output_keys
+                ],
+            }
+        )
+
+    def _get_batch_results(self, idxs, vals=None):
+        """Obtain the results for a batch of grid points.
+
+        Gets the detection statistic and by-products over all points at once
+        from self.search.get_det_stat_many(),
+        then stores them all into the right columns of a data array.
         Can be overridden e.g. for legacy get_det_stat() variants.
 
         Parameters
         ----------
-        data: np.ndarray
-            The inputs+outputs data set to be updated.
-        n: int
-            Row index of the data array to update.
-        vals: tuple
-            Iteration of our iterable.
+        idxs: np.ndarray
+            Row indices of the grid points in the full data array.
+        vals: dict or None
+            The grid points at `idxs`, as from `_get_batch_points()`;
+            looked up here if None.
 
         Returns
         -------
         data: np.ndarray
-            The updated inputs+outputs data set.
+            The inputs+outputs data set for these points, ordered like `idxs`.
         """
-        thisCand = {key: val for key, val in zip(self.search_keys, vals)}
-        detstat = self.search.get_det_stat(params=thisCand)
-        thisCand["twoF"] = self.search.twoF
-        if self.search.singleFstats:
-            for X, IFO in enumerate(self.search.detector_names):
-                thisCand[f"twoF{IFO}"] = self.search.twoFX[X]
+        data = np.empty(len(idxs), dtype=self._get_output_dtype())
+        if vals is None:
+            vals = self._get_batch_points(idxs)
+        out = self.search.get_det_stat_many(vals)
         if self.detstat != "twoF":
-            thisCand[self.detstat] = detstat
+            out[self.detstat] = out["detstat"]
         for key in self.output_keys:
-            if key in thisCand.keys():
-                data[key][n] = thisCand[key]
+            if key in vals.keys():
+                data[key] = vals[key]
+            elif key in out.keys():
+                data[key] = out[key]
             else:  # pragma: no cover
                 raise RuntimeError(
-                    f"Could not get value for key {key} from candidate dict {thisCand}."
+                    f"Could not get values for key {key} from batch results {out.keys()}."
                 )
         return data
 
-    def run(self, return_data=False):
+    def __getstate__(self):
+        """Drop members that cannot, or need not, be sent to pool worker processes.
+
+        The worker processes only compute batches of results,
+        with the grid points sent along with each batch,
+        so neither the full grid nor any previous results are sent every time.
+        """
+        state = self.__dict__.copy()
+        for key in ["search", "data", "input_data", "grid", "coord_arrays"]:
+            state.pop(key, None)
+        if "_det_stat_cache" in state:
+            state["_det_stat_cache"] = {}
+        return state
+
+    def __setstate__(self, state):
+        """Restore state and attach a search object owned by this process.
+
+        Within one `run()`, each worker process sets up a search object
+        only once and reuses it for all later batches.
+        Only the latest run's object is kept,
+        so that different searches (or changed settings) sharing a pool
+        never get to use another run's data.
+        """
+        self.__dict__.update(state)
+        token = state.get("_pool_token")
+        if token is None:
+            self._initiate_search_object()
+            return
+        if token not in _pool_worker_search_objects:
+            self._initiate_search_object()
+            _pool_worker_search_objects.clear()
+            _pool_worker_search_objects[token] = self.search
+        self.search = _pool_worker_search_objects[token]
+
+    def run(self, return_data=False, pool=None, n_workers=1):
         """Execute the actual search over the full grid.
 
-        This iterates over all points in the multi-dimensional product grid
+        This iterates over batches of points in the multi-dimensional product grid
         and the end result is either returned as a numpy array or saved to disk.
 
         Parameters
@@ -377,6 +756,18 @@ class GridSearch(BaseSearchClass):
         return_data: boolean
             If true, the final inputs+outputs data set is returned as a numpy array.
             If false, it is saved to disk and nothing is returned.
+        pool: object, optional
+            A pool object with a `map` method
+            (e.g. `multiprocessing.Pool` or `schwimmbad.MPIPool`)
+            to distribute the batches of grid points over worker processes.
+            Each worker sets up its own search object
+            (including reading in the data) once.
+            (lalpulsar holds the GIL while computing F-statistics,
+            so a thread pool would not gain anything.)
+        n_workers: int
+            If no `pool` is given and this is larger than 1,
+            a `multiprocessing.Pool` with this many worker processes
+            is set up just for this run.
 
         Returns
         -------
@@ -384,35 +775,39 @@ class GridSearch(BaseSearchClass):
             The final inputs+outputs data set.
             Only if `return_data=true`.
         """
+        if pool is None and n_workers > 1:
+            with multiprocessing.Pool(n_workers) as own_pool:
+                return self.run(return_data=return_data, pool=own_pool)
+
         self._get_input_data_array()
 
-        if self.clean:
-            iterable = itertools.product(*self.coord_arrays)
-        else:
+        if not self.clean:
             old_data = self.check_old_data_is_okay_to_use()
-            iterable = self.input_data
-
             if old_data is not False:
                 self.data = old_data
                 return
 
         logger.info(
             "Running search over a total of {:d} grid points...".format(
-                np.shape(iterable)[0]
+                self.total_iterations
             )
         )
-        output_dtype = np.dtype(
-            {
-                "names": self.output_keys,
-                "formats": np.repeat(float, len(self.output_keys)),
-            }
-        )
-        data = np.zeros(len(self.input_data), dtype=output_dtype)
+        # every row is filled by exactly one batch, so no need to zero-fill
+        data = np.empty(self.total_iterations, dtype=self._get_output_dtype())
 
-        for n, vals in enumerate(
-            tqdm(iterable, total=getattr(self, "total_iterations", None))
-        ):
-            data = self._get_single_cand_results(data, n, vals)
+        batches = self._get_batches()
+        if pool is None:
+            results = map(self._get_batch_results, batches)
+        else:
+            mapf = getattr(pool, "imap", pool.map)
+            # new for each run, so no worker reuses a stale search object
+            self._pool_token = uuid.uuid4().hex
+            results = mapf(
+                self._get_pool_batch_results,
+                ((idxs, self._get_batch_points(idxs)) for idxs in batches),
+            )
+        for idxs, batch_data in zip(batches, tqdm(results, total=len(batches))):
+            data[idxs] = batch_data
 
         if return_data:
             return data
@@ -445,27 +840,12 @@ class GridSearch(BaseSearchClass):
 
     def _get_tolerance_from_savetxt_fmt(self):
         """Decide appropriate input grid comparison tolerances from fprintf formats."""
-        fmt = self._get_savetxt_fmt_dict()
-        rtol = {}
-        atol = {}
-        for key, f in fmt.items():
-            if f.endswith("d"):
-                rtol[key] = 0
-                atol[key] = 0
-            elif f.endswith("g"):
-                precision = int(re.findall(r"\d+", f)[-1])
-                rtol[key] = 10 ** (1 - precision)
-                atol[key] = 0
-            elif f.endswith("f"):
-                decimals = int(re.findall(r"\d+", f)[-1])
-                rtol[key] = 0
-                atol[key] = 10**-decimals
-            else:
-                raise ValueError(
-                    "Cannot parse fprintf format '{:s}' to obtain recommended tolerance.".format(
-                        f
-                    )
-                )
+        tols = {
+            key: _get_tolerance_from_fmt(f)
+            for key, f in self._get_savetxt_fmt_dict().items()
+        }
+        rtol = {key: tol[0] for key, tol in tols.items()}
+        atol = {key: tol[1] for key, tol in tols.items()}
         return rtol, atol
 
     def save_array_to_disk(self):
@@ -492,25 +872,33 @@ class GridSearch(BaseSearchClass):
                 " override the _get_savetxt_fmt_dict"
                 " method.".format(Ncols, len(outfmt))
             )
-        np.savetxt(
-            self.out_file,
-            np.nan_to_num(self.data),
-            delimiter=" ",
-            header=header,
-            fmt=outfmt,
-        )
+        # Same output as np.savetxt(fmt=outfmt, header=header) of the NaN-cleaned
+        # data, but formatting whole chunks of plain Python rows at once
+        # instead of going through np.savetxt's per-row structured-array access.
+        rowfmt = " ".join(outfmt) + "\n"
+        chunksize = 100000
+        with open(self.out_file, "w") as f:
+            f.write("# " + header.replace("\n", "\n# ") + "\n")
+            for start in range(0, len(self.data), chunksize):
+                chunk = self.data[start : start + chunksize]
+                columns = [
+                    np.nan_to_num(chunk[key]).tolist() for key in self.data.dtype.names
+                ]
+                f.writelines(map(rowfmt.__mod__, zip(*columns)))
 
     def _convert_F0_to_mismatch(self, F0, F0hat, Tseg):
         DeltaF0 = F0[1] - F0[0]
         m_spacing = (np.pi * Tseg * DeltaF0) ** 2 / 12.0
         N = len(F0)
-        return np.arange(-N * m_spacing / 2.0, N * m_spacing / 2.0, m_spacing)
+        # like in _get_array_from_tuple(), avoid np.arange's unstable endpoint
+        return np.linspace(-N * m_spacing / 2.0, N * m_spacing / 2.0, N, endpoint=False)
 
     def _convert_F1_to_mismatch(self, F1, F1hat, Tseg):
         DeltaF1 = F1[1] - F1[0]
         m_spacing = (np.pi * Tseg**2 * DeltaF1) ** 2 / 720.0
         N = len(F1)
-        return np.arange(-N * m_spacing / 2.0, N * m_spacing / 2.0, m_spacing)
+        # like in _get_array_from_tuple(), avoid np.arange's unstable endpoint
+        return np.linspace(-N * m_spacing / 2.0, N * m_spacing / 2.0, N, endpoint=False)
 
     def _add_mismatch_to_ax(self, ax, x, y, xkey, ykey, xhat, yhat, Tseg):
         axX = ax.twiny()
@@ -681,21 +1069,32 @@ class GridSearch(BaseSearchClass):
         """
         if ax is None:
             fig, ax = plt.subplots()
-        flat_idxs = [self.search_keys.index(k) for k in flat_keys]
-
-        x = np.unique(self.data[xkey])
+        # contiguous copy of the strided structured-array field,
+        # so that the reshape and flattening below work on plain memory
+        z = np.ascontiguousarray(self.data[self.detstat])
+
+        if isinstance(getattr(self, "input_data", None), IndexedGrid):
+            # the product grid layout is already known,
+            # so no need to sort the data columns to rediscover it
+            axes = [self.search_keys.index(key) for key in [xkey, ykey] + flat_keys]
+            x, y, *flat_vals = [self.coord_arrays[k] for k in axes]
+            Z = np.moveaxis(
+                z.reshape([len(ca) for ca in self.coord_arrays]),
+                axes,
+                range(len(axes)),
+            )
+        else:
+            x = np.unique(self.data[xkey])
+            y = np.unique(self.data[ykey])
+            flat_vals = [np.unique(self.data[k]) for k in flat_keys]
+            Z = z
+        shape = [len(x), len(y)] + [len(v) for v in flat_vals]
+        Z = Z.reshape(shape)
         if x0:
             x = x - x0
-        y = np.unique(self.data[ykey])
         if y0:
             y = y - y0
-        flat_vals = [np.unique(self.data[:, j]) for j in flat_idxs]
-
-        z = self.data[self.detstat]
-
         Y, X = np.meshgrid(y, x)
-        shape = [len(x), len(y)] + [len(v) for v in flat_vals]
-        Z = z.reshape(shape)
 
         if len(rel_flat_idxs) > 0:
             Z = flatten_method(Z, axis=tuple(rel_flat_idxs))
@@ -725,7 +1124,7 @@ class GridSearch(BaseSearchClass):
                 cb.set_label(self.tex_labels[self.detstat])
 
         if add_mismatch:
-            self.add_mismatch_to_ax(ax, x, y, xkey, ykey, *add_mismatch)
+            self._add_mismatch_to_ax(ax, x, y, xkey, ykey, *add_mismatch)
 
         if x[-1] > x[0]:
             ax.set_xlim(x[0] * xrescale, x[-1] * xrescale)
@@ -761,6 +1160,34 @@ class GridSearch(BaseSearchClass):
         else:
             return ax
 
+    def get_top_k(self, k, stat=None):
+        """Get the k loudest grid points by a detection statistic.
+
+        This requires the `run()` method to have been called before.
+        Selecting the candidates with `np.argpartition` scales linearly
+        with the grid size, only the k candidates themselves are sorted.
+
+        Parameters
+        ----------
+        k: int
+            Number of candidates to return
+            (all points if the grid is smaller than that).
+        stat: str or None
+            Name of the statistic column to rank by.
+            If None, `self.detstat` is used.
+
+        Returns
+        -------
+        cands: list
+            List of dictionaries, sorted by decreasing `stat`,
+            each containing parameters and all output quantities of one point.
+        """
+        arr = self.data[stat or self.detstat]
+        k = min(k, len(arr))
+        idx = np.argpartition(arr, len(arr) - k)[len(arr) - k :]
+        idx = idx[np.lexsort((idx, -arr[idx]))]
+        return [{key: row[key] for key in self.output_keys} for row in self.data[idx]]
+
     def get_max_det_stat(self):
         """Get the maximum detection statistic over the grid.
 
@@ -771,9 +1198,7 @@ class GridSearch(BaseSearchClass):
         d: dict
             Dictionary containing parameters and detection statistic at the maximum.
         """
-        idx = np.argmax(self.data[self.detstat])
-        d = {key: self.data[key][idx] for key in self.output_keys}
-        return d
+        return self.get_top_k(1, self.detstat)[0]
 
     def get_max_twoF(self):
         """Get the maximum twoF over the grid.
@@ -785,9 +1210,7 @@ class GridSearch(BaseSearchClass):
         d: dict
             Dictionary containing parameters and twoF value at the maximum.
         """
-        idx = np.argmax(self.data["twoF"])
-        d = {key: self.data[key][idx] for key in self.output_keys}
-        return d
+        return self.get_top_k(1, "twoF")[0]
 
     def print_max_twoF(self):
         """Get and print the maximum twoF point over the grid.
@@ -904,6 +1327,15 @@ class TransientGridSearch(GridSearch):
     only the additional ones are documented here:
     """
 
+    batch_size = 1024
+    """Number of grid points per batch (each still computed one by one)."""
+
+    det_stat_cache_size = 100000
+    """Maximum number of per-point results kept for reuse at duplicate points
+    within a single `run()`."""
+
+    _tCW_fmt_keys = ["F0", "Alpha", "Delta", "F1", "F2"]
+
     @utils.initializer
     def __init__(
         self,
@@ -979,6 +1411,7 @@ class TransientGridSearch(GridSearch):
             Choose between implementations of the transient F-statistic functionality:
             standard `lal` implementation,
             `pycuda` for GPU version,
+            `numba` for a compiled CPU version,
             and some others only for devel/debug.
         cudaDeviceName: str
             GPU name to be matched against drv.Device output,
@@ -1003,7 +1436,7 @@ class TransientGridSearch(GridSearch):
         logger.info(f"Detection statistic set to {self.detstat}.")
         self._initiate_search_object()
         self._set_output_keys()
-        self.output_file_header = self.get_output_file_header()
+        self._det_stat_cache = {}
         if self.outputTransientFstatMap:
             self.tCWfilebase = os.path.splitext(self.out_file)[0] + "_tCW_"
             logger.info(
@@ -1021,25 +1454,44 @@ class TransientGridSearch(GridSearch):
         self.search.__exit__(*args, **kwargs)
 
     def _set_output_keys(self):
+        # features of this search that are fixed from here on,
+        # so that they need not be checked again at every grid point
+        self._has_singleFstats = bool(self.search.singleFstats)
+        self._has_twoFXatMaxTwoF = hasattr(self.search, "twoFXatMaxTwoF")
+        self._has_detstat_column = self.detstat not in ["twoF", "maxTwoF"]
+        self._has_FstatMap = bool(self.transientWindowType)
         self.output_keys = self.search_keys.copy()
         self.output_keys.append("twoF")
-        if self.search.singleFstats:
-            self.output_keys += [f"twoF{IFO}" for IFO in self.search.detector_names]
-        if self.transientWindowType:
+        # per-detector keys, ordered like the twoFX arrays of the search object
+        self._twoFX_keys = [f"twoF{IFO}" for IFO in self.search.detector_names]
+        self._twoFXatMaxTwoF_keys = [
+            f"twoF{IFO}atMaxTwoF" for IFO in self.search.detector_names
+        ]
+        if self._has_singleFstats:
+            self.output_keys += self._twoFX_keys
+        if self._has_FstatMap:
             self.output_keys.append("maxTwoF")
-        if hasattr(self.search, "twoFXatMaxTwoF"):
-            self.output_keys += [
-                f"twoF{IFO}atMaxTwoF" for IFO in self.search.detector_names
-            ]
-        if self.detstat not in ["twoF", "maxTwoF"]:
+        if self._has_twoFXatMaxTwoF:
+            self.output_keys += self._twoFXatMaxTwoF_keys
+        if self._has_detstat_column:
             self.output_keys.append(self.detstat)
-        if self.transientWindowType:
+        if self._has_FstatMap:
             # for consistency, t0/tau must come after detstat
             # they are not included in self.search_keys because the main Fstat
             # code does not loop over them
             self.output_keys += ["t0_ML", "tau_ML"]
             if self.BtSG:
                 self.output_keys += ["t0_MP", "tau_MP"]
+        # positions of the filename parameters in unnamed parameter points
+        self._tCW_fmt_key_indices = [
+            self.output_keys.index(key) for key in self._tCW_fmt_keys
+        ]
+        # per-point dicts, reused across grid points
+        # since every value is overwritten at each point;
+        # the search parameters are kept separate
+        # because get_det_stat() does not accept the output keys
+        self._cand_params = dict.fromkeys(self.search_keys)
+        self._thisCand = dict.fromkeys(self.output_keys)
 
     def _initiate_search_object(self):
         logger.info("Setting up search object")
@@ -1077,45 +1529,105 @@ class TransientGridSearch(GridSearch):
         self.minStartTime = self.search.minStartTime
         self.maxStartTime = self.search.maxStartTime
 
-    def _get_single_cand_results(self, data, n, vals):
-        """Obtain the results at each grid iteration step.
+    def _get_output_dtype(self):
+        """Get the structured dtype of the inputs+outputs data array.
+
+        All columns are in double precision,
+        as the transient window outputs include GPS times.
+        """
+        return np.dtype(
+            {
+                "names": self.output_keys,
+                "formats": np.repeat(float, len(self.output_keys)),
+            }
+        )
+
+    def _get_batch_points(self, idxs):
+        """Get the grid points needed by `_get_batch_results()` at rows `idxs`."""
+        return self._get_grid_points(idxs)
+
+    def _get_batch_results(self, idxs, vals=None):
+        """Obtain the results for a batch of grid points.
+
+        The grid points are looked up for the whole batch at once,
+        but the transient F-stat maps and their by-products
+        still have to be computed point by point.
+        This is also where any per-point atoms files are written.
+
+        Parameters
+        ----------
+        idxs: np.ndarray
+            Row indices of the grid points in the full data array.
+        vals: dict or None
+            The grid points at `idxs`, as from `_get_batch_points()`;
+            looked up here if None.
+
+        Returns
+        -------
+        data: np.ndarray
+            The inputs+outputs data set for these points, ordered like `idxs`.
+        """
+        if vals is None:
+            vals = self._get_batch_points(idxs)
+        # plain python floats are much cheaper to iterate over and pass on
+        # than numpy scalars
+        points = zip(*[vals[key].tolist() for key in self.search_keys])
+        rows = []
+        for point in points:
+            # exact duplicate points within one run reuse their results,
+            # and files, from the first time
+            row = self._det_stat_cache.get(point)
+            if row is None:
+                row = self._get_single_cand_row(point)
+                if len(self._det_stat_cache) >= self.det_stat_cache_size:
+                    self._det_stat_cache.pop(next(iter(self._det_stat_cache)))
+                self._det_stat_cache[point] = row
+                if self.outputAtoms:
+                    self.search.write_atoms_to_file(os.path.splitext(self.out_file)[0])
+            rows.append(row)
+        # pack all rows into the structured array at once
+        return np.array(rows, dtype=self._get_output_dtype())
+
+    def _get_single_cand_row(self, vals):
+        """Obtain the results at a single grid point.
 
         Re-formats the input params into the format required by self.search.get_det_stat()
         and gets additional detection statistic by-products as needed,
-        then stores them all into the right columns of the data array.
+        then collects them all in the order of the output columns.
 
         We override the default method here to get the extra transient output values.
 
         Parameters
         ----------
-        data: np.ndarray
-            The inputs+outputs data set to be updated.
-        n: int
-            Row index of the data array to update.
         vals: tuple
-            Iteration of our iterable.
+            The search parameter values at this point,
+            ordered like `self.search_keys`.
 
         Returns
         -------
-        data: np.ndarray
-            The updated inputs+outputs data set.
+        row: tuple
+            The inputs+outputs values at this point,
+            ordered like `self.output_keys`.
         """
-        thisCand = {key: val for key, val in zip(self.search_keys, vals)}
-        detstat = self.search.get_det_stat(params=thisCand)
+        params = self._cand_params
+        params.update(zip(self.search_keys, vals))
+        detstat = self.search.get_det_stat(params=params)
+        thisCand = self._thisCand
+        thisCand.update(params)
         windowRange = getattr(self.search, "windowRange", None)
         self.timingFstatMap += getattr(self.search, "timingFstatMap", 0.0)
         thisCand["twoF"] = self.search.twoF
-        if self.search.singleFstats:
-            for X, IFO in enumerate(self.search.detector_names):
-                thisCand[f"twoF{IFO}"] = self.search.twoFX[X]
+        if self._has_singleFstats:
+            thisCand.update(zip(self._twoFX_keys, self.search.twoFX))
         if windowRange is not None:
             thisCand["maxTwoF"] = self.search.maxTwoF
-            if hasattr(self.search, "twoFXatMaxTwoF"):
-                for X, IFO in enumerate(self.search.detector_names):
-                    thisCand[f"twoF{IFO}atMaxTwoF"] = self.search.twoFXatMaxTwoF[X]
-        if self.detstat not in ["twoF", "maxTwoF"]:
+            if self._has_twoFXatMaxTwoF:
+                thisCand.update(
+                    zip(self._twoFXatMaxTwoF_keys, self.search.twoFXatMaxTwoF)
+                )
+        if self._has_detstat_column:
             thisCand[self.detstat] = detstat
-        if getattr(self, "transientWindowType", None):
+        if self._has_FstatMap:
             if not hasattr(self.search, "FstatMap"):  # pragma: no cover
                 raise RuntimeError(
                     "Since transientWindowType!=None, we expected to have a FstatMap."
@@ -1125,26 +1637,25 @@ class TransientGridSearch(GridSearch):
                 self.search.FstatMap.write_F_mn_to_file(
                     tCWfile, windowRange, self.output_file_header
                 )
-            maxidx = self.search.FstatMap.get_maxF_idx()
-            thisCand["t0_ML"] = windowRange.t0 + maxidx[0] * windowRange.dt0
-            thisCand["tau_ML"] = windowRange.tau + maxidx[1] * windowRange.dtau
+            # the ML estimates are already set when computing the map,
+            # so there is no need for another argmax over it
+            thisCand["t0_ML"] = self.search.FstatMap.t0_ML
+            thisCand["tau_ML"] = self.search.FstatMap.tau_ML
             if self.BtSG:
                 thisCand["t0_MP"] = self.search.FstatMap.t0_MP
                 thisCand["tau_MP"] = self.search.FstatMap.tau_MP
 
-        for key in self.output_keys:
-            if key in thisCand.keys():
-                data[key][n] = thisCand[key]
-            else:  # pragma: no cover
-                raise RuntimeError(
-                    f"Could not get value for key {key} from candidate dict {thisCand}."
-                )
-        return data
+        try:
+            return tuple(thisCand[key] for key in self.output_keys)
+        except KeyError as e:  # pragma: no cover
+            raise RuntimeError(
+                f"Could not get value for key {e} from candidate dict {thisCand}."
+            )
 
     def run(self, return_data=False):
         """Execute the actual search over the full grid.
 
-        This iterates over all points in the multi-dimensional product grid
+        This iterates over batches of points in the multi-dimensional product grid
         and the end result is either returned as a numpy array or saved to disk.
 
         If the `outputTransientFstatMap` or `outputAtoms` options have been set
@@ -1170,23 +1681,18 @@ class TransientGridSearch(GridSearch):
             self.data = old_data
             return
 
-        output_dtype = np.dtype(
-            {
-                "names": self.output_keys,
-                "formats": np.repeat(float, len(self.output_keys)),
-            }
-        )
-        data = np.zeros(len(self.input_data), dtype=output_dtype)
+        # only reuse results (and files) at duplicate points within this run,
+        # so that e.g. clean reruns really recompute and overwrite everything
+        self._det_stat_cache = {}
+        data = np.empty(self.total_iterations, dtype=self._get_output_dtype())
         self.timingFstatMap = 0.0
         logger.info(
             "Running search over a total of {:d} grid points...".format(
-                np.shape(self.input_data)[0]
+                self.total_iterations
             )
         )
-        for n, vals in enumerate(tqdm(self.input_data)):
-            data = self._get_single_cand_results(data, n, vals)
-            if self.outputAtoms:
-                self.search.write_atoms_to_file(os.path.splitext(self.out_file)[0])
+        for idxs in tqdm(self._get_batches()):
+            data[idxs] = self._get_batch_results(idxs)
 
         logger.info(
             "Total time spent computing transient F-stat maps: {:.2f}s".format(
@@ -1217,14 +1723,11 @@ class TransientGridSearch(GridSearch):
         f: str
             The constructed filename.
         """
-        fmt_keys = ["F0", "Alpha", "Delta", "F1", "F2"]
         fmt = "{:.16g}_{:.16g}_{:.16g}_{:.16g}_{:.16g}"
-        if isinstance(param_point, tuple) or isinstance(param_point, np.void):
-            param_point = list(param_point)
         if isinstance(param_point, dict):
-            vals = [param_point[key] for key in fmt_keys]
-        elif isinstance(param_point, list) or isinstance(param_point, np.ndarray):
-            vals = [param_point[self.output_keys.index(key)] for key in fmt_keys]
+            vals = [param_point[key] for key in self._tCW_fmt_keys]
+        elif isinstance(param_point, (tuple, list, np.void, np.ndarray)):
+            vals = [param_point[i] for i in self._tCW_fmt_key_indices]
         else:
             raise ValueError("param_point must be a dict, list, tuple or numpy array!")
         f = self.tCWfilebase + fmt.format(*vals) + ".dat"
@@ -1347,7 +1850,7 @@ class SearchOverGridFile(TransientGridSearch):
         logger.info(f"Detection statistic set to {self.detstat}.")
         self._initiate_search_object()
         self._set_output_keys()
-        self.output_file_header = self.get_output_file_header()
+        self._det_stat_cache = {}
         if self.outputTransientFstatMap:
             self.tCWfilebase = os.path.splitext(self.out_file)[0] + "_tCW_"
             logger.info(
@@ -1401,9 +1904,11 @@ class SearchOverGridFile(TransientGridSearch):
             for col, dtype in zip(pd_grid.columns, pd_grid.dtypes)
         ]
         try:
-            self.grid = np.array(
-                list(pd_grid.itertuples(index=False, name=None)), dtype=numpy_dtypes
-            )
+            # fill each column straight from the DataFrame's buffers
+            # instead of going through a list of row tuples
+            self.grid = np.empty(len(pd_grid), dtype=numpy_dtypes)
+            for col, _ in numpy_dtypes:
+                self.grid[col] = pd_grid[col].to_numpy(copy=False)
         except Exception as e:  # pragma: no cover
             raise TypeError(f"Failed to convert pandas DataFrame to NumPy array: {e}")
         if len(pd_grid) == 0:  # pragma: no cover
@@ -1415,18 +1920,24 @@ class SearchOverGridFile(TransientGridSearch):
         logger.info(self.grid.dtype)
 
     def _read_grid_with_numpy(self):
+        """Use numpy's C-backed `np.loadtxt()` parser.
+
+        The column names are taken from the last `%%` header line,
+        as `np.genfromtxt(..., names=True)` would do,
+        but the much faster `np.loadtxt()` is used for the data.
+        """
         logger.info(f"Loading grid from file using NumPy backend: {self.gridfile}")
-        nhead = 0
+        names = []
         with open(self.gridfile, "r") as fp:
             for line in fp:
                 if not line.startswith("%%"):
                     break
-                nhead += 1
-        self.grid = np.genfromtxt(
+                names = line.lstrip("%").split()
+        self.grid = np.loadtxt(
             self.gridfile,
             comments="%",
-            skip_header=nhead - 1,
-            names=True,
+            dtype=np.dtype({"names": names, "formats": [float] * len(names)}),
+            ndmin=1,
         )
         if len(self.grid) == 0:  # pragma: no cover
             raise IOError("Got 0-length grid.")
@@ -1461,29 +1972,17 @@ class SearchOverGridFile(TransientGridSearch):
         translated: list
             Copy of "keylist" with new keys according to PyFstat convention.
         """
-
-        translation = {
-            "freq": "F0",
-            "alpha": "Alpha",
-            "delta": "Delta",
-        }
-        translation.update(
-            {f"f{k + 1}dot": f"F{k + 1}" for k in range(lalpulsar.PULSAR_MAX_SPINS - 1)}
-        )
-
-        translated = [
-            translation[key] if key in translation.keys() else key for key in keylist
-        ]
-
-        return translated
+        return [_CFSV2_KEY_TRANSLATION.get(key, key) for key in keylist]
 
     def _get_search_ranges(self):
         logger.info("Getting search ranges...")
         if (self.minCoverFreq is None) or (self.maxCoverFreq is None):
-            minmaxdict = {
-                key: [np.min(self.grid[key]), np.max(self.grid[key])]
-                for key in self.search_keys
-            }
+            minmaxdict = {}
+            for key in self.search_keys:
+                # one strided pass over the structured array,
+                # then both reductions run over contiguous memory
+                column = np.ascontiguousarray(self.grid[key])
+                minmaxdict[key] = [column.min(), column.max()]
             logger.info(f"Search ranges span: {minmaxdict}")
             return minmaxdict
         else:
@@ -1499,8 +1998,20 @@ class SearchOverGridFile(TransientGridSearch):
         logger.info("Generating input data array from loaded grid.")
         self.coord_arrays = self.grid
         self.total_iterations = len(self.grid)
-        if not self.clean:
-            self.input_data = self.grid
+        self.input_data = self.grid
+        self._active_axes = self.search_keys
+        self._frozen = {}
+
+    def _get_batches(self):
+        """Split the loaded grid into contiguous batches of row indices."""
+        return [
+            np.arange(start, min(start + self.batch_size, self.total_iterations))
+            for start in range(0, self.total_iterations, self.batch_size)
+        ]
+
+    def _get_grid_points(self, idxs):
+        """Get the parameter values at rows `idxs` of the loaded grid."""
+        return {key: self.grid[key][idxs] for key in self.search_keys}
 
 
 class SliceGridSearch(DefunctClass):
@@ -1522,6 +2033,9 @@ class GridGlitchSearch(GridSearch):
     This class currently only works for a single glitch in the observing time.
     """
 
+    batch_size = 256
+    """Number of grid points per batch, kept small to share out over pools."""
+
     @utils.initializer
     def __init__(
         self,
@@ -1583,7 +2097,6 @@ class GridGlitchSearch(GridSearch):
         self.detstat = "twoF"
         self._initiate_search_object()
         self._set_output_keys()
-        self.output_file_header = self.get_output_file_header()
 
     def _initiate_search_object(self):
         logger.info("Setting up search object")
@@ -1615,27 +2128,54 @@ class GridGlitchSearch(GridSearch):
         fmt_dict[self.detstat] = self.fmt_detstat
         return fmt_dict
 
-    def _get_single_cand_results(self, data, n, vals):
-        """Obtain the results at each grid iteration step.
+    def _get_batch_points(self, idxs):
+        """Get the grid points needed by `_get_batch_results()` at rows `idxs`."""
+        return self._get_grid_points(idxs)
+
+    def _get_batch_results(self, idxs, vals=None):
+        """Obtain the results for a batch of grid points, one at a time.
 
         FIXME: currently we need to override the default method here
         because the SemiCoherentGlitchSearch.get_semicoherent_nglitch_twoF()
         is not yet ported to the new parameter dictionary style
-        of other detection statistics methods.
+        of other detection statistics methods,
+        and has no batched version.
 
         Parameters
         ----------
+        idxs: np.ndarray
+            Row indices of the grid points in the full data array.
+        vals: dict or None
+            The grid points at `idxs`, as from `_get_batch_points()`;
+            looked up here if None.
+
+        Returns
+        -------
         data: np.ndarray
-            The inputs+outputs data set to be updated.
-        n: int
-            Row index of the data array to update.
+            The inputs+outputs data set for these points, ordered like `idxs`.
+        """
+        if vals is None:
+            vals = self._get_batch_points(idxs)
+        rows = [
+            self._get_single_cand_row(point)
+            for point in zip(*[vals[key].tolist() for key in self.search_keys])
+        ]
+        return np.array(rows, dtype=self._get_output_dtype())
+
+    def _get_single_cand_row(self, vals):
+        """Obtain the results at a single grid point.
+
+        Parameters
+        ----------
         vals: tuple
-            Iteration of our iterable.
+            The search parameter values at this point,
+            ordered like `self.search_keys`.
 
         Returns
         -------
-        data: np.ndarray
-            The updated inputs+outputs data set.
+        row: tuple
+            The inputs+outputs values at this point,
+            ordered like `self.output_keys`.
         """
         thisCand = list(vals)
         detstat = self.search.get_det_stat(*vals)
@@ -1644,9 +2184,7 @@ class GridGlitchSearch(GridSearch):
             thisCand += list(self.search.twoFX[: self.search.numDetectors])
         if self.detstat != "twoF":
             thisCand.append(detstat)
-        for k, key in enumerate(self.output_keys):
-            data[key][n] = thisCand[k]
-        return data
+        return tuple(thisCand)
 
 
 class SlidingWindow(DefunctClass):
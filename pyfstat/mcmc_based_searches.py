@@ -47,6 +47,7 @@ import copy
 import logging
 import os
 import sys
+import uuid
 from collections import OrderedDict
 
 import corner
@@ -60,7 +61,6 @@ if ptemcee.__version__ == "1.0.0":
     # This is a very ugly hack to support numpy>=1.24
     ptemcee.sampler.np.float = float
 from ptemcee import Sampler as PTSampler
-from scipy.stats import lognorm
 from tqdm import tqdm
 
 import pyfstat.core as core
@@ -70,6 +70,40 @@ from pyfstat.core import BaseSearchClass
 
 logger = logging.getLogger(__name__)
 
+# Search objects set up inside pool worker processes,
+# keyed by a token unique to each search object in the main process,
+# so that each worker only has to load the data once
+# (see MCMCSearch.__setstate__).
+_pool_worker_search_objects = {}
+
+
+class _BatchedPTSampler(PTSampler):
+    """ptemcee sampler evaluating all proposals of a move in a single call.
+
+    ptemcee itself maps the likelihood and prior over points one by one;
+    here all points of an evaluation are instead handed
+    to ``evaluate_batch`` as one ``(npoints, ndim)`` array,
+    which must return flat arrays of log-likelihood and log-prior values.
+
+    The stretch move of ptemcee updates the two halves of the ensemble
+    in turn, each against the current positions of the other half,
+    so that each iteration costs only ``ntemps*nwalkers`` evaluations
+    in two batches of ``npoints=ntemps*nwalkers/2``.
+    Only the initial positions are evaluated as a single full batch.
+    Temperature swaps are left to ptemcee,
+    which already vectorizes them over the walkers of each pair
+    of adjacent temperatures and reuses the stored likelihood values,
+    so they need no further likelihood evaluations.
+    """
+
+    def __init__(self, *args, evaluate_batch, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._evaluate_batch = evaluate_batch
+
+    def _evaluate(self, ps):
+        logl, logp = self._evaluate_batch(ps.reshape((-1, self.dim)))
+        return logl.reshape((self.ntemps, -1)), logp.reshape((self.ntemps, -1))
+
 
 class MCMCSearch(BaseSearchClass):
     """
@@ -86,6 +120,14 @@ class MCMCSearch(BaseSearchClass):
         `unit` by which to transform by and update the units.
     """
 
+    logl_cache_size = 0
+    """
+        Maximum number of likelihood values kept for reuse
+        (only for classes that define a `_logl_cache_key()`).
+        Disabled by default, as the keys are exact points
+        and hence only repeat if all Doppler parameters are fixed.
+    """
+
     def __init__(
         self,
         theta_prior,
@@ -117,6 +159,7 @@ class MCMCSearch(BaseSearchClass):
         sun_ephem=None,
         allowedMismatchFromSFTLength=None,
         clean=False,
+        pool=None,
     ):
         """
         Parameters
@@ -185,13 +228,20 @@ class MCMCSearch(BaseSearchClass):
             Currently only supported for nsegs=1.
         tCWFstatMapVersion: str
             Choose between standard 'lal' implementation,
-            'pycuda' for gpu, and some others for devel/debug.
+            'pycuda' for gpu, 'numba' for a compiled CPU version,
+            and some others for devel/debug.
         allowedMismatchFromSFTLength: float
             Maximum allowed mismatch from SFTs being too long
             [Default: what's hardcoded in XLALFstatMaximumSFTLength].
         clean: bool
             If true, ignore existing data and overwrite.
             Otherwise, reuse existing data if no inconsistencies are found.
+        pool: object, optional
+            A pool object with a `map` method
+            (e.g. `multiprocessing.Pool` or `schwimmbad.MPIPool`)
+            used to evaluate the likelihood of all walkers in parallel.
+            Each worker process sets up its own search object
+            on first use.
         """
         self._set_init_params_dict(locals())
         self.theta_prior = theta_prior
@@ -222,6 +272,7 @@ class MCMCSearch(BaseSearchClass):
         self.set_ephemeris_files(earth_ephem, sun_ephem)
         self.allowedMismatchFromSFTLength = allowedMismatchFromSFTLength
         self.clean = clean
+        self.pool = pool
 
         os.makedirs(outdir, exist_ok=True)
         self.output_file_header = self.get_output_file_header()
@@ -337,6 +388,61 @@ class MCMCSearch(BaseSearchClass):
         if self.maxStartTime is None:
             self.maxStartTime = self.search.maxStartTime
 
+    def __getstate__(self):
+        """Drop members that cannot be sent to pool worker processes."""
+        state = self.__dict__.copy()
+        for key in ["search", "sampler", "pool", "_logl_cache"]:
+            state.pop(key, None)
+        search = getattr(self, "search", None)
+        if search is not None:
+            # a new search object (e.g. for new data, settings or nsegs)
+            # gets a new token, so workers never reuse a stale one
+            if getattr(search, "_pool_token", None) is None:
+                search._pool_token = uuid.uuid4().hex
+            state["_pool_token"] = search._pool_token
+        if "init_params_dict" in state:
+            state["init_params_dict"] = {
+                key: val
+                for key, val in state["init_params_dict"].items()
+                if key != "pool"
+            }
+        return state
+
+    def __setstate__(self, state):
+        """Restore state and attach a search object owned by this process."""
+        self.__dict__.update(state)
+        self.pool = None
+        token = state.get("_pool_token")
+        if token is None:
+            self._initiate_search_object()
+            return
+        if token not in _pool_worker_search_objects:
+            self._initiate_search_object()
+            # only the current search object is needed from now on
+            _pool_worker_search_objects.clear()
+            _pool_worker_search_objects[token] = self.search
+        self.search = _pool_worker_search_objects[token]
+
+    def _get_sampler_log_functions(self):
+        """Likelihood and prior functions with arguments, as passed to PTSampler.
+
+        The actual evaluation is done for all walkers at once
+        through `_evaluate_batch`;
+        the per-point functions only serve to set up the sampler.
+        """
+        return dict(
+            logl=self._logl_with_own_search,
+            logp=self._logp_with_own_search,
+            logpargs=(self.theta_prior, self.theta_keys),
+            evaluate_batch=self._evaluate_batch,
+        )
+
+    def _logl_with_own_search(self, theta):
+        return self._logl(theta, self.search)
+
+    def _logp_with_own_search(self, theta_vals, theta_prior, theta_keys):
+        return self._logp(theta_vals, theta_prior, theta_keys, self.search)
+
     def _logp(self, theta_vals, theta_prior, theta_keys, search):
         H = [
             self._generic_lnprior(**theta_prior[key])(p)
@@ -344,6 +450,94 @@ class MCMCSearch(BaseSearchClass):
         ]
         return np.sum(H)
 
+    def _logp_batch(self, ps):
+        """Log-prior for an array of points of shape `(npoints, ndim)`.
+
+        Each prior is evaluated once over the full column of its parameter.
+        """
+        H = [
+            self._generic_lnprior(**self.theta_prior[key])(ps[:, j])
+            for j, key in enumerate(self.theta_keys)
+        ]
+        return np.sum(H, axis=0)
+
+    def _evaluate_batch(self, ps):
+        """Log-likelihood and log-prior for an array of points.
+
+        The prior is computed for all points first,
+        and the likelihood is then only evaluated at points in its support
+        (set to 0 elsewhere, as in ptemcee),
+        distributed over `self.pool` if given.
+
+        Parameters
+        ----------
+        ps: np.ndarray
+            Sampled (variable) parameters of shape `(npoints, ndim)`.
+        Returns
+        -------
+        logl, logp: np.ndarray
+            Log-likelihood and log-prior values of shape `(npoints,)`.
+        """
+        ps = np.atleast_2d(ps)
+        logp = self._logp_batch(ps)
+        if np.any(np.isnan(logp)):
+            raise ValueError("Prior function returned NaN.")
+        logl = np.zeros(len(ps))
+        support = logp > -np.inf
+        if np.any(support):
+            logl[support] = self._evaluate_logl_with_cache(ps[support])
+        if np.any(np.isnan(logl)):
+            raise ValueError("Log likelihood function returned NaN.")
+        return logl, logp
+
+    def _logl_cache_key(self, theta):
+        """Hashable key identifying the likelihood value at theta.
+
+        Points with equal keys are assumed to have the same likelihood,
+        so that it only needs to be computed once.
+        Returns None if the value at theta should not be cached,
+        which is the default for this class.
+        """
+        return None
+
+    def _evaluate_logl_with_cache(self, ps):
+        """Log-likelihood for an array of points, reusing earlier results.
+
+        Values with a `_logl_cache_key()` are kept in a first-in-first-out
+        cache of up to `logl_cache_size` entries.
+        Only the remaining points are evaluated, distributed over `self.pool`
+        if given.
+        Cache statistics are kept in `logl_cache_hits` and `logl_cache_calls`.
+        If `logl_cache_size` is 0, no keys are computed at all.
+        """
+        if not hasattr(self, "_logl_cache"):
+            self._logl_cache = {}
+            self.logl_cache_hits = 0
+            self.logl_cache_calls = 0
+        mapf = map if self.pool is None else self.pool.map
+        if self.logl_cache_size <= 0:
+            return np.fromiter(
+                mapf(self._logl_with_own_search, ps), dtype=float, count=len(ps)
+            )
+        keys = [self._logl_cache_key(p) for p in ps]
+        logl = np.zeros(len(ps))
+        todo = []
+        for n, key in enumerate(keys):
+            if key is not None and key in self._logl_cache:
+                logl[n] = self._logl_cache[key]
+            else:
+                todo.append(n)
+        self.logl_cache_calls += sum(key is not None for key in keys)
+        self.logl_cache_hits += len(ps) - len(todo)
+        if len(todo) > 0:
+            logl[todo] = list(mapf(self._logl_with_own_search, ps[todo]))
+        for n in todo:
+            if keys[n] is not None:
+                self._logl_cache[keys[n]] = logl[n]
+        while len(self._logl_cache) > self.logl_cache_size:
+            del self._logl_cache[next(iter(self._logl_cache))]
+        return logl
+
     def _set_point_for_evaluation(self, theta):
         """Combines fixed and variable parameters to form a valid evaluation point.
 
@@ -408,13 +602,7 @@ class MCMCSearch(BaseSearchClass):
             self.output_keys.append("log10BSGL")
 
     def _evaluate_logpost(self, p0vec):
-        init_logp = np.array(
-            [
-                self._logp(p, self.theta_prior, self.theta_keys, self.search)
-                for p in p0vec
-            ]
-        )
-        init_logl = np.array([self._logl(p, self.search) for p in p0vec])
+        init_logl, init_logp = self._evaluate_batch(p0vec)
         return init_logl + init_logp
 
     def _check_initial_points(self, p0):
@@ -478,11 +666,19 @@ class MCMCSearch(BaseSearchClass):
         self.nsteps = [nburn0] + self.nsteps
         self.scatter_val = scatter_val
 
-    def _run_sampler(self, p0, nprod=0, nburn=0, window=50):
-        for result in tqdm(
-            self.sampler.sample(p0, iterations=nburn + nprod), total=nburn + nprod
-        ):
-            pass
+    def _run_sampler(self, p0, nprod=0, nburn=0, window=50, adapt=False):
+        # the temperature ladder is only adapted during burn-in,
+        # so that production samples are drawn with fixed betas
+        # (the hottest and coldest temperatures always stay fixed)
+        nadapt = nburn if (adapt and self.ntemps > 2) else 0
+        with tqdm(total=nburn + nprod) as pbar:
+            if nadapt > 0:
+                for result in self.sampler.sample(p0, iterations=nadapt, adapt=True):
+                    pbar.update()
+                # continue from the current sampler state
+                p0 = None
+            for result in self.sampler.sample(p0, iterations=nburn + nprod - nadapt):
+                pbar.update()
 
         self.mean_acceptance_fraction = np.mean(
             self.sampler.acceptance_fraction, axis=1
@@ -497,6 +693,10 @@ class MCMCSearch(BaseSearchClass):
                     self.sampler.tswap_acceptance_fraction
                 )
             )
+        if nadapt > 0:
+            self.betas = self.sampler.betas.copy()
+            self.beta_history = self.sampler.beta_history
+            logger.info("Adapted betas: {}".format(self.betas))
         self.autocorr_time = self._get_autocorr_time(
             sampler=self.sampler, window=window
         )
@@ -603,10 +803,14 @@ class MCMCSearch(BaseSearchClass):
             n = x.shape[axis]
 
         # Compute the FFT and then (from that) the auto-correlation function.
-        f = np.fft.fft(x - np.mean(x, axis=axis), n=2 * n, axis=axis)
+        # The input is real, so the half-spectrum FFT is enough.
+        f = np.fft.rfft(x - np.mean(x, axis=axis), n=2 * n, axis=axis)
         m[axis] = slice(0, n)
         m_tuple = tuple(m)  # fix for numpy>=1.23.0
-        acf = np.fft.ifft(f * np.conjugate(f), axis=axis)[m_tuple].real
+        # power spectrum from a single pass over the complex FFT, squared in place
+        power = np.abs(f)
+        power *= power
+        acf = np.fft.irfft(power, n=2 * n, axis=axis)[m_tuple]
         m[axis] = 0
         m_tuple = tuple(m)  # fix for numpy>=1.23.0
         return acf / acf[m_tuple]
@@ -665,6 +869,9 @@ class MCMCSearch(BaseSearchClass):
         plot_walkers=True,
         walker_plot_args=None,
         window=50,
+        adapt_betas=False,
+        adaptation_lag=None,
+        adaptation_time=100,
     ):
         """Run the MCMC simulation
 
@@ -698,6 +905,18 @@ class MCMCSearch(BaseSearchClass):
             The minimum number of autocorrelation times needed to trust the
             result when estimating the autocorrelation time (see
             ptemcee.Sampler.get_autocorr_time for further details.
+        adapt_betas: bool
+            If true (and `ntemps>2`), adapt the temperature ladder during the
+            burn-in stage(s) to equalise the swap acceptance ratios between
+            adjacent temperatures, following Vousden et al (MNRAS 455 1919, 2016):
+            https://arxiv.org/abs/1501.05823.
+            The hottest and coldest temperatures are kept fixed.
+            The production stage then uses the final adapted betas.
+        adaptation_lag: int
+            Time-scale (in steps) over which the ladder adjustments decay.
+            Defaults to half the number of steps of the first stage.
+        adaptation_time: int
+            Time-scale of the ladder dynamics, see `ptemcee.Sampler`.
 
         """
 
@@ -718,16 +937,15 @@ class MCMCSearch(BaseSearchClass):
 
         walker_plot_args = walker_plot_args or {}
 
-        self.sampler = PTSampler(
+        self.sampler = _BatchedPTSampler(
             ntemps=self.ntemps,
             nwalkers=self.nwalkers,
             dim=self.ndim,
-            logl=self._logl,
-            logp=self._logp,
-            logpargs=(self.theta_prior, self.theta_keys, self.search),
-            loglargs=(self.search,),
+            **self._get_sampler_log_functions(),
             betas=self.betas,
             a=proposal_scale_factor,
+            adaptation_lag=adaptation_lag or max(self.nsteps[0] // 2, 1),
+            adaptation_time=adaptation_time,
         )
 
         p0 = self._generate_initial_p0()
@@ -740,7 +958,7 @@ class MCMCSearch(BaseSearchClass):
             logger.info(
                 "Running {}/{} initialisation with {} steps".format(j, ninit_steps, n)
             )
-            self._run_sampler(p0, nburn=n, window=window)
+            self._run_sampler(p0, nburn=n, window=window, adapt=adapt_betas)
             if plot_walkers:
                 # For now, this plot will always be saved to disk,
                 # never returned as fig/axes.
@@ -771,7 +989,7 @@ class MCMCSearch(BaseSearchClass):
             nburn = 0
         nprod = self.nsteps[-1]
         logger.info("Running final burn and prod with {} steps".format(nburn + nprod))
-        self._run_sampler(p0, nburn=nburn, nprod=nprod)
+        self._run_sampler(p0, nburn=nburn, nprod=nprod, adapt=adapt_betas)
 
         samples = self.sampler.chain[0, :, nburn:, :].reshape((-1, self.ndim))
         lnprobs = self.sampler.logprobability[0, :, nburn:].reshape((-1))
@@ -912,6 +1130,7 @@ class MCMCSearch(BaseSearchClass):
         tglitch_ratio=False,
         fig_and_axes=None,
         save_fig=True,
+        thin=None,
         **kwargs,
     ):
         """Generate a corner plot of the posterior
@@ -946,6 +1165,11 @@ class MCMCSearch(BaseSearchClass):
             namely (ndim, ndim)
         save_fig: bool
             If true, save the figure, else return the fig, axes.
+        thin: int or None
+            Only plot every `thin`-th production sample of each walker.
+            If None, use half the largest integrated autocorrelation time
+            of the production samples (see `get_thinned_samples()`).
+            Use `thin=1` to plot all samples.
         **kwargs:
             Passed to corner.corner. Use "truths" to plot the true parameters of a signal.
 
@@ -982,7 +1206,7 @@ class MCMCSearch(BaseSearchClass):
                     fig, ax = plt.subplots(figsize=figsize)
                 else:
                     fig, ax = fig_and_axes
-                ax.hist(self.samples, bins=50, histtype="stepfilled")
+                ax.hist(self.get_thinned_samples(thin), bins=50, histtype="stepfilled")
                 ax.set_xlabel(self.theta_symbols[0])
 
             fig.savefig(os.path.join(self.outdir, self.label + "_corner.png"), dpi=dpi)
@@ -995,7 +1219,8 @@ class MCMCSearch(BaseSearchClass):
             else:
                 fig, axes = fig_and_axes
 
-            samples_plt = copy.copy(self.samples)
+            samples = self.get_thinned_samples(thin)
+            samples_plt = copy.copy(samples)
             labels = self._get_labels(newline_units=False)
 
             samples_plt = self._scale_samples(samples_plt, self.theta_keys)
@@ -1031,7 +1256,7 @@ class MCMCSearch(BaseSearchClass):
                 bins=50,
                 max_n_ticks=4,
                 plot_contours=True,
-                plot_datapoints=True,
+                plot_datapoints=kwargs.pop("plot_datapoints", True),
                 label_kwargs={"fontsize": 12},
                 data_kwargs={"alpha": 0.1, "ms": 0.5},
                 range=_range,
@@ -1069,7 +1294,7 @@ class MCMCSearch(BaseSearchClass):
             fig.subplots_adjust(hspace=0.1, wspace=0.1)
 
             if add_prior:
-                self._add_prior_to_corner(axes, self.samples, add_prior)
+                self._add_prior_to_corner(axes, samples, add_prior)
 
             if save_fig:
                 fig_triangle.savefig(
@@ -1079,6 +1304,50 @@ class MCMCSearch(BaseSearchClass):
             else:
                 return fig, axes
 
+    def _get_production_autocorr_time(self, window=50):
+        """Integrated autocorrelation time of each parameter in the production samples.
+
+        Computed like in `_get_autocorr_time()`,
+        but for the cold-chain production samples only,
+        so that it is also available for results loaded from disk.
+        Returns NaN for parameters that do not vary.
+        """
+        if len(self.samples) % self.nwalkers != 0:
+            return np.full(self.ndim, np.nan)
+        chain = self.samples.reshape((self.nwalkers, -1, self.ndim))
+        with np.errstate(invalid="ignore"):
+            return self._autocorr_integrated_time(np.mean(chain, axis=0), window=window)
+
+    def get_thinned_samples(self, thin=None):
+        """Production samples of the cold chain, thinned along each walker.
+
+        Parameters
+        ----------
+        thin: int or None
+            Keep only every `thin`-th sample of each walker.
+            If None, use half the largest integrated autocorrelation time
+            over all parameters, estimated from the walker-averaged
+            production samples as in `_get_autocorr_time()`.
+
+        Returns
+        -------
+        samples: np.ndarray
+            The thinned samples, of shape `(nsamples, ndim)`.
+        """
+        if len(self.samples) % self.nwalkers != 0:
+            return self.samples
+        chain = self.samples.reshape((self.nwalkers, -1, self.ndim))
+        if thin is None:
+            tau = self._get_production_autocorr_time()
+            tau = tau[np.isfinite(tau)]
+            thin = int(np.max(tau) / 2) if len(tau) > 0 else 1
+        thin = max(1, thin)
+        if thin > 1:
+            logger.info(
+                "Thinning production samples of each walker by {}.".format(thin)
+            )
+        return chain[:, ::thin, :].reshape((-1, self.ndim))
+
     def plot_chainconsumer(self, save_fig=True, label_offset=0.25, dpi=300, **kwargs):
         """Generate a corner plot of the posterior using the `chaniconsumer` package.
 
@@ -1223,9 +1492,10 @@ class MCMCSearch(BaseSearchClass):
                     prior_dict["loc"] + normal_stds * prior_dict["scale"]
                 )
             elif prior_dict["type"] == "neghalfnorm":
-                prior_bounds[key]["upper"] = prior_dict["loc"]
+                # draws are -(loc + |N(0, scale)|), see _generate_rv()
+                prior_bounds[key]["upper"] = -prior_dict["loc"]
                 prior_bounds[key]["lower"] = (
-                    prior_dict["loc"] - normal_stds * prior_dict["scale"]
+                    -prior_dict["loc"] - normal_stds * prior_dict["scale"]
                 )
             elif prior_dict["type"] == "lognorm":
                 prior_bounds[key]["lower"] = np.exp(
@@ -1378,7 +1648,7 @@ class MCMCSearch(BaseSearchClass):
                 else:
                     return -np.inf
             else:
-                idxs = np.array([all(tup) for tup in zip(above, below)])
+                idxs = above & below
                 p = np.zeros(len(x)) - np.inf
                 p[idxs] = -np.log(b - a)
                 return p
@@ -1393,18 +1663,39 @@ class MCMCSearch(BaseSearchClass):
                 else:
                     return -np.inf
             else:
-                idxs = np.array([all(tup) for tup in zip(above, below)])
+                idxs = above & below
                 p = np.zeros(len(x)) - np.inf
-                p[idxs] = -np.log(x * np.log(10) * (log10upper - log10lower))
+                p[idxs] = -np.log(x[idxs] * np.log(10) * (log10upper - log10lower))
                 return p
 
         def log_of_halfnorm(x, loc, scale):
-            if x < loc:
-                return -np.inf
+            lognorm_const = -0.5 * np.log(0.5 * np.pi * scale**2)
+            if type(x) is not np.ndarray:
+                if x < loc:
+                    return -np.inf
+                else:
+                    return lognorm_const - 0.5 * ((x - loc) / scale) ** 2
             else:
-                return -0.5 * (
-                    (x - loc) ** 2 / scale**2 + np.log(0.5 * np.pi * scale**2)
-                )
+                idxs = x >= loc
+                p = np.zeros(len(x)) - np.inf
+                p[idxs] = lognorm_const - 0.5 * ((x[idxs] - loc) / scale) ** 2
+                return p
+
+        def log_of_lognorm(x, loc, scale):
+            # same parametrisation as np.random.lognormal in _generate_rv()
+            lognorm_const = -0.5 * np.log(2 * np.pi * scale**2)
+            if type(x) is not np.ndarray:
+                if x <= 0:
+                    return -np.inf
+                else:
+                    logx = np.log(x)
+                    return lognorm_const - logx - 0.5 * ((logx - loc) / scale) ** 2
+            else:
+                idxs = x > 0
+                p = np.zeros(len(x)) - np.inf
+                logx = np.log(x[idxs])
+                p[idxs] = lognorm_const - logx - 0.5 * ((logx - loc) / scale) ** 2
+                return p
 
         def cauchy(x, x0, gamma):
             return 1.0 / (np.pi * gamma * (1 + ((x - x0) / gamma) ** 2))
@@ -1431,33 +1722,50 @@ class MCMCSearch(BaseSearchClass):
                 + np.log(2 * np.pi * kwargs["scale"] ** 2)
             )
         elif kwargs["type"] == "lognorm":
-            # as of scipy 1.4.1 and numpy 1.18.1 the following parametrisation
-            # should be consistent with np.random.lognormal in _generate_rv()
-            return lambda x: lognorm.pdf(
-                x, s=kwargs["scale"], scale=np.exp(kwargs["loc"])
-            )
+            return lambda x: log_of_lognorm(x, kwargs["loc"], kwargs["scale"])
         else:
             logger.info("kwargs:", kwargs)
             raise ValueError("Prior pdf type {:s} unknown.".format(kwargs["type"]))
 
-    def _generate_rv(self, **kwargs):
+    def _generate_rv(self, size=None, **kwargs):
+        """Draw random values from a prior-like distribution.
+
+        Parameters
+        ----------
+        size: int, tuple or None
+            Output shape, as for the `np.random` functions.
+            If None, a single value is returned.
+        **kwargs:
+            A dictionary containing 'type' of pdf and shape parameters,
+            as for `_generic_lnprior()`.
+        """
         dist_type = kwargs.pop("type")
         if dist_type == "unif":
-            return np.random.uniform(low=kwargs["lower"], high=kwargs["upper"])
+            return np.random.uniform(
+                low=kwargs["lower"], high=kwargs["upper"], size=size
+            )
         if dist_type == "log10unif":
             return 10 ** (
-                np.random.uniform(low=kwargs["log10lower"], high=kwargs["log10upper"])
+                np.random.uniform(
+                    low=kwargs["log10lower"], high=kwargs["log10upper"], size=size
+                )
             )
         if dist_type == "norm":
-            return np.random.normal(loc=kwargs["loc"], scale=kwargs["scale"])
+            return np.random.normal(loc=kwargs["loc"], scale=kwargs["scale"], size=size)
         if dist_type == "halfnorm":
-            return np.abs(np.random.normal(loc=kwargs["loc"], scale=kwargs["scale"]))
+            # folded around loc, matching the support of log_of_halfnorm()
+            return kwargs["loc"] + np.abs(
+                np.random.normal(scale=kwargs["scale"], size=size)
+            )
         if dist_type == "neghalfnorm":
-            return -1 * np.abs(
-                np.random.normal(loc=kwargs["loc"], scale=kwargs["scale"])
+            return -1 * (
+                kwargs["loc"]
+                + np.abs(np.random.normal(scale=kwargs["scale"], size=size))
             )
         if dist_type == "lognorm":
-            return np.random.lognormal(mean=kwargs["loc"], sigma=kwargs["scale"])
+            return np.random.lognormal(
+                mean=kwargs["loc"], sigma=kwargs["scale"], size=size
+            )
         else:
             raise ValueError("dist_type {} unknown".format(dist_type))
 
@@ -1663,47 +1971,35 @@ class MCMCSearch(BaseSearchClass):
 
     def _generate_scattered_p0(self, p):
         """Generate a set of p0s scattered about p"""
-        p0 = [
-            [
-                p + self.scatter_val * p * np.random.randn(self.ndim)
-                for i in range(self.nwalkers)
-            ]
-            for j in range(self.ntemps)
-        ]
-        return p0
+        return p + self.scatter_val * p * np.random.randn(
+            self.ntemps, self.nwalkers, self.ndim
+        )
 
     def _generate_initial_p0(self):
-        """Generate a set of init vals for the walkers"""
+        """Generate a set of init vals for the walkers
+
+        All values for each parameter are drawn at once,
+        and stacked into an array of shape `(ntemps, nwalkers, ndim)`.
+        """
 
         if isinstance(self.theta_initial, dict):
             logger.info("Generate initial values from initial dictionary")
             if hasattr(self, "nglitch") and self.nglitch > 1:
                 raise ValueError("Initial dict not implemented for nglitch>1")
-            p0 = [
-                [
-                    [
-                        self._generate_rv(**self.theta_initial[key])
-                        for key in self.theta_keys
-                    ]
-                    for i in range(self.nwalkers)
-                ]
-                for j in range(self.ntemps)
-            ]
+            dists = self.theta_initial
         elif self.theta_initial is None:
             logger.info("Generate initial values from prior dictionary")
-            p0 = [
-                [
-                    [
-                        self._generate_rv(**self.theta_prior[key])
-                        for key in self.theta_keys
-                    ]
-                    for i in range(self.nwalkers)
-                ]
-                for j in range(self.ntemps)
-            ]
+            dists = self.theta_prior
         else:
             raise ValueError("theta_initial not understood")
 
+        p0 = np.stack(
+            [
+                self._generate_rv(size=(self.ntemps, self.nwalkers), **dists[key])
+                for key in self.theta_keys
+            ],
+            axis=-1,
+        )
         return p0
 
     def _get_new_p0(self):
@@ -1765,27 +2061,36 @@ class MCMCSearch(BaseSearchClass):
         )
         return d
 
+    def _get_chain_path(self):
+        """Path of the `.npy` file storing the full chain next to the pickle."""
+        return os.path.splitext(self.pickle_path)[0] + "_chain.npy"
+
     def _pickle_data(self, samples, lnprobs, lnlikes, all_lnlikelihood):
         d = self._get_data_dictionary_to_save()
         d["samples"] = samples
         d["lnprobs"] = lnprobs
         d["lnlikes"] = lnlikes
-        d["chain"] = self.sampler.chain
         d["all_lnlikelihood"] = all_lnlikelihood
 
-        if os.path.isfile(self.pickle_path):
-            logger.info(
-                "Saving backup of {} as {}.old".format(
-                    self.pickle_path, self.pickle_path
-                )
-            )
-            os.rename(self.pickle_path, self.pickle_path + ".old")
+        # the full chain (all temperatures and steps) is saved separately
+        # so that it can be memory-mapped instead of loaded when reused
+        chain_path = self._get_chain_path()
+        for path in [self.pickle_path, chain_path]:
+            if os.path.isfile(path):
+                logger.info("Saving backup of {} as {}.old".format(path, path))
+                os.rename(path, path + ".old")
+        np.save(chain_path, self.sampler.chain)
         with open(self.pickle_path, "wb") as File:
             pickle.dump(d, File)
 
     def get_saved_data_dictionary(self):
         """Read the data saved in `self.pickel_path` and return it as a dictionary.
 
+        The full chain is read from a separate `.npy` file
+        (see `_get_chain_path()`) as a read-only memory map,
+        unless it is contained in the pickle itself
+        as for files written by older versions.
+
         Returns
         --------
         d: dict
@@ -1793,6 +2098,9 @@ class MCMCSearch(BaseSearchClass):
         """
         with open(self.pickle_path, "rb") as File:
             d = pickle.load(File)
+        chain_path = self._get_chain_path()
+        if "chain" not in d and os.path.isfile(chain_path):
+            d["chain"] = np.load(chain_path, mmap_mode="r")
         return d
 
     def _check_old_data_is_okay_to_use(self):
@@ -1811,6 +2119,10 @@ class MCMCSearch(BaseSearchClass):
         old_d = self.get_saved_data_dictionary().copy()
         new_d = self._get_data_dictionary_to_save().copy()
 
+        if "chain" not in old_d:
+            logger.info("No saved chain found")
+            return False
+
         old_d.pop("samples")
         old_d.pop("lnprobs")
         old_d.pop("lnlikes")
@@ -2183,9 +2495,22 @@ class MCMCSearch(BaseSearchClass):
         logger.info("Summary:")
         if hasattr(self, "theta0_idx"):
             logger.info("theta0 index: {}".format(self.theta0_idx))
+        if getattr(self, "beta_history", None) is not None:
+            logger.info("Adapted temperature ladder betas: {}".format(self.betas))
+        if getattr(self, "logl_cache_calls", 0) > 0:
+            logger.info(
+                "Likelihood cache hits: {} of {} ({:.1%})".format(
+                    self.logl_cache_hits,
+                    self.logl_cache_calls,
+                    self.logl_cache_hits / self.logl_cache_calls,
+                )
+            )
         logger.info("Max twoF: {} with parameters:".format(max_twoF))
         for k in np.sort(list(max_twoFd.keys())):
             logger.info("  {:10s} = {:1.9e}".format(k, max_twoFd[k]))
+        logger.info("Integrated autocorrelation time of production samples:")
+        for k, tau in zip(self.theta_keys, self._get_production_autocorr_time()):
+            logger.info("  {:10s} = {:1.1f} steps".format(k, tau))
         logger.info("Mean +- std for production values:")
         for k in np.sort(list(summary_stats.keys())):
             logger.info(
@@ -2442,6 +2767,7 @@ class MCMCGlitchSearch(MCMCSearch):
         sun_ephem=None,
         allowedMismatchFromSFTLength=None,
         clean=False,
+        pool=None,
     ):
         """
         Parameters
@@ -2535,6 +2861,12 @@ class MCMCGlitchSearch(MCMCSearch):
         ]
         return np.sum(H)
 
+    def _logp_batch(self, ps):
+        # the glitch-time ordering constraints are checked point by point
+        return np.array(
+            [self._logp(p, self.theta_prior, self.theta_keys, self.search) for p in ps]
+        )
+
     def _logl(self, theta, search):
         in_theta = self._set_point_for_evaluation(theta)
         if self.nglitch > 1:
@@ -2766,6 +3098,7 @@ class MCMCSemiCoherentSearch(MCMCSearch):
         sun_ephem=None,
         allowedMismatchFromSFTLength=None,
         clean=False,
+        pool=None,
     ):
         """
         Parameters
@@ -2801,6 +3134,7 @@ class MCMCSemiCoherentSearch(MCMCSearch):
         self.set_ephemeris_files(earth_ephem, sun_ephem)
         self.allowedMismatchFromSFTLength = allowedMismatchFromSFTLength
         self.clean = clean
+        self.pool = pool
 
         os.makedirs(outdir, exist_ok=True)
         self.output_file_header = self.get_output_file_header()
@@ -2927,6 +3261,7 @@ class MCMCFollowUpSearch(MCMCSemiCoherentSearch, core.DeprecatedClass):
         sun_ephem=None,
         allowedMismatchFromSFTLength=None,
         clean=False,
+        pool=None,
     ):
         self._set_init_params_dict(locals())
         self.theta_prior = theta_prior
@@ -2955,6 +3290,7 @@ class MCMCFollowUpSearch(MCMCSemiCoherentSearch, core.DeprecatedClass):
         self.set_ephemeris_files(earth_ephem, sun_ephem)
         self.allowedMismatchFromSFTLength = allowedMismatchFromSFTLength
         self.clean = clean
+        self.pool = pool
 
         os.makedirs(outdir, exist_ok=True)
         self.output_file_header = self.get_output_file_header()
@@ -3057,14 +3393,11 @@ class MCMCFollowUpSearch(MCMCSemiCoherentSearch, core.DeprecatedClass):
             self.search.nsegs = nseg
             self._update_search_object()
             self.search.init_semicoherent_parameters()
-            self.sampler = PTSampler(
+            self.sampler = _BatchedPTSampler(
                 ntemps=self.ntemps,
                 nwalkers=self.nwalkers,
                 dim=self.ndim,
-                logl=self._logl,
-                logp=self._logp,
-                logpargs=(self.theta_prior, self.theta_keys, self.search),
-                loglargs=(self.search,),
+                **self._get_sampler_log_functions(),
                 betas=self.betas,
                 a=proposal_scale_factor,
             )
@@ -3424,6 +3757,40 @@ class MCMCTransientSearch(MCMCSearch):
         if self.maxStartTime is None:
             self.maxStartTime = self.search.maxStartTime
 
+    def _logl_cache_key(self, theta):
+        # ComputeFstat truncates the transient window to integer seconds,
+        # so points within the same second share their likelihood
+        p = self._set_point_for_evaluation(theta)
+        return (
+            *[val for key, val in p.items() if key not in ["tstart", "tend"]],
+            int(p["tstart"]),
+            int(p["tend"] - p["tstart"]),
+            p["tend"] > self.maxStartTime,
+        )
+
+    def _set_up_point_for_evaluation(self):
+        """Sort the parameters into fixed and sampled ones once.
+
+        This way, `_set_point_for_evaluation()` only has to
+        fill in the sampled values on each likelihood call.
+        """
+        fixed = dict(zip(self.full_theta_keys, self.fixed_theta))
+        self._fixed_point = {
+            key: val for key, val in fixed.items() if "transient" not in key
+        }
+        # FIXME: this can be simplified when changing all theta lists to dicts
+        self._fixed_point["tstart"] = fixed["transient_tstart"]
+        self._fixed_tau = fixed["transient_duration"]
+        self._sampled_point_keys = [
+            (k, "tstart" if key == "transient_tstart" else key)
+            for k, key in enumerate(self.theta_keys)
+            if key != "transient_duration"
+        ]
+        if "transient_duration" in self.theta_keys:
+            self._sampled_tau_idx = self.theta_keys.index("transient_duration")
+        else:
+            self._sampled_tau_idx = None
+
     def _set_point_for_evaluation(self, theta):
         """Combines fixed and variable parameters to form a valid evaluation point.
 
@@ -3437,29 +3804,13 @@ class MCMCTransientSearch(MCMCSearch):
             The full parameter space point as a dictionary.
             (different from base MCMCSearch class!)
         """
-        p = {
-            key: self.fixed_theta[k]
-            for k, key in enumerate(self.full_theta_keys)
-            if "transient" not in key
-        }
-        p.update(
-            {
-                key: theta[k]
-                for k, key in enumerate(self.theta_keys)
-                if "transient" not in key
-            }
-        )
-        # FIXME: this can be simplified when changing all theta lists to dicts
-        if "transient_tstart" in self.theta_keys:
-            p["tstart"] = theta[self.theta_keys.index("transient_tstart")]
-        else:
-            p["tstart"] = self.fixed_theta[
-                self.full_theta_keys.index("transient_tstart")
-            ]
-        if "transient_duration" in self.theta_keys:
-            tau = theta[self.theta_keys.index("transient_duration")]
+        p = self._fixed_point.copy()
+        for k, key in self._sampled_point_keys:
+            p[key] = theta[k]
+        if self._sampled_tau_idx is None:
+            tau = self._fixed_tau
         else:
-            tau = self.fixed_theta[self.full_theta_keys.index("transient_duration")]
+            tau = theta[self._sampled_tau_idx]
         p["tend"] = p["tstart"] + tau
         return p
 
@@ -3511,6 +3862,7 @@ class MCMCTransientSearch(MCMCSearch):
         self.output_keys.append("twoF")
         if self.BSGL:
             self.output_keys.append("log10BSGL")
+        self._set_up_point_for_evaluation()
 
     def _get_savetxt_fmt_dict(self):
         fmt_dict = utils.get_doppler_params_output_format(
@@ -11,6 +11,7 @@ for a detailed discussion of the GPU implementation.
 # optional imports
 import importlib as imp
 import logging
+import operator
 import os
 from time import time
 
@@ -193,6 +194,19 @@ class pyTransientFstatMap:
         """
         return np.unravel_index(np.argmax(self.F_mn), self.F_mn.shape)
 
+    def _get_exp_F_mn_minus_maxF(self):
+        """Get e^(F_mn - maxF) as used for lnBtSG and both posteriors.
+
+        The map itself is single precision,
+        but this is evaluated in double precision like in lalpulsar
+        and cached so that the exponentials are only computed once per map.
+        """
+        cached = getattr(self, "_exp_F_mn_cache", None)
+        if cached is None or cached[0] is not self.F_mn or cached[1] != self.maxF:
+            eF = np.exp(self.F_mn.astype(np.float64) - np.float64(self.maxF))
+            self._exp_F_mn_cache = (self.F_mn, self.maxF, eF)
+        return self._exp_F_mn_cache[2]
+
     def get_lnBtSG(self):
         """Compute (natural log of the) transient-CW Bayes-factor B_tSG = P(x|HyptS)/P(x|HypG).
 
@@ -207,7 +221,7 @@ class pyTransientFstatMap:
         # The first 2 lines are equivalent to `logBhat = logsumexp(self.F_mn)`,
         # but since we have `self.maxF` already precomputed,
         # doing the manual version of the same stable summation trick is slightly faster.
-        sum_eB = np.sum(np.exp(-(self.maxF - self.F_mn)))
+        sum_eB = np.sum(self._get_exp_F_mn_minus_maxF())
         logBhat = self.maxF + np.log(sum_eB)  # unnormalized Bhat
         normBh = 70.0 / np.prod(
             self.F_mn.shape
@@ -244,7 +258,7 @@ class pyTransientFstatMap:
         # It is numerically more robust to marginalize over e^(F_mn - Fmax),
         # which at worst can underflow, while e^F_mn can overflow.
         # The constant offset e^Fmax is irrelevant for posteriors (normalization constant).
-        sum_eF = np.sum(np.exp(-(self.maxF - self.F_mn)), axis=1)
+        sum_eF = np.sum(self._get_exp_F_mn_minus_maxF(), axis=1)
         dx = windowRange.t0Band / (
             np.shape(self.F_mn)[0]
         )  # like this it is consistent with LAL
@@ -279,7 +293,7 @@ class pyTransientFstatMap:
         # It is numerically more robust to marginalize over e^(F_mn - Fmax),
         # which at worst can underflow, while e^F_mn can overflow.
         # The constant offset e^Fmax is irrelevant for posteriors (normalization constant).
-        sum_eF = np.sum(np.exp(-(self.maxF - self.F_mn)), axis=0)
+        sum_eF = np.sum(self._get_exp_F_mn_minus_maxF(), axis=0)
         dy = windowRange.tauBand / (
             np.shape(self.F_mn)[1]
         )  # like this it is consistent with LAL
@@ -304,17 +318,25 @@ class pyTransientFstatMap:
             A list of additional header lines
             to print at the start of the file.
         """
-        with open(tCWfile, "w") as tfp:
+        N_t0Range, N_tauRange = self.F_mn.shape
+        t0s = [windowRange.t0 + m * windowRange.dt0 for m in range(N_t0Range)]
+        taus = [windowRange.tau + n * windowRange.dtau for n in range(N_tauRange)]
+        rowfmt = "  %10d %10d %- 11.8g\n"
+        # one buffered write per t0 row
+        # instead of a formatted write call per map entry
+        with open(tCWfile, "w", buffering=1 << 20) as tfp:
             for hline in header:
                 tfp.write("# {:s}\n".format(hline))
             tfp.write("# t0[s]     tau[s]     2F\n")
-            for m, F_m in enumerate(self.F_mn):
-                this_t0 = windowRange.t0 + m * windowRange.dt0
-                for n, this_F in enumerate(F_m):
-                    this_tau = windowRange.tau + n * windowRange.dtau
-                    tfp.write(
-                        "  %10d %10d %- 11.8g\n" % (this_t0, this_tau, 2.0 * this_F)
+            for this_t0, twoF_m in zip(t0s, (2.0 * self.F_mn).tolist()):
+                tfp.write(
+                    "".join(
+                        [
+                            rowfmt % (this_t0, this_tau, this_2F)
+                            for this_tau, this_2F in zip(taus, twoF_m)
+                        ]
                     )
+                )
 
 
 fstatmap_versions = {
@@ -324,6 +346,9 @@ fstatmap_versions = {
     "pycuda": lambda multiFstatAtoms, windowRange, BtSG: pycuda_compute_transient_fstat_map(
         multiFstatAtoms, windowRange, BtSG
     ),
+    "numba": lambda multiFstatAtoms, windowRange, BtSG: numba_compute_transient_fstat_map(
+        multiFstatAtoms, windowRange, BtSG
+    ),
 }
 """Dictionary of the actual callable transient F-stat map functions this module supports.
 
@@ -355,13 +380,14 @@ def _get_transient_fstat_map_features():
     have_lalpulsar = _optional_import("lalpulsar")
     features["lal"] = have_lal and have_lalpulsar
     features["pycuda"] = _optional_imports_pycuda()
+    features["numba"] = _optional_import("numba")
     return features
 
 
 def init_transient_fstat_map_features(feature="lal", cudaDeviceName=None):
     """Initialization of available modules (or 'features') for computing transient F-stat maps.
 
-    Currently, two implementations are supported and checked for
+    Currently, three implementations are supported and checked for
     through the `_optional_import()` method:
 
     1. `lal`: requires both `lal` and `lalpulsar` packages to be importable.
@@ -370,6 +396,9 @@ def init_transient_fstat_map_features(feature="lal", cudaDeviceName=None):
     along with its modules
     `driver`, `gpuarray`, `tools` and `compiler`.
 
+    3. `numba`: requires the `numba` package to be importable.
+    The CPU kernels are compiled on first use.
+
     Parameters
     ----------
     feature: str
@@ -482,6 +511,13 @@ def init_transient_fstat_map_features(feature="lal", cudaDeviceName=None):
             gpu_context.push()
 
         _print_GPU_memory_MB("Available")
+    elif feature == "numba":
+        if not features["numba"] or not _optional_import(
+            "pyfstat.tcw_fstat_map_numba_kernels", "numba_kernels"
+        ):
+            raise RuntimeError("numba use was requested, but imports failed.")
+        logger.info("numba version: " + numba.__version__)
+        gpu_context = None
     elif feature == "lal":
         gpu_context = None
     else:
@@ -505,7 +541,7 @@ def call_compute_transient_fstat_map(
     ----------
     version: str
         Name of the method to call
-        (currently supported: 'lal' or 'pycuda').
+        (currently supported: 'lal', 'pycuda' or 'numba').
     features: dict
         Dictionary of available features,
         as obtained from `init_transient_fstat_map_features()`.
@@ -604,9 +640,6 @@ def reshape_FstatAtomsVector(atomsVector):
         which then is a 1D ndarray over timestamps for that one quantity.
     """
 
-    numAtoms = atomsVector.length
-    atomsDict = {}
-    tempDict = {}
     atom_fields = [
         ("timestamp", np.uint32),
         ("a2_alpha", np.float32),
@@ -615,59 +648,27 @@ def reshape_FstatAtomsVector(atomsVector):
         ("Fa_alpha", complex),
         ("Fb_alpha", complex),
     ]
-    for dtype in atom_fields:
-        if dtype[1] == complex:
-            for part in "re", "im":
-                atomsDict[dtype[0] + "_" + part] = np.ndarray(
-                    numAtoms, dtype=np.float32
-                )
-            tempDict[dtype[0]] = np.ndarray(numAtoms, dtype=complex)
+    # each swig attribute access is slow, so get all fields of each atom
+    # in one attrgetter call and transpose the rows into columns
+    get_fields = operator.attrgetter(*[field for field, _ in atom_fields])
+    columns = zip(*map(get_fields, atomsVector.data[: atomsVector.length]))
+    atomsDict = {}
+    for (field, dtype), column in zip(atom_fields, columns):
+        if dtype == complex:
+            # the atoms are single precision in lalpulsar
+            column = np.array(column, dtype=np.complex64)
+            atomsDict[field + "_re"] = column.real.copy()
+            atomsDict[field + "_im"] = column.imag.copy()
         else:
-            atomsDict[dtype[0]] = np.ndarray(numAtoms, dtype=dtype[1])
-    for n, atom in enumerate(atomsVector.data):
-        for dtype in atom_fields:
-            if dtype[1] == complex:
-                tempDict[dtype[0]][n] = atom.__getattribute__(dtype[0])
-            else:
-                atomsDict[dtype[0]][n] = atom.__getattribute__(dtype[0])
-    for dtype in atom_fields:
-        if dtype[1] == complex:
-            for part in "real", "imag":
-                atomsDict[dtype[0] + "_" + part[:2]] = np.float32(
-                    getattr(tempDict[dtype[0]], part)
-                )
+            atomsDict[field] = np.array(column, dtype=dtype)
     return atomsDict
 
 
-def _get_absolute_kernel_path(kernel):
-    pyfstatdir = os.path.dirname(os.path.abspath(os.path.realpath(__file__)))
-    kernelfile = kernel + ".cu"
-    return os.path.join(pyfstatdir, "pyCUDAkernels", kernelfile)
-
-
-def _print_GPU_memory_MB(key):
-    mem_used_MB = drv.mem_get_info()[0] / (2.0**20)
-    mem_total_MB = drv.mem_get_info()[1] / (2.0**20)
-    logger.debug(
-        "{} GPU memory: {:.4f} / {:.4f} MB free".format(key, mem_used_MB, mem_total_MB)
-    )
-
-
-def pycuda_compute_transient_fstat_map(multiFstatAtoms, windowRange, BtSG=False):
-    """GPU version of computing a transient F-statistic map.
+def _prepare_transient_fstat_map_inputs(multiFstatAtoms, windowRange):
+    """Merge the F-stat atoms and set up an empty F_mn map for the windowRange.
 
-    This is based on XLALComputeTransientFstatMap from LALSuite,
-    (C) 2009 Reinhard Prix, licensed under GPL.
-
-    The 'map' consists of F-statistics evaluated over
-    a range of different `(t0,tau)` pairs
-    (transient start-times and duration parameters).
-
-    This is a high-level wrapper function;
-    the actual CUDA computations are performed in one of the functions
-    `pycuda_compute_transient_fstat_map_rect()`
-    or `pycuda_compute_transient_fstat_map_exp()`,
-    depending on the window function defined in `windowRange`.
+    This is the common setup for the `pycuda` and `numba` versions,
+    based on XLALComputeTransientFstatMap from LALSuite.
 
     Parameters
     ----------
@@ -675,19 +676,18 @@ def pycuda_compute_transient_fstat_map(multiFstatAtoms, windowRange, BtSG=False)
         The time-dependent F-stat atoms previously computed by `ComputeFstat`.
     windowRange: lalpulsar.transientWindowRange_t
         The structure defining the transient parameters.
-    BtSG: boolean
-        If true, also compute the lnBtSG transient Bayes factor statistic,
-        using a CPU python port of the corresponding lalpulsar function,
-        and store it in `FstatMap.lnBtSG`;
-        and the max-posterior estimates
-        `FstatMap.t0_MP` and `FstatMap.tau_MP`.
+        NOTE: a `TRANSIENT_NONE` window is replaced in-place
+        by a rectangular window spanning all the data.
 
     Returns
     -------
+    atomsInputMatrix: np.ndarray
+        A 2D array of stacked named columns containing the F-stat atoms.
+    tCWparams: dict
+        A dictionary of miscellaneous parameters.
     FstatMap: pyTransientFstatMap
-        The computed results, see the class definition for details.
+        A zero-initialised map matching the windowRange.
     """
-
     if windowRange.type >= lalpulsar.TRANSIENT_LAST:
         raise ValueError(
             "Unknown window-type ({}) passed as input."
@@ -790,27 +790,36 @@ def pycuda_compute_transient_fstat_map(multiFstatAtoms, windowRange, BtSG=False)
         )
     )
 
-    if windowRange.type == lalpulsar.TRANSIENT_RECTANGULAR:
-        FstatMap.F_mn = pycuda_compute_transient_fstat_map_rect(
-            atomsInputMatrix, windowRange, tCWparams
-        )
-    elif windowRange.type == lalpulsar.TRANSIENT_EXPONENTIAL:
-        FstatMap.F_mn = pycuda_compute_transient_fstat_map_exp(
-            atomsInputMatrix, windowRange, tCWparams
-        )
-    else:
-        raise ValueError(
-            "Invalid transient window type {}"
-            " not in [{}, {}].".format(
-                windowRange.type, lalpulsar.TRANSIENT_NONE, lalpulsar.TRANSIENT_LAST - 1
-            )
-        )
+    return atomsInputMatrix, tCWparams, FstatMap
+
 
-    # out of loop: get max2F and ML estimates over the m x n matrix
-    FstatMap.maxF = FstatMap.F_mn.max()
+def _finalise_transient_fstat_map(FstatMap, windowRange, tCWparams, BtSG=False):
+    """Get the maximum and ML estimates and optionally lnBtSG of an F_mn map.
+
+    Parameters
+    ----------
+    FstatMap: pyTransientFstatMap
+        The map with its `F_mn` matrix already filled.
+    windowRange: lalpulsar.transientWindowRange_t
+        The structure defining the transient parameters.
+    tCWparams: dict
+        A dictionary of miscellaneous parameters.
+    BtSG: boolean
+        If true, also compute the lnBtSG transient Bayes factor statistic
+        and the max-posterior estimates
+        `FstatMap.t0_MP` and `FstatMap.tau_MP`.
+
+    Returns
+    -------
+    FstatMap: pyTransientFstatMap
+        The same map object, with all other fields set.
+    """
+    # get max2F and ML estimates over the m x n matrix,
+    # with a single pass for both the maximum and its location
     maxidx = np.unravel_index(
         FstatMap.F_mn.argmax(), (tCWparams["N_t0Range"], tCWparams["N_tauRange"])
     )
+    FstatMap.maxF = FstatMap.F_mn[maxidx]
     FstatMap.t0_ML = windowRange.t0 + maxidx[0] * windowRange.dt0
     FstatMap.tau_ML = windowRange.tau + maxidx[1] * windowRange.dtau
 
@@ -823,6 +832,7 @@ def pycuda_compute_transient_fstat_map(multiFstatAtoms, windowRange, BtSG=False)
 
     if BtSG:
         # so far seems there is no need to move this onto the GPU
+        # or to compile it for the CPU
         FstatMap.get_lnBtSG()
         FstatMap.get_t0_max_posterior(windowRange)
         FstatMap.get_tau_max_posterior(windowRange)
@@ -834,6 +844,102 @@ def pycuda_compute_transient_fstat_map(multiFstatAtoms, windowRange, BtSG=False)
     return FstatMap
 
 
+def _get_absolute_kernel_path(kernel):
+    pyfstatdir = os.path.dirname(os.path.abspath(os.path.realpath(__file__)))
+    kernelfile = kernel + ".cu"
+    return os.path.join(pyfstatdir, "pyCUDAkernels", kernelfile)
+
+
+# compiled CUDA modules and their prepared kernel functions,
+# keyed by kernel name and CUDA context handle
+_pycuda_kernels = {}
+
+
+def _get_prepared_pycuda_kernel(kernel, arg_types):
+    """Compile and prepare a CUDA kernel once per context.
+
+    Reading and compiling the kernel source for every single map
+    would add to the per-template overhead of a transient search,
+    so the prepared function is reused across calls.
+    """
+    key = (kernel, drv.Context.get_current().handle)
+    if key not in _pycuda_kernels:
+        kernelfile = _get_absolute_kernel_path(kernel)
+        with open(kernelfile, "r") as f:
+            cuda_code = cudacomp.SourceModule(f.read())
+        cuda_function = cuda_code.get_function(kernel)
+        cuda_function.prepare(arg_types)
+        # keep the module alive along with its function
+        _pycuda_kernels[key] = (cuda_code, cuda_function)
+    return _pycuda_kernels[key][1]
+
+
+def _print_GPU_memory_MB(key):
+    mem_used_MB = drv.mem_get_info()[0] / (2.0**20)
+    mem_total_MB = drv.mem_get_info()[1] / (2.0**20)
+    logger.debug(
+        "{} GPU memory: {:.4f} / {:.4f} MB free".format(key, mem_used_MB, mem_total_MB)
+    )
+
+
+def pycuda_compute_transient_fstat_map(multiFstatAtoms, windowRange, BtSG=False):
+    """GPU version of computing a transient F-statistic map.
+
+    This is based on XLALComputeTransientFstatMap from LALSuite,
+    (C) 2009 Reinhard Prix, licensed under GPL.
+
+    The 'map' consists of F-statistics evaluated over
+    a range of different `(t0,tau)` pairs
+    (transient start-times and duration parameters).
+
+    This is a high-level wrapper function;
+    the actual CUDA computations are performed in one of the functions
+    `pycuda_compute_transient_fstat_map_rect()`
+    or `pycuda_compute_transient_fstat_map_exp()`,
+    depending on the window function defined in `windowRange`.
+
+    Parameters
+    ----------
+    multiFstatAtoms: lalpulsar.MultiFstatAtomVector
+        The time-dependent F-stat atoms previously computed by `ComputeFstat`.
+    windowRange: lalpulsar.transientWindowRange_t
+        The structure defining the transient parameters.
+    BtSG: boolean
+        If true, also compute the lnBtSG transient Bayes factor statistic,
+        using a CPU python port of the corresponding lalpulsar function,
+        and store it in `FstatMap.lnBtSG`;
+        and the max-posterior estimates
+        `FstatMap.t0_MP` and `FstatMap.tau_MP`.
+
+    Returns
+    -------
+    FstatMap: pyTransientFstatMap
+        The computed results, see the class definition for details.
+    """
+
+    atomsInputMatrix, tCWparams, FstatMap = _prepare_transient_fstat_map_inputs(
+        multiFstatAtoms, windowRange
+    )
+
+    if windowRange.type == lalpulsar.TRANSIENT_RECTANGULAR:
+        FstatMap.F_mn = pycuda_compute_transient_fstat_map_rect(
+            atomsInputMatrix, windowRange, tCWparams
+        )
+    elif windowRange.type == lalpulsar.TRANSIENT_EXPONENTIAL:
+        FstatMap.F_mn = pycuda_compute_transient_fstat_map_exp(
+            atomsInputMatrix, windowRange, tCWparams
+        )
+    else:
+        raise ValueError(
+            "Invalid transient window type {}"
+            " not in [{}, {}].".format(
+                windowRange.type, lalpulsar.TRANSIENT_NONE, lalpulsar.TRANSIENT_LAST - 1
+            )
+        )
+
+    return _finalise_transient_fstat_map(FstatMap, windowRange, tCWparams, BtSG)
+
+
 def pycuda_compute_transient_fstat_map_rect(atomsInputMatrix, windowRange, tCWparams):
     """GPU computation of the transient F-stat map for rectangular windows.
 
@@ -868,11 +974,9 @@ def pycuda_compute_transient_fstat_map_rect(atomsInputMatrix, windowRange, tCWpa
     _print_GPU_memory_MB("After input+output allocation:")
 
     # GPU kernel
-    kernel = "cudaTransientFstatRectWindow"
-    kernelfile = _get_absolute_kernel_path(kernel)
-    partial_Fstat_cuda_code = cudacomp.SourceModule(open(kernelfile, "r").read())
-    partial_Fstat_cuda = partial_Fstat_cuda_code.get_function(kernel)
-    partial_Fstat_cuda.prepare("PIIIIIIIIP")
+    partial_Fstat_cuda = _get_prepared_pycuda_kernel(
+        "cudaTransientFstatRectWindow", "PIIIIIIIIP"
+    )
 
     # GPU grid setup
     blockRows = min(1024, tCWparams["N_t0Range"])
@@ -949,11 +1053,9 @@ def pycuda_compute_transient_fstat_map_exp(atomsInputMatrix, windowRange, tCWpar
     _print_GPU_memory_MB("After input+output allocation:")
 
     # GPU kernel
-    kernel = "cudaTransientFstatExpWindow"
-    kernelfile = _get_absolute_kernel_path(kernel)
-    partial_Fstat_cuda_code = cudacomp.SourceModule(open(kernelfile, "r").read())
-    partial_Fstat_cuda = partial_Fstat_cuda_code.get_function(kernel)
-    partial_Fstat_cuda.prepare("PIIIIIIIIIP")
+    partial_Fstat_cuda = _get_prepared_pycuda_kernel(
+        "cudaTransientFstatExpWindow", "PIIIIIIIIIP"
+    )
 
     # GPU grid setup
     blockRows = min(32, tCWparams["N_t0Range"])
@@ -996,3 +1098,64 @@ def pycuda_compute_transient_fstat_map_exp(atomsInputMatrix, windowRange, tCWpar
     _print_GPU_memory_MB("Final")
 
     return F_mn
+
+
+def numba_compute_transient_fstat_map(multiFstatAtoms, windowRange, BtSG=False):
+    """CPU version of computing a transient F-statistic map with numba.
+
+    This is based on XLALComputeTransientFstatMap from LALSuite,
+    (C) 2009 Reinhard Prix, licensed under GPL,
+    and uses the same setup and algorithms as the `pycuda` version,
+    but with numba-compiled CPU kernels from `tcw_fstat_map_numba_kernels`.
+
+    Parameters
+    ----------
+    multiFstatAtoms: lalpulsar.MultiFstatAtomVector
+        The time-dependent F-stat atoms previously computed by `ComputeFstat`.
+    windowRange: lalpulsar.transientWindowRange_t
+        The structure defining the transient parameters.
+    BtSG: boolean
+        If true, also compute the lnBtSG transient Bayes factor statistic,
+        using a python port of the corresponding lalpulsar function,
+        and store it in `FstatMap.lnBtSG`;
+        and the max-posterior estimates
+        `FstatMap.t0_MP` and `FstatMap.tau_MP`.
+
+    Returns
+    -------
+    FstatMap: pyTransientFstatMap
+        The computed results, see the class definition for details.
+    """
+
+    atomsInputMatrix, tCWparams, FstatMap = _prepare_transient_fstat_map_inputs(
+        multiFstatAtoms, windowRange
+    )
+
+    if windowRange.type == lalpulsar.TRANSIENT_RECTANGULAR:
+        kernel = numba_kernels.transient_fstat_map_rect
+    elif windowRange.type == lalpulsar.TRANSIENT_EXPONENTIAL:
+        kernel = numba_kernels.transient_fstat_map_exp
+    else:
+        raise ValueError(
+            "Invalid transient window type {}"
+            " not in [{}, {}].".format(
+                windowRange.type, lalpulsar.TRANSIENT_NONE, lalpulsar.TRANSIENT_LAST - 1
+            )
+        )
+    # one contiguous row per atoms quantity for unit-stride loads in the kernels;
+    # the atoms are single precision in lalpulsar already,
+    # sums over them are accumulated in double precision by the kernels
+    atomsRows = np.ascontiguousarray(atomsInputMatrix.T, dtype=np.float32)
+    FstatMap.F_mn = kernel(
+        atomsRows,
+        tCWparams["TAtom"],
+        tCWparams["t0_data"],
+        windowRange.t0,
+        windowRange.dt0,
+        windowRange.tau,
+        windowRange.dtau,
+        tCWparams["N_t0Range"],
+        tCWparams["N_tauRange"],
+    )
+
+    return _finalise_transient_fstat_map(FstatMap, windowRange, tCWparams, BtSG)
@@ -0,0 +1,206 @@
+"""Numba-compiled CPU kernels for transient-CW F(t0,tau) maps.
+
+These are direct CPU ports of the CUDA kernels in `pyCUDAkernels/`,
+which themselves are based on XLALComputeTransientFstatMap from LALSuite,
+(C) 2009 Reinhard Prix, licensed under GPL.
+
+This module requires `numba` and should only be imported
+through `tcw_fstat_map_funcs.init_transient_fstat_map_features("numba")`.
+The kernels are compiled on first use and cached to disk.
+The map kernels are parallelised over t0 rows
+(each of which is independent), using numba's threading layer;
+the number of threads can be controlled via `numba.set_num_threads()`
+or the `NUMBA_NUM_THREADS` environment variable.
+They use numpy's error model, so that integer and float divisions
+compile without Python's ZeroDivisionError branches;
+all divisors are either positive by construction or guarded explicitly.
+"""
+
+import numba
+import numpy as np
+
+# hardcoded copy from lalpulsar
+TRANSIENT_EXP_EFOLDING = 3
+
+
+@numba.njit(cache=True, error_model="numpy")
+def _get_atom_index(t, t0_data, TAtom, offset, numAtoms):
+    """Fstat-atom index of time t, clamped to [0, numAtoms).
+
+    Using integer round: floor(x+0.5),
+    with an optional offset (1 for window end-times).
+    """
+    i_tmp = (t - t0_data + TAtom // 2) // TAtom - offset
+    # LLVM lowers this clamp to branchless code (sar/andn and cmov)
+    return min(max(i_tmp, 0), numAtoms - 1)
+
+
+@numba.njit(cache=True, error_model="numpy")
+def compute_fstat_from_atom_sums(Ad, Bd, Cd, Fa_re, Fa_im, Fb_re, Fb_im):
+    """F-statistic (not 2F!) from summed atoms over a transient window.
+
+    Follows the safety checks from
+    XLALComputeAntennaPatternSqrtDeterminant()
+    and estimateAntennaPatternConditionNumber(),
+    including the default fallback F=2 (=0.5*E[2F] in noise)
+    when the antenna-pattern matrix is ill-conditioned.
+    """
+    sumAB = Ad + Bd
+    diffAB = Ad - Bd
+    disc = np.sqrt(diffAB * diffAB + 4.0 * Cd * Cd)
+    denom = sumAB - disc
+    cond = (sumAB + disc) / denom if denom > 0 else np.inf
+    DdInv = 1.0 / (Ad * Bd - Cd * Cd) if cond < 1e4 else 0.0
+    if DdInv > 0:
+        return DdInv * (
+            Bd * (Fa_re * Fa_re + Fa_im * Fa_im)
+            + Ad * (Fb_re * Fb_re + Fb_im * Fb_im)
+            - 2.0 * Cd * (Fa_re * Fb_re + Fa_im * Fb_im)
+        )
+    return 2.0
+
+
+@numba.njit(cache=True, error_model="numpy")
+def cumulative_atom_sums(atoms):
+    """Prefix sums over timestamps of each atoms quantity.
+
+    Returns a float64 array `S` of shape `(nQuantities, numAtoms+1)`
+    with `S[:, 0] = 0`, so that the sum over atoms `[lo, hi)`
+    is `S[:, hi] - S[:, lo]`.
+    Accumulating in double precision keeps these differences accurate
+    even for single-precision atoms.
+    """
+    nQuantities, numAtoms = atoms.shape
+    S = np.zeros((nQuantities, numAtoms + 1), dtype=np.float64)
+    for k in range(nQuantities):
+        for i in range(numAtoms):
+            S[k, i + 1] = S[k, i] + atoms[k, i]
+    return S
+
+
+@numba.njit(cache=True, parallel=True, error_model="numpy")
+def transient_fstat_map_rect(
+    atoms,
+    TAtom,
+    t0_data,
+    win_t0,
+    win_dt0,
+    win_tau,
+    win_dtau,
+    N_t0Range,
+    N_tauRange,
+):
+    """F_mn map for rectangular windows.
+
+    The atoms are cumulatively summed once,
+    so that the sums over each window [t0, t0+tau]
+    are just differences of two prefix sums,
+    independent of the window length.
+    For the common case of `dtau` being a multiple of `TAtom`
+    (e.g. the default `dtau=Tsft`),
+    the window end index just advances by a fixed step along each row,
+    saving an integer division per map entry.
+
+    Parameters
+    ----------
+    atoms: np.ndarray
+        A C-contiguous 2D float32 array with rows
+        `[a2_alpha, b2_alpha, ab_alpha, Fa_re, Fa_im, Fb_re, Fb_im]`
+        over (merged, binned) atoms timestamps,
+        i.e. each atoms quantity is contiguous in memory
+        (the transpose of the column-stacked matrix sent to the GPU).
+    TAtom, t0_data: int
+        Atoms time base and first atoms timestamp.
+    win_t0, win_dt0, win_tau, win_dtau: int
+        Window range parameters as in `lalpulsar.transientWindowRange_t`.
+    N_t0Range, N_tauRange: int
+        Size of the output map.
+
+    Returns
+    -------
+    F_mn: np.ndarray
+        A 2D array of F values (not 2F!) over the `[t0,tau]` range.
+    """
+    numAtoms = atoms.shape[1]
+    S = cumulative_atom_sums(atoms)
+    F_mn = np.empty((N_t0Range, N_tauRange), dtype=np.float32)
+    tau_step = win_dtau // TAtom if win_dtau % TAtom == 0 else 0
+    for m in numba.prange(N_t0Range):
+        t0 = win_t0 + m * win_dt0
+        i_t0 = _get_atom_index(t0, t0_data, TAtom, 0, numAtoms)
+        # unclamped end index of the shortest window
+        i_t1_first = (t0 + win_tau - t0_data + TAtom // 2) // TAtom - 1
+        for n in range(N_tauRange):
+            if tau_step > 0:
+                i_t1 = min(max(i_t1_first + n * tau_step, 0), numAtoms - 1)
+            else:
+                t1 = t0 + win_tau + n * win_dtau
+                i_t1 = _get_atom_index(t1, t0_data, TAtom, 1, numAtoms)
+            # sum over [i_t0, i_t1], empty if the window ends before t0
+            hi = max(i_t0, i_t1 + 1)
+            F_mn[m, n] = compute_fstat_from_atom_sums(
+                S[0, hi] - S[0, i_t0],
+                S[1, hi] - S[1, i_t0],
+                S[2, hi] - S[2, i_t0],
+                S[3, hi] - S[3, i_t0],
+                S[4, hi] - S[4, i_t0],
+                S[5, hi] - S[5, i_t0],
+                S[6, hi] - S[6, i_t0],
+            )
+    return F_mn
+
+
+@numba.njit(cache=True, parallel=True, error_model="numpy")
+def transient_fstat_map_exp(
+    atoms,
+    TAtom,
+    t0_data,
+    win_t0,
+    win_dt0,
+    win_tau,
+    win_dtau,
+    N_t0Range,
+    N_tauRange,
+):
+    """F_mn map for exponential windows.
+
+    The window is truncated after `TRANSIENT_EXP_EFOLDING` e-folding times,
+    like in lalpulsar.
+    Unlike lalpulsar, the exponential is computed exactly
+    instead of using a lookup table.
+
+    See `transient_fstat_map_rect()` for the parameters.
+    """
+    numAtoms = atoms.shape[1]
+    F_mn = np.empty((N_t0Range, N_tauRange), dtype=np.float32)
+    for m in numba.prange(N_t0Range):
+        t0 = win_t0 + m * win_dt0
+        i_t0 = _get_atom_index(t0, t0_data, TAtom, 0, numAtoms)
+        for n in range(N_tauRange):
+            tau = win_tau + n * win_dtau
+            t1 = t0 + TRANSIENT_EXP_EFOLDING * tau
+            i_t1 = _get_atom_index(t1, t0_data, TAtom, 1, numAtoms)
+            Ad = 0.0
+            Bd = 0.0
+            Cd = 0.0
+            Fa_re = 0.0
+            Fa_im = 0.0
+            Fb_re = 0.0
+            Fb_im = 0.0
+            for i in range(i_t0, i_t1 + 1):
+                t_i = t0_data + i * TAtom
+                win_i = 0.0
+                if t_i >= t0 and t_i <= t1:
+                    win_i = np.exp(-1.0 * (t_i - t0) / tau)
+                win2_i = win_i * win_i
+                Ad += atoms[0, i] * win2_i
+                Bd += atoms[1, i] * win2_i
+                Cd += atoms[2, i] * win2_i
+                Fa_re += atoms[3, i] * win_i
+                Fa_im += atoms[4, i] * win_i
+                Fb_re += atoms[5, i] * win_i
+                Fb_im += atoms[6, i] * win_i
+            F_mn[m, n] = compute_fstat_from_atom_sums(
+                Ad, Bd, Cd, Fa_re, Fa_im, Fb_re, Fb_im
+            )
+    return F_mn
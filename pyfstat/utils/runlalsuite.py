@@ -1,5 +1,8 @@
+import functools
 import logging
 import os
+import shlex
+import threading
 
 import lal
 import lalpulsar
@@ -9,6 +12,28 @@ from .cli import run_commandline
 
 logger = logging.getLogger(__name__)
 
+# per-thread scratch lalpulsar.PulsarSpinRange, see _get_scratch_spin_range()
+_scratch = threading.local()
+
+# PyFstat to lalpulsar parameter names, as used by translate_keys_to_lal()
+_LAL_KEY_TRANSLATION = {"F0": "Freq"}
+_LAL_KEY_TRANSLATION.update(
+    {f"F{k + 1}": f"f{k + 1}dot" for k in range(lalpulsar.PULSAR_MAX_SPINS - 1)}
+)
+_LAL_KEY_TRANSLATION.update(
+    {
+        "phi": "phi0",
+        "tref": "refTime",
+        "asini": "orbitasini",
+        "period": "orbitPeriod",
+        "tp": "orbitTp",
+        "argp": "orbitArgp",
+        "ecc": "orbitEcc",
+        "transient_tstart": "transient-t0Epoch",
+        "transient_duration": "transient-tau",
+    }
+)
+
 
 def get_covering_band(
     tref,
@@ -31,11 +56,11 @@ def get_covering_band(
 
     Parameters
     ----------
-    tref: int
+    tref: int or lal.LIGOTimeGPS
         Reference time (in GPS seconds) for the signal parameters.
-    tstart: int
+    tstart: int or lal.LIGOTimeGPS
         Start time (in GPS seconds) for the signal evolution to consider.
-    tend: int
+    tend: int or lal.LIGOTimeGPS
         End time (in GPS seconds) for the signal evolution to consider.
     fkdot: list
         Minimum frequency and spin-downs of signals to be covered.
@@ -54,12 +79,67 @@ def get_covering_band(
         Estimates of the minimum and maximum frequencies of the signals
         from the given parameter ranges over the `[tstart,tend]` duration.
     """
-    tref = lal.LIGOTimeGPS(tref)
-    tstart = lal.LIGOTimeGPS(tstart)
-    tend = lal.LIGOTimeGPS(tend)
-    psr = lalpulsar.PulsarSpinRange()
-    psr.fkdot = fkdot
-    psr.fkdotBand = fkdotBand
+    return _get_covering_band_cached(
+        _as_gps_tuple(tref),
+        _as_gps_tuple(tstart),
+        _as_gps_tuple(tend),
+        _as_hashable(fkdot),
+        _as_hashable(fkdotBand),
+        maxOrbitAsini,
+        minOrbitPeriod,
+        maxOrbitEcc,
+    )
+
+
+def _get_scratch_spin_range():
+    """Get a reusable lalpulsar.PulsarSpinRange for the current thread.
+
+    All of its fields have to be set again before each use.
+    """
+    psr = getattr(_scratch, "psr", None)
+    if psr is None:
+        psr = _scratch.psr = lalpulsar.PulsarSpinRange()
+    return psr
+
+
+def _as_hashable(x):
+    """Turn an array-like into a tuple, so it can be part of a cache key."""
+    return float(x) if np.ndim(x) == 0 else tuple(np.ravel(x).tolist())
+
+
+def _as_gps_tuple(t):
+    """Turn a GPS time into an immutable `(gpsSeconds, gpsNanoSeconds)` cache key.
+
+    lal.LIGOTimeGPS objects are mutable, so they cannot be cache keys themselves.
+    """
+    if not isinstance(t, lal.LIGOTimeGPS):
+        t = lal.LIGOTimeGPS(t)
+    return t.gpsSeconds, t.gpsNanoSeconds
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_covering_band_cached(
+    tref,
+    tstart,
+    tend,
+    fkdot,
+    fkdotBand,
+    maxOrbitAsini,
+    minOrbitPeriod,
+    maxOrbitEcc,
+):
+    """Cached implementation of `get_covering_band()`.
+
+    The same ranges are typically requested many times,
+    e.g. by repeatedly set up search objects,
+    so the lalpulsar call is only made once per distinct input.
+    The times have to be given as `(gpsSeconds, gpsNanoSeconds)` tuples,
+    and `fkdot` and `fkdotBand` as floats or tuples.
+    """
+    tref, tstart, tend = [lal.LIGOTimeGPS(*t) for t in (tref, tstart, tend)]
+    psr = _get_scratch_spin_range()
+    psr.fkdot = np.array(fkdot)
+    psr.fkdotBand = np.array(fkdotBand)
     psr.refTime = tref
     minCoverFreq, maxCoverFreq = lalpulsar.CWSignalCoveringBand(
         tstart, tend, psr, maxOrbitAsini, minOrbitPeriod, maxOrbitEcc
@@ -109,7 +189,7 @@ def generate_loudest_file(
         multiple patterns can be given separated by colons.
     minStartTime, maxStartTime: int or None
         GPS seconds of the start time and end time;
-        default: use al available data.
+        default: use all available data.
     transientWindowType: str or None
         optional: transient window type,
         needs to go with t0 and tau parameters inside max_params.
@@ -123,25 +203,60 @@ def generate_loudest_file(
     loudest_file: str
         The filename of the CFSv2 output file.
     """
-    logging.info(f"Running CFSv2 to get .loudest file with max_params={max_params} ...")
-    if np.any(
-        [key in max_params for key in ["delta_F0", "delta_F1", "tglitch"]]
-    ):  # pragma: no cover
-        raise RuntimeError("CFSv2 --outputLoudest cannot deal with glitch parameters.")
+    run_loudest = make_loudest_runner(
+        sftfilepattern=sftfilepattern,
+        minStartTime=minStartTime,
+        maxStartTime=maxStartTime,
+        transientWindowType=transientWindowType,
+        earth_ephem=earth_ephem,
+        sun_ephem=sun_ephem,
+    )
+    return run_loudest(max_params, tref, outdir, label)
+
+
+def make_loudest_runner(
+    sftfilepattern,
+    minStartTime=None,
+    maxStartTime=None,
+    transientWindowType=None,
+    earth_ephem=None,
+    sun_ephem=None,
+):
+    """Prepare repeated `generate_loudest_file()` calls on the same data.
+
+    The commandline arguments that only depend on the data and options
+    are formatted once,
+    so that e.g. follow-up stages producing .loudest files
+    for many parameter-space points only format the points themselves.
+
+    Parameters
+    ----------
+    sftfilepattern: str
+        Pattern to match SFTs using wildcards (`*?`) and ranges [0-9];
+        multiple patterns can be given separated by colons.
+    minStartTime, maxStartTime: int or None
+        GPS seconds of the start time and end time;
+        default: use all available data.
+    transientWindowType: str or None
+        optional: transient window type,
+        needs to go with t0 and tau parameters inside max_params.
+    earth_ephem: str or None
+        optional: user-set Earth ephemeris file
+    sun_ephem: str or None
+        optional: user-set Sun ephemeris file
+
+    Returns
+    -------
+    run_loudest: callable
+        A function `run_loudest(max_params, tref, outdir, label)`
+        taking the remaining arguments of `generate_loudest_file()`
+        and returning the filename of the CFSv2 output file.
+    """
     if transientWindowType:
         logger.warning(
             "CFSv2 --outputLoudest always reports the maximum of the"
             " standard CW 2F-statistic, not the transient max2F."
         )
-
-    loudest_file = os.path.join(outdir, label + ".loudest")
-    cmd = "lalpulsar_ComputeFstatistic_v2"
-    CFSv2_params = {
-        "DataFiles": f'"{sftfilepattern}"',
-        "outputLoudest": loudest_file,
-        "refTime": tref,
-    }
-    CFSv2_params.update(max_params)
     opt_params = {
         "minStartTime": minStartTime,
         "maxStartTime": maxStartTime,
@@ -149,11 +264,41 @@ def generate_loudest_file(
         "ephemEarth": earth_ephem,
         "ephemSun": sun_ephem,
     }
-    CFSv2_params.update({key: val for key, val in opt_params.items() if val})
-    cmd += " " + " ".join([f"--{key}={val}" for key, val in CFSv2_params.items()])
+    opt_params = {key: val for key, val in opt_params.items() if val}
+    # the optional arguments are the same for every call, so format them once
+    static_args = shlex.join([f"--{key}={val}" for key, val in opt_params.items()])
 
-    run_commandline(cmd, return_output=False)
-    return loudest_file
+    def run_loudest(max_params, tref, outdir, label):
+        logger.info(
+            f"Running CFSv2 to get .loudest file with max_params={max_params} ..."
+        )
+        if np.any(
+            [key in max_params for key in ["delta_F0", "delta_F1", "tglitch"]]
+        ):  # pragma: no cover
+            raise RuntimeError(
+                "CFSv2 --outputLoudest cannot deal with glitch parameters."
+            )
+        loudest_file = os.path.join(outdir, label + ".loudest")
+        CFSv2_params = {
+            "DataFiles": sftfilepattern,
+            "outputLoudest": loudest_file,
+            "refTime": tref,
+        }
+        CFSv2_params.update(max_params)
+        # quote each argument, so that e.g. wildcards or spaces in the SFT pattern
+        # are passed on to CFSv2 instead of being expanded by the shell;
+        # the options take precedence, as they did when merged into one dict
+        argv = ["lalpulsar_ComputeFstatistic_v2"]
+        argv += [
+            f"--{key}={val}"
+            for key, val in CFSv2_params.items()
+            if key not in opt_params
+        ]
+        cmd = " ".join([shlex.join(argv), static_args]).rstrip()
+        run_commandline(cmd, return_output=False)
+        return loudest_file
+
+    return run_loudest
 
 
 def translate_keys_to_lal(dictionary):
@@ -178,27 +323,4 @@ def translate_keys_to_lal(dictionary):
         Copy of "dictionary" with new keys according to lalpulsar convention.
     """
 
-    translation = {"F0": "Freq"}
-    translation.update(
-        {f"F{k + 1}": f"f{k + 1}dot" for k in range(lalpulsar.PULSAR_MAX_SPINS - 1)}
-    )
-    translation.update(
-        {
-            "phi": "phi0",
-            "tref": "refTime",
-            "asini": "orbitasini",
-            "period": "orbitPeriod",
-            "tp": "orbitTp",
-            "argp": "orbitArgp",
-            "ecc": "orbitEcc",
-            "transient_tstart": "transient-t0Epoch",
-            "transient_duration": "transient-tau",
-        }
-    )
-
-    keys_to_translate = [key for key in dictionary.keys() if key in translation]
-
-    translated_dict = dictionary.copy()
-    for key in keys_to_translate:
-        translated_dict[translation[key]] = translated_dict.pop(key)
-    return translated_dict
+    return {_LAL_KEY_TRANSLATION.get(key, key): val for key, val in dictionary.items()}
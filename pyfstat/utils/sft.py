@@ -1,13 +1,17 @@
+import glob
 import logging
 import os
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 import lal
 import lalpulsar
-import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 
+from .importing import safe_X_less_plt
+
+if TYPE_CHECKING:
+    import matplotlib
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +20,7 @@ def get_sft_as_arrays(
     fMin: Optional[float] = None,
     fMax: Optional[float] = None,
     constraints: Optional[lalpulsar.SFTConstraints] = None,
+    use_memmap: bool = False,
 ) -> Tuple[np.ndarray, Dict, Dict]:
     """
     Read binary SFT files into NumPy arrays.
@@ -31,6 +36,15 @@ def get_sft_as_arrays(
     constraints:
         Constrains to be fed into XLALSFTdataFind to specify detector,
         GPS time range or timestamps to be retrieved.
+    use_memmap:
+        If True, memory-map the SFT files and read the amplitudes
+        directly from there, instead of loading them through lalpulsar.
+        Where all SFTs of a detector are evenly spaced in a single file,
+        as written by `Writer`, its array is a read-only view of the file
+        without any copy;
+        otherwise the SFTs are copied from the mapped files.
+        Falls back to the default loader if the files cannot be mapped,
+        or their SFTs cannot be matched to the catalog.
 
     Returns
     ----------
@@ -42,8 +56,9 @@ def get_sft_as_arrays(
         Keys correspond to the official detector names as returned by
         lalpulsar.ListIFOsInCatalog.
     data: Dict
-        A dictionary of 2D arrays of the complex Fourier amplitudes of the SFT data
-        for each detector in each frequency bin at each timestamp.
+        A dictionary of 2D complex64 arrays of the Fourier amplitudes of the SFT data
+        for each detector in each frequency bin at each timestamp,
+        of shape `(nbins, nsfts)` with each SFT contiguous in memory.
         Keys correspond to the official detector names as returned by
         lalpulsar.ListIFOsInCatalog.
     """
@@ -53,43 +68,249 @@ def get_sft_as_arrays(
         fMin = fMax = -1
     elif fMin is None or fMax is None:
         raise ValueError("Need either none or both of fMin, fMax.")
+    elif fMin > fMax:
+        raise ValueError(f"Need fMin <= fMax, got fMin={fMin}, fMax={fMax}.")
 
     sft_catalog = lalpulsar.SFTdataFind(sftfilepattern, constraints)
+    if fMin >= 0 or fMax >= 0:
+        _check_frequency_range(sft_catalog, fMin, fMax)
     ifo_labels = lalpulsar.ListIFOsInCatalog(sft_catalog)
 
     logger.info(
         f"Loading {sft_catalog.length} SFTs from {', '.join(ifo_labels.data)}..."
     )
-    multi_sfts = lalpulsar.LoadMultiSFTs(sft_catalog, fMin, fMax)
+    per_ifo = None
+    if use_memmap:
+        try:
+            per_ifo = _get_sfts_with_memmap(
+                sftfilepattern, sft_catalog, ifo_labels.data, fMin, fMax
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Could not memory-map SFTs ({e}),"
+                " falling back to lalpulsar.LoadMultiSFTs()."
+            )
+    if per_ifo is None:
+        multi_sfts = lalpulsar.LoadMultiSFTs(sft_catalog, fMin, fMax)
+        per_ifo = [_get_sfts_from_lal(sfts) for sfts in multi_sfts.data]
     logger.debug("done!")
 
     times = {}
     amplitudes = {}
 
-    old_frequencies = None
+    old_bins = None
     for ind, ifo in enumerate(ifo_labels.data):
-        sfts = multi_sfts.data[ind]
+        times[ifo], amplitudes[ifo], bins = per_ifo[ind]
+        logger.debug(f"{len(times[ifo])} retrieved from {ifo}.")
+
+        # the frequency bins are fully determined by (f0, df, nbins),
+        # so comparing them between detectors is enough
+        if (old_bins is not None) and bins != old_bins:
+            raise ValueError(
+                f"Frequencies don't match between {ifo_labels.data[ind - 1]} and {ifo}"
+            )
+        old_bins = bins
 
-        times[ifo] = np.array([sft.epoch.gpsSeconds for sft in sfts.data])
-        amplitudes[ifo] = np.array([sft.data.data for sft in sfts.data]).T
+    f0, df, nbins = old_bins
+    frequencies = f0 + df * np.arange(nbins)
 
-        nbins, nsfts = amplitudes[ifo].shape
+    return frequencies, times, amplitudes
 
-        logger.debug(f"{nsfts} retrieved from {ifo}.")
 
-        f0 = sfts.data[0].f0
-        df = sfts.data[0].deltaF
-        frequencies = np.linspace(f0, f0 + (nbins - 1) * df, nbins)
+def _check_frequency_range(sft_catalog, fMin, fMax):
+    """Check that all SFTs in a catalog cover the requested `[fMin, fMax]`.
 
-        if (old_frequencies is not None) and not np.allclose(
-            frequencies, old_frequencies
-        ):
+    This only looks at the catalog headers,
+    so that misconfigured ranges fail before any data is loaded
+    (which `XLALLoadSFTs()` would only notice per SFT, after some I/O).
+    The bin range follows `XLALLoadSFTs()`.
+    """
+    bands = {
+        (desc.header.f0, desc.header.deltaF, desc.numBins) for desc in sft_catalog.data
+    }
+    for f0, df, numBins in bands:
+        firstbin = lalpulsar.RoundFrequencyDownToSFTBin(fMin, df)
+        lastbin = lalpulsar.RoundFrequencyUpToSFTBin(fMax, df)
+        sft_firstbin = int(round(f0 / df))
+        if firstbin < sft_firstbin or lastbin > sft_firstbin + numBins:
             raise ValueError(
-                f"Frequencies don't match between {ifo_labels.data[ind - 1]} and {ifo}"
+                f"Requested frequency range [{fMin}, {fMax}] Hz"
+                f" is not covered by SFTs with [{f0}, {f0 + numBins * df}] Hz."
             )
-        old_frequencies = frequencies
 
-    return frequencies, times, amplitudes
+
+def _get_sfts_from_lal(sfts):
+    """Convert a lalpulsar.SFTVector into times, amplitudes and frequency bins."""
+    # fill preallocated arrays directly,
+    # instead of stacking a list of per-SFT arrays and transposing that;
+    # in Fortran order, each SFT is a contiguous column
+    # (like in the files, and the memory-mapped arrays),
+    # which makes filling it several times faster than for row-major order
+    nsfts = sfts.length
+    nbins = sfts.data[0].data.length
+    times = np.empty(nsfts, dtype=np.int64)
+    amplitudes = np.empty((nbins, nsfts), dtype=np.complex64, order="F")
+    # reading the epochs in the same pass is faster than a separate
+    # np.fromiter() or lalpulsar.ExtractTimestampsFromSFTs() call
+    for j, sft in enumerate(sfts.data):
+        times[j] = sft.epoch.gpsSeconds
+        amplitudes[:, j] = sft.data.data
+    return times, amplitudes, (sfts.data[0].f0, sfts.data[0].deltaF, nbins)
+
+
+# binary header of each SFT block in a (version 2 or 3) SFT file,
+# followed by the comment and then the COMPLEX8 frequency bins
+_SFT_HEADER_DTYPE = np.dtype(
+    [
+        ("version", "f8"),
+        ("gps_sec", "i4"),
+        ("gps_nsec", "i4"),
+        ("tbase", "f8"),
+        ("first_frequency_index", "i4"),
+        ("nsamples", "i4"),
+        ("crc64", "u8"),
+        ("detector", "S2"),
+        ("windowspec", "u2"),
+        ("comment_length", "i4"),
+    ]
+)
+
+
+def _get_sft_blocks(fname):
+    """Byte offsets and headers of all SFT blocks in a (version 2 or 3) SFT file.
+
+    Returns
+    -------
+    fmap: np.memmap
+        The whole file, memory-mapped as bytes.
+    blocks: dict
+        `(fname, offset, header)` for each block,
+        keyed by `(detector, gps_sec, gps_nsec)`.
+    """
+    fmap = np.memmap(fname, dtype=np.uint8, mode="r")
+    blocks = {}
+    offset = 0
+    while offset < len(fmap):
+        header = fmap[offset : offset + _SFT_HEADER_DTYPE.itemsize]
+        if len(header) < _SFT_HEADER_DTYPE.itemsize:
+            raise ValueError(f"Truncated SFT header in {fname} at byte {offset}.")
+        header = header.view(_SFT_HEADER_DTYPE)[0]
+        if header["version"] not in [2.0, 3.0]:
+            raise ValueError(
+                f"Unsupported SFT version or byte order in {fname} at byte {offset}."
+            )
+        key = (
+            header["detector"].decode(),
+            int(header["gps_sec"]),
+            int(header["gps_nsec"]),
+        )
+        if key in blocks:
+            # lalpulsar can stitch together SFTs split over several blocks
+            raise ValueError(f"SFT {key} is split over several blocks in {fname}.")
+        blocks[key] = (fname, offset, header)
+        offset += (
+            _SFT_HEADER_DTYPE.itemsize
+            + int(header["comment_length"])
+            + int(header["nsamples"]) * np.dtype(np.complex64).itemsize
+        )
+    return fmap, blocks
+
+
+def _get_sfts_with_memmap(sftfilepattern, sft_catalog, ifos, fMin, fMax):
+    """Memory-mapped alternative to loading SFTs with `lalpulsar.LoadMultiSFTs()`.
+
+    The SFT files matching the pattern are walked block by block
+    to find the file and byte offset of each SFT in the catalog,
+    and its header is parsed here to find the requested bins.
+    (The catalog's own locators are opaque lalpulsar structs
+    that cannot be safely accessed from Python.)
+    The bin range for given `fMin, fMax` follows `XLALLoadSFTs()`.
+
+    Returns
+    -------
+    per_ifo: list
+        A `(times, amplitudes, (f0, df, nbins))` tuple for each detector.
+    """
+    maps = {}
+    file_blocks = {}
+    for pattern in sftfilepattern.split(";"):
+        if pattern.startswith("list:"):
+            raise ValueError("List files of SFTs are not supported.")
+        for fname in sorted(glob.glob(os.path.expanduser(pattern))):
+            fname = os.path.abspath(fname)
+            if fname in maps:
+                continue
+            maps[fname], these_blocks = _get_sft_blocks(fname)
+            if not file_blocks.keys().isdisjoint(these_blocks):
+                raise ValueError(f"Some SFTs in {fname} are also in other files.")
+            file_blocks.update(these_blocks)
+
+    blocks = {ifo: [] for ifo in ifos}
+    for desc in sft_catalog.data:
+        epoch = desc.header.epoch
+        key = (desc.header.name, epoch.gpsSeconds, epoch.gpsNanoSeconds)
+        if key not in file_blocks:
+            raise ValueError(f"Could not find SFT {key} in the matching files.")
+        blocks[desc.header.name].append(file_blocks[key])
+
+    per_ifo = []
+    for ifo in ifos:
+        nsfts = len(blocks[ifo])
+        times = np.fromiter(
+            (block[2]["gps_sec"] for block in blocks[ifo]),
+            dtype=np.int64,
+            count=nsfts,
+        )
+        data_offsets = np.empty(nsfts, dtype=np.int64)
+        for j, (fname, offset, header) in enumerate(blocks[ifo]):
+            df = 1.0 / header["tbase"]
+            if fMin < 0 and fMax < 0:
+                firstbin = int(header["first_frequency_index"])
+                nbins = int(header["nsamples"])
+            else:
+                firstbin = lalpulsar.RoundFrequencyDownToSFTBin(fMin, df)
+                nbins = lalpulsar.RoundFrequencyUpToSFTBin(fMax, df) - firstbin
+            skip = firstbin - header["first_frequency_index"]
+            if j == 0:
+                bins = (firstbin * df, df, nbins)
+            elif (firstbin * df, df, nbins) != bins:
+                raise ValueError(f"Inconsistent frequency bins in {ifo} SFTs.")
+            if nbins <= 0 or skip < 0 or skip + nbins > header["nsamples"]:
+                raise ValueError(
+                    f"Requested frequency range not covered by {fname}"
+                    f" at byte {offset}."
+                )
+            data_offsets[j] = (
+                offset
+                + _SFT_HEADER_DTYPE.itemsize
+                + header["comment_length"]
+                + skip * np.dtype(np.complex64).itemsize
+            )
+        files = {block[0] for block in blocks[ifo]}
+        strides = np.diff(data_offsets)
+        if len(files) == 1 and (nsfts == 1 or np.all(strides == strides[0])):
+            # a strided (nbins, nsfts) view straight into the mapped file
+            amplitudes = np.ndarray(
+                shape=(nbins, nsfts),
+                dtype=np.complex64,
+                buffer=maps[files.pop()],
+                offset=data_offsets[0],
+                strides=(
+                    np.dtype(np.complex64).itemsize,
+                    strides[0] if nsfts > 1 else 0,
+                ),
+            )
+        else:
+            amplitudes = np.empty((nbins, nsfts), dtype=np.complex64, order="F")
+            for j, (fname, _, _) in enumerate(blocks[ifo]):
+                amplitudes[:, j] = np.ndarray(
+                    shape=(nbins,),
+                    dtype=np.complex64,
+                    buffer=maps[fname],
+                    offset=data_offsets[j],
+                )
+        per_ifo.append((times, amplitudes, bins))
+    return per_ifo
 
 
 def get_commandline_from_SFTDescriptor(descriptor):
@@ -114,7 +335,8 @@ def get_commandline_from_SFTDescriptor(descriptor):
         or an empty string if no match in comment.
     """
     comment = getattr(descriptor, "comment", None)
-    if comment is None:
+    # most comments have no commandline at all, no need to split those
+    if not comment or ("lalpulsar" not in comment and "lalapps" not in comment):
         return ""
     comment_lines = comment.split("\n")
     # get the first line with the right substring
@@ -230,6 +452,27 @@ def get_sft_constraints_from_tstart_duration(
     return SFTConstraint
 
 
+def _get_sft_power(fourier_data):
+    """SFT power as a single pass over the complex data, squared in place.
+
+    A numba kernel would only be about 1.5x faster for this,
+    far from paying off its import and JIT-cache loading for one plot.
+    """
+    power = np.abs(fourier_data)
+    power *= power
+    return power
+
+
+# supported `plot_spectrogram()` quantities:
+# (function of the SFT data, plot title, colorbar label)
+_SPECTROGRAM_QUANTITIES = {
+    "power": (_get_sft_power, None, "Power"),
+    "normpower": (_get_sft_power, None, "Normalized power"),
+    "real": (np.real, "SFT real part", "Fourier amplitude"),
+    "imag": (np.imag, "SFT imaginary part", "Fourier amplitude"),
+}
+
+
 def plot_spectrogram(
     sftfilepattern: str,
     detector: str,
@@ -243,7 +486,7 @@ def plot_spectrogram(
     constraints: Optional[lalpulsar.SFTConstraints] = None,
     figsize: Optional[Tuple] = (16, 9),
     **kwargs,
-) -> matplotlib.axes.Axes:
+) -> "matplotlib.axes.Axes":
     """
     Compute spectrograms of a set of SFTs.
     In case the signal contains gaps, these are replaced by "nans", so in the plot they appear in white.
@@ -290,6 +533,13 @@ def plot_spectrogram(
         The axes object containing the plot.
     """
 
+    if quantity not in _SPECTROGRAM_QUANTITIES:
+        raise ValueError(
+            f"Quantity '{quantity}' not accepted. Please, introduce a supported quantity."
+        )
+    if quantity == "normpower" and sqrtSX is None:
+        raise ValueError("Value of sqrtSX needed to compute the normalized power.")
+
     logger.info("Loading SFT data")
     frequency, timestamps, fourier_data = get_sft_as_arrays(
         sftfilepattern, fMin, fMax, constraints
@@ -314,73 +564,56 @@ def plot_spectrogram(
     Tsft = int(round(1.0 / multi_sft_catalog.data[0].data[0].header.deltaF))
     logger.info(f"Extracted Tsft={Tsft}")
 
-    # Fill up gaps with Nans
+    # Fill up gaps with Nans,
+    # placing the SFTs straight into a single buffer of the same (narrow) dtype
+    # instead of stacking a list of columns and transposing that
     gap_length = np.diff(timestamps[detector]) - Tsft
-    gap_data = [fourier_data[detector][:, 0]]
-    gap_timestamps = [timestamps[detector][0]]
-
-    gaps = False
-    for ind, gap in enumerate(gap_length):
-        if gap > 0:
-            gaps = True
-            num_nans = gap // Tsft
-            remainder = gap % Tsft
-
-            for i in range(num_nans):
-                gap_data.append(
-                    np.full_like(fourier_data[detector][:, ind], np.nan + 1j * np.nan)
-                )
-                gap_timestamps.append(timestamps[detector][ind] + (i + 1) * Tsft)
-
-            if remainder > 0:
-                gap_data.append(
-                    np.full_like(fourier_data[detector][:, ind], np.nan + 1j * np.nan)
-                )
-                gap_timestamps.append(
-                    timestamps[detector][ind] + (num_nans * Tsft) + remainder
-                )
-
-        gap_data.append(fourier_data[detector][:, ind + 1])
-        gap_timestamps.append(timestamps[detector][ind + 1])
-
-    if gaps is True:
-        timestamps = {detector: np.hstack(gap_timestamps)}
-        fourier_data = {detector: np.vstack(gap_data).T}
+    # full Tsft gaps plus one more column for any remainder
+    num_nans = np.where(gap_length > 0, -(-gap_length // Tsft), 0)
+    if np.any(num_nans > 0):
+        columns = np.arange(len(timestamps[detector]))
+        columns[1:] += np.cumsum(num_nans)
+        gap_timestamps = np.empty(columns[-1] + 1, dtype=timestamps[detector].dtype)
+        gap_timestamps[columns] = timestamps[detector]
+        gap_data = np.full(
+            (fourier_data[detector].shape[0], len(gap_timestamps)),
+            np.nan + 1j * np.nan,
+            dtype=fourier_data[detector].dtype,
+            order="F",
+        )
+        gap_data[:, columns] = fourier_data[detector]
+        # Nan columns are spaced by Tsft,
+        # except for the remainder column right at the end of the gap
+        for ind in np.flatnonzero(num_nans):
+            t0 = timestamps[detector][ind]
+            gap_timestamps[columns[ind] + 1 : columns[ind + 1]] = np.minimum(
+                t0 + Tsft * np.arange(1, num_nans[ind] + 1), t0 + gap_length[ind]
+            )
+        timestamps = {detector: gap_timestamps}
+        fourier_data = {detector: gap_data}
 
-    # Initialize plot
+    # Initialize plot,
+    # importing pyplot only here since the rest of this module does not need it
+    plt = safe_X_less_plt()
     plt.rcParams["axes.grid"] = False  # turn off the gridlines
     fig, ax = plt.subplots(figsize=figsize)
     ax.set(xlabel="Time [days]", ylabel="Frequency [Hz]")
 
-    time_in_days = (timestamps[detector] - timestamps[detector][0]) / 86400
-
-    if "power" in quantity:
-        logger.info("Computing SFT power")
-        q = fourier_data[detector].real ** 2 + fourier_data[detector].imag ** 2
-        if quantity == "normpower":
-            if sqrtSX is None:  # pragma: no cover
-                raise ValueError(
-                    "Value of sqrtSX needed to compute the normalized power."
-                )
-            q *= 2 / (Tsft * sqrtSX**2)
-            label = "Normalized power"
-        else:
-            label = "Power"
-
-    elif quantity == "real":
-        q = fourier_data[detector].real
-        ax.set_title("SFT real part")
-        label = "Fourier amplitude"
-
-    elif quantity == "imag":
-        q = fourier_data[detector].imag
-        ax.set_title("SFT imaginary part")
-        label = "Fourier amplitude"
+    # single precision is plenty for plotting the time axis,
+    # and the SFT quantities below are already float32 from the complex64 data;
+    # but the frequencies stay in double precision,
+    # as float32 cannot resolve fine bins at high frequencies
+    time_in_days = ((timestamps[detector] - timestamps[detector][0]) / 86400).astype(
+        np.float32
+    )
 
-    else:  # pragma: no cover
-        raise ValueError(
-            f"Quantity '{quantity}' not accepted. Please, introduce a supported quantity."
-        )
+    get_quantity, title, cbar_label = _SPECTROGRAM_QUANTITIES[quantity]
+    logger.info(f"Computing SFT {quantity}")
+    q = get_quantity(fourier_data[detector])
+    if quantity == "normpower":
+        q *= 2 / (Tsft * sqrtSX**2)
+    if title is not None:
+        ax.set_title(title)
 
     if savefig:
         logger.info(f"Plotting to file: {plotfile}")
@@ -393,7 +626,7 @@ def plot_spectrogram(
         cmap=kwargs["cmap"] if "cmap" in kwargs else "inferno_r",
         shading="nearest",
     )
-    fig.colorbar(c, label=label)
+    fig.colorbar(c, label=cbar_label)
     plt.tight_layout()
     if savefig:
         fig.savefig(plotfile)
@@ -59,6 +59,7 @@ extras_require = {
         "mistune==0.8.4",
         "pillow==10.4.0",
     ],
+    "numba": ["numba"],
     "pycuda": ["pycuda"],
     "style": [
         "black",
@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest import mock
 
 import lalpulsar
 import numpy as np
@@ -193,6 +194,38 @@ class TestComputeFstat(BaseForTestsWithData):
         np.isclose(FS_sd, FS, rtol=1e-6, atol=0)
         # FIXME: extend test to properly test Fkdot matches?
 
+    def test_run_computefstatistic_reuse_results_at_same_point(self):
+        search = pyfstat.ComputeFstat(
+            tref=self.tref,
+            minStartTime=self.tstart,
+            maxStartTime=self.tstart + self.duration,
+            detectors=self.detectors,
+            injectSqrtSX=self.sqrtSX,
+            minCoverFreq=self.F0 - 0.1,
+            maxCoverFreq=self.F0 + 0.1,
+        )
+        params = {
+            "F0": self.F0,
+            "F1": self.F1,
+            "F2": self.F2,
+            "Alpha": self.Alpha,
+            "Delta": self.Delta,
+        }
+        params_shifted = {**params, "F0": self.F0 + 1e-5}
+        with mock.patch(
+            "pyfstat.core.lalpulsar.ComputeFstat", wraps=lalpulsar.ComputeFstat
+        ) as ComputeFstat_spy:
+            FS1 = search.get_fullycoherent_twoF(params=params)
+            FS2 = search.get_fullycoherent_twoF(params=params)
+            self.assertEqual(ComputeFstat_spy.call_count, 1)
+            self.assertEqual(FS1, FS2)
+            FS3 = search.get_fullycoherent_twoF(params=params_shifted)
+            self.assertEqual(ComputeFstat_spy.call_count, 2)
+            FS4 = search.get_fullycoherent_twoF(params=params)
+            self.assertEqual(ComputeFstat_spy.call_count, 3)
+        self.assertNotEqual(FS1, FS3)
+        self.assertEqual(FS1, FS4)
+
     def test_run_computefstatistic_single_point_injectSqrtSX_binary(self):
         # not using any SFTs
         search = pyfstat.ComputeFstat(
@@ -953,6 +986,33 @@ class TestSemiCoherentSearch(BaseForTestsWithData):
         )
         self.assertTrue(diff < 0.3)
 
+    def test_semicoherent_twoF_not_reused_as_fullycoherent(self):
+        search = pyfstat.SemiCoherentSearch(
+            label=self.label,
+            outdir=self.outdir,
+            nsegs=self.nsegs,
+            sftfilepattern=self.Writer.sftfilepath,
+            tref=self.Writer.tref,
+            search_ranges=self.search_ranges,
+            BSGL=False,
+        )
+        params = {
+            "F0": self.Writer.F0,
+            "F1": self.Writer.F1,
+            "F2": self.Writer.F2,
+            "Alpha": self.Writer.Alpha,
+            "Delta": self.Writer.Delta,
+        }
+        with mock.patch(
+            "pyfstat.core.lalpulsar.ComputeFstat", wraps=lalpulsar.ComputeFstat
+        ) as ComputeFstat_spy:
+            twoF_coh = search.get_fullycoherent_twoF(params=params)
+            search.get_semicoherent_twoF(params=params)
+            self.assertEqual(ComputeFstat_spy.call_count, 2)
+            # the semi-coherent call overwrote the results at the same point
+            self.assertEqual(search.get_fullycoherent_twoF(params=params), twoF_coh)
+            self.assertEqual(ComputeFstat_spy.call_count, 3)
+
     def _test_get_semicoherent_BSGL(self, **dataopts):
         search_noBSGL = pyfstat.SemiCoherentSearch(
             label=self.label,
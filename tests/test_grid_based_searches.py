@@ -1,3 +1,6 @@
+import glob
+import itertools
+import multiprocessing
 import os
 
 import numpy as np
@@ -29,6 +32,21 @@ class TestGridSearch(BaseForTestsWithData):
                 y0=self.Writer.F1,
                 colorbar=True,
             )
+            ax = self.search.plot_2D(
+                xkey=search_keys[0],
+                ykey=search_keys[1],
+                savefig=False,
+                add_mismatch=(self.Writer.F0, self.Writer.F1, self.Writer.duration),
+            )
+            detstat = self.search.data[self.search.detstat]
+            self.assertTrue(
+                np.array_equal(
+                    np.ravel(ax.collections[0].get_array()),
+                    detstat.reshape(
+                        len(np.unique(self.search.data[search_keys[0]])), -1
+                    ).ravel(),
+                )
+            )
         vals = [
             np.unique(self.search.data[key]) - getattr(self.Writer, key)
             for key in search_keys
@@ -85,9 +103,189 @@ class TestGridSearch(BaseForTestsWithData):
         self.assertTrue(os.path.isfile(self.search.out_file))
         max2F_point = self.search.get_max_twoF()
         self.assertTrue(np.all(max2F_point["twoF"] >= self.search.data["twoF"]))
+        top_k = self.search.get_top_k(5, "twoF")
+        self.assertEqual(len(top_k), 5)
+        self.assertEqual(top_k[0], max2F_point)
+        self.assertTrue(
+            np.array_equal(
+                [cand["twoF"] for cand in top_k],
+                np.sort(self.search.data["twoF"])[::-1][:5],
+            )
+        )
         search_keys = ["F0", "F1"]  # only the ones that aren't 0-width
         self._test_plots(search_keys)
 
+    def test_grid_search_batched_against_single_points(self):
+        self.search = pyfstat.GridSearch(
+            "grid_search_batched",
+            self.outdir,
+            self.Writer.sftfilepath,
+            F0s=self.F0s,
+            F1s=self.F1s,
+            F2s=[self.Writer.F2],
+            Alphas=[self.Writer.Alpha],
+            Deltas=[self.Writer.Delta],
+            tref=self.tref,
+            BSGL=self.BSGL,
+            clean=True,
+        )
+        self.assertTrue(self.search.search.dFreq > 0)
+        data = self.search.run(return_data=True)
+        self.assertEqual(len(data), self.search.total_iterations)
+        for point in data:
+            params = {key: point[key] for key in self.search.search_keys}
+            detstat = self.search.search.get_det_stat(params=params)
+            self.assertTrue(np.isclose(point[self.search.detstat], detstat, rtol=1e-5))
+            self.assertTrue(
+                np.isclose(point["twoF"], self.search.search.twoF, rtol=1e-5)
+            )
+            if self.search.search.singleFstats:
+                for X, IFO in enumerate(self.search.search.detector_names):
+                    self.assertTrue(
+                        np.isclose(
+                            point[f"twoF{IFO}"],
+                            self.search.search.twoFX[X],
+                            rtol=1e-5,
+                        )
+                    )
+
+    def test_grid_search_single_precision_output(self):
+        search_kwargs = dict(
+            label="grid_search_float32",
+            outdir=self.outdir,
+            sftfilepattern=self.Writer.sftfilepath,
+            F0s=self.F0s,
+            F1s=self.F1s,
+            F2s=[self.Writer.F2],
+            Alphas=[self.Writer.Alpha],
+            Deltas=[self.Writer.Delta],
+            tref=self.tref,
+            BSGL=self.BSGL,
+            clean=True,
+        )
+        self.search = pyfstat.GridSearch(**search_kwargs)
+        data_double = self.search.run(return_data=True)
+        self.assertEqual(data_double["twoF"].dtype, np.float64)
+        self.search.fmt_detstat = "%.7g"
+        data_single = self.search.run(return_data=True)
+        for key in self.search.output_keys:
+            if key in self.search.search_keys:
+                self.assertEqual(data_single[key].dtype, np.float64)
+                self.assertTrue(np.array_equal(data_single[key], data_double[key]))
+            else:
+                self.assertEqual(data_single[key].dtype, np.float32)
+                self.assertTrue(
+                    np.allclose(data_single[key], data_double[key], rtol=1e-6)
+                )
+        # results reused from the output file have the same types
+        for reuse in [False, True]:
+            self.search = pyfstat.GridSearch(**{**search_kwargs, "clean": False})
+            self.search.fmt_detstat = "%.7g"
+            if reuse:
+                self.search._get_input_data_array()
+                self.assertIsNot(self.search.check_old_data_is_okay_to_use(), False)
+            self.search.run()
+            self.assertEqual(self.search.data.dtype, data_single.dtype)
+        for key in self.search.output_keys:
+            self.assertTrue(
+                np.allclose(self.search.data[key], data_single[key], rtol=1e-6)
+            )
+
+    def test_grid_search_with_pool(self):
+        search_kwargs = dict(
+            label="grid_search_pool",
+            outdir=self.outdir,
+            sftfilepattern=self.Writer.sftfilepath,
+            F0s=self.F0s,
+            F1s=self.F1s,
+            F2s=[self.Writer.F2],
+            Alphas=[self.Writer.Alpha],
+            Deltas=[self.Writer.Delta],
+            tref=self.tref,
+            BSGL=self.BSGL,
+            clean=True,
+        )
+        self.search = pyfstat.GridSearch(**search_kwargs)
+        self.search.batch_size = 7
+        data_serial = self.search.run(return_data=True)
+        self.assertGreater(len(self.search._get_batches()), 2)
+        with multiprocessing.Pool(2) as pool:
+            data_pool = self.search.run(return_data=True, pool=pool)
+        for key in self.search.output_keys:
+            self.assertTrue(np.array_equal(data_pool[key], data_serial[key]))
+        # the grid points travel with each batch, not with the search
+        state = self.search.__getstate__()
+        for key in ["search", "data", "input_data", "coord_arrays"]:
+            self.assertNotIn(key, state)
+        # a different search with the same label, sharing the same pool,
+        # must not reuse the first search's objects in the workers
+        search_kwargs["maxStartTime"] = self.tstart + self.duration // 2
+        other_search = pyfstat.GridSearch(**search_kwargs)
+        other_search.batch_size = 7
+        other_serial = other_search.run(return_data=True)
+        self.assertFalse(np.array_equal(other_serial["twoF"], data_serial["twoF"]))
+        with multiprocessing.Pool(2) as pool:
+            self.search.run(return_data=True, pool=pool)
+            other_pool = other_search.run(return_data=True, pool=pool)
+        for key in other_search.output_keys:
+            self.assertTrue(np.array_equal(other_pool[key], other_serial[key]))
+
+    def test_grid_search_reuse_old_data(self):
+        search_kwargs = dict(
+            label="grid_search_reuse",
+            outdir=self.outdir,
+            sftfilepattern=self.Writer.sftfilepath,
+            F0s=self.F0s,
+            F1s=self.F1s,
+            F2s=[self.Writer.F2],
+            Alphas=[self.Writer.Alpha],
+            Deltas=[self.Writer.Delta],
+            tref=self.tref,
+            BSGL=self.BSGL,
+        )
+        self.search = pyfstat.GridSearch(**search_kwargs)
+        self.search.run()
+        # output file should be as if written directly by np.savetxt
+        savetxt_file = os.path.join(self.outdir, "grid_search_reuse_savetxt.txt")
+        np.savetxt(
+            savetxt_file,
+            np.nan_to_num(self.search.data),
+            delimiter=" ",
+            header="\n".join(
+                self.search.output_file_header + [" ".join(self.search.output_keys)]
+            ),
+            fmt=self.search._get_savetxt_fmt_list(),
+        )
+        with open(self.search.out_file) as f1, open(savetxt_file) as f2:
+            self.assertEqual(f1.read(), f2.read())
+        grid = self.search.input_data
+        product = np.array(
+            list(itertools.product(*self.search.coord_arrays)), dtype=grid.dtype
+        )
+        self.assertEqual(len(grid), len(product))
+        for key in self.search.search_keys:
+            self.assertTrue(np.array_equal(grid[key], product[key]))
+        self.assertTrue(np.array_equal(np.asarray(grid), product))
+        # same setup: old data should be reused
+        search2 = pyfstat.GridSearch(**search_kwargs)
+        search2._get_input_data_array()
+        old_data = search2.check_old_data_is_okay_to_use()
+        self.assertIsNot(old_data, False)
+        genfromtxt_data = pyfstat.utils.read_txt_file_with_header(self.search.out_file)
+        self.assertEqual(old_data.dtype.names, genfromtxt_data.dtype.names)
+        for key in old_data.dtype.names:
+            self.assertTrue(np.array_equal(old_data[key], genfromtxt_data[key]))
+        self.assertTrue(np.allclose(old_data["twoF"], self.search.data["twoF"]))
+        # same grid points in different order must not be reused
+        shuffled = old_data.copy()
+        shuffled[["F0", "F1"]] = old_data[::-1][["F0", "F1"]]
+        rtol, atol = search2._get_tolerance_from_savetxt_fmt()
+        self.assertFalse(search2.input_data.matches(shuffled, rtol, atol))
+        # also when only swapping rows away from the ends
+        swapped = old_data.copy()
+        swapped[[1, 2]] = old_data[[2, 1]]
+        self.assertFalse(search2.input_data.matches(swapped, rtol, atol))
+
     def test_grid_search_against_CFSv2(self):
         self.search = pyfstat.GridSearch(
             "grid_search",
@@ -193,6 +391,11 @@ class TestGridSearch(BaseForTestsWithData):
         self.assertTrue(os.path.isfile(self.search.out_file))
         search_keys = ["F0", "F1"]  # only the ones that aren't 0-width
         self._test_plots(search_keys)
+        self.search.clean = True
+        self.search.batch_size = 7
+        data_pool = self.search.run(return_data=True, n_workers=2)
+        for key in self.search.output_keys:
+            self.assertTrue(np.array_equal(data_pool[key], self.search.data[key]))
 
 
 class TestGridSearchBSGL(TestGridSearch):
@@ -331,6 +534,23 @@ class TestTransientGridSearch(BaseForTestsWithData):
         self.assertTrue(os.path.isfile(search.out_file))
         max2F_point = search.get_max_twoF()
         self.assertTrue(np.all(max2F_point["twoF"] >= search.data["twoF"]))
+        # results must not depend on how the grid is split into batches
+        # and a clean rerun recomputes everything, rewriting all files
+        search.clean = True
+        search.batch_size = 3
+        outfiles = glob.glob(os.path.splitext(search.out_file)[0] + "_Fstatatoms_*.dat")
+        self.assertEqual(len(outfiles), search.total_iterations)
+        if transient:
+            outfiles += glob.glob(search.tCWfilebase + "*.dat")
+            self.assertEqual(len(outfiles), 2 * search.total_iterations)
+        for f in outfiles:
+            os.remove(f)
+        data_batched = search.run(return_data=True)
+        for key in search.output_keys:
+            self.assertTrue(np.array_equal(data_batched[key], search.data[key]))
+        self.assertEqual(len(search._det_stat_cache), search.total_iterations)
+        for f in outfiles:
+            self.assertTrue(os.path.isfile(f))
         if transient:
             tCWfile = search.get_transient_fstat_map_filename(max2F_point)
             self.assertTrue("twoF" in search.data.dtype.names)
@@ -474,6 +694,8 @@ class TestSearchOverGridFile(BaseForTestsWithData):
         )
         search.run()
         self.assertTrue(os.path.isfile(search.out_file))
+        # the same search should be able to reuse its own output file
+        self.assertIsNot(search.check_old_data_is_okay_to_use(), False)
         pyfstat_out = pyfstat.utils.read_txt_file_with_header(
             search.out_file, comments="#"
         )
@@ -1,5 +1,12 @@
+import multiprocessing
+import os
+import unittest
+from unittest import mock
+
+import lalpulsar
 import numpy as np
 import pytest
+from scipy import stats
 
 # FIXME this should be made cleaner with fixtures
 from commons_for_tests import (
@@ -91,6 +98,13 @@ class BaseForMCMCSearchTests(BaseForTestsWithData):
 
     def _test_plots(self):
         self.search.plot_corner(add_prior=True)
+        self.search.plot_corner(thin=1, plot_datapoints=False)
+        nsamples = len(self.search.samples)
+        self.assertEqual(len(self.search.get_thinned_samples(thin=1)), nsamples)
+        self.assertEqual(
+            len(self.search.get_thinned_samples(thin=2)),
+            self.search.nwalkers * int(np.ceil(nsamples / self.search.nwalkers / 2)),
+        )
         self.search.plot_prior_posterior()
         self.search.plot_cumulative_max()
         self.search.plot_chainconsumer()
@@ -465,6 +479,32 @@ class TestMCMCTransientSearch(BaseForMCMCSearchTests):
         self._check_mcmc_quantiles(transient=True)
         self._test_plots()
 
+    def test_transient_MCMC_t0only_with_pool(self):
+        theta = {
+            **self.basic_theta,
+            "transient_tstart": {
+                "type": "unif",
+                "lower": self.Writer.tstart,
+                "upper": self.Writer.tend - 2 * self.Writer.Tsft,
+            },
+            "transient_duration": self.transientTau,
+        }
+        with multiprocessing.Pool(2) as pool:
+            self.search = pyfstat.MCMCTransientSearch(
+                label=self.label,
+                outdir=self.outdir,
+                theta_prior=theta,
+                tref=self.tref,
+                sftfilepattern=self.Writer.sftfilepath,
+                **self.MCMC_params,
+                transientWindowType=self.transientWindowType,
+                pool=pool,
+            )
+            self.search.run(plot_walkers=False)
+        self.search.print_summary()
+        self._check_twoF_predicted()
+        self._check_mcmc_quantiles(transient=True)
+
     def test_transient_MCMC_tauonly(self):
         theta = {
             **self.basic_theta,
@@ -522,3 +562,267 @@ class TestMCMCTransientSearch(BaseForMCMCSearchTests):
 
     def test_transient_MCMC_t0_tau_BtSG(self, BtSG=False):
         self.test_transient_MCMC_t0_tau(BtSG=True)
+
+    def test_transient_MCMC_t0_tau_adapt_betas(self):
+        theta = {
+            **self.basic_theta,
+            "transient_tstart": {
+                "type": "unif",
+                "lower": self.Writer.tstart,
+                "upper": self.Writer.tend - 2 * self.Writer.Tsft,
+            },
+            "transient_duration": {
+                "type": "unif",
+                "lower": 2 * self.Writer.Tsft,
+                "upper": self.Writer.duration - 2 * self.Writer.Tsft,
+            },
+        }
+        self.search = pyfstat.MCMCTransientSearch(
+            label=self.label,
+            outdir=self.outdir,
+            theta_prior=theta,
+            tref=self.tref,
+            sftfilepattern=self.Writer.sftfilepath,
+            **{**self.MCMC_params, "ntemps": 3},
+            transientWindowType=self.transientWindowType,
+        )
+        initial_betas = self.search.betas.copy()
+        self.search.run(plot_walkers=False, adapt_betas=True)
+        self.search.print_summary()
+        nsteps = np.sum(self.MCMC_params["nsteps"])
+        self.assertEqual(self.search.beta_history.shape, (self.search.ntemps, nsteps))
+        self.assertEqual(self.search.betas[0], 1)
+        self.assertFalse(np.array_equal(self.search.betas, initial_betas))
+        # production stage runs with the final adapted ladder
+        nburn = self.MCMC_params["nsteps"][0]
+        for step in range(nburn, nsteps):
+            np.testing.assert_array_equal(
+                self.search.beta_history[:, step], self.search.betas
+            )
+        self._check_twoF_predicted()
+        self._check_mcmc_quantiles(transient=True)
+
+    def test_transient_MCMC_batched_evaluation(self):
+        theta = {
+            **self.basic_theta,
+            "transient_tstart": {
+                "type": "unif",
+                "lower": self.Writer.tstart,
+                "upper": self.Writer.tend - 2 * self.Writer.Tsft,
+            },
+            "transient_duration": {
+                "type": "halfnorm",
+                "loc": 2 * self.Writer.Tsft,
+                "scale": self.Writer.duration,
+            },
+        }
+        self.search = pyfstat.MCMCTransientSearch(
+            label=self.label,
+            outdir=self.outdir,
+            theta_prior=theta,
+            tref=self.tref,
+            sftfilepattern=self.Writer.sftfilepath,
+            **self.MCMC_params,
+            transientWindowType=self.transientWindowType,
+        )
+        self.search.logl_cache_size = 1000
+        self.search._initiate_search_object()
+        ps = np.array(
+            [
+                [self.transientStartTime, self.transientTau],
+                [self.Writer.tstart, self.transientTau],  # outside unif prior
+                [self.transientStartTime, self.Writer.Tsft],  # outside halfnorm
+                [self.Writer.tstart + self.Writer.Tsft, 0.25 * self.duration],
+            ]
+        )
+        logl, logp = self.search._evaluate_batch(ps)
+        for p, ll, lp in zip(ps, logl, logp):
+            lp_single = self.search._logp(
+                p, self.search.theta_prior, self.search.theta_keys, self.search
+            )
+            self.assertEqual(lp, lp_single)
+            if np.isfinite(lp_single):
+                self.assertAlmostEqual(ll, self.search._logl(p, self.search.search))
+            else:
+                self.assertEqual(ll, 0)
+        self.assertEqual(np.sum(np.isfinite(logp)), 2)
+        # repeated points within the same integer second reuse the cache
+        # without computing them again
+        hits = self.search.logl_cache_hits
+        ps_shifted = ps.copy()
+        ps_shifted[[0, 3]] += 0.1
+        with mock.patch.object(
+            self.search.search, "get_det_stat", wraps=self.search.search.get_det_stat
+        ) as get_det_stat:
+            logl_again, _ = self.search._evaluate_batch(ps_shifted)
+        get_det_stat.assert_not_called()
+        np.testing.assert_array_equal(logl_again, logl)
+        self.assertEqual(self.search.logl_cache_hits - hits, 2)
+        # but a new point is computed
+        ps_shifted[0] += self.Writer.Tsft
+        with mock.patch.object(
+            self.search.search, "get_det_stat", wraps=self.search.search.get_det_stat
+        ) as get_det_stat:
+            self.search._evaluate_batch(ps_shifted)
+        self.assertEqual(get_det_stat.call_count, 1)
+        # and with the default settings, nothing is cached
+        self.search = pyfstat.MCMCTransientSearch(
+            label=self.label,
+            outdir=self.outdir,
+            theta_prior=theta,
+            tref=self.tref,
+            sftfilepattern=self.Writer.sftfilepath,
+            **self.MCMC_params,
+            transientWindowType=self.transientWindowType,
+        )
+        self.search._initiate_search_object()
+        np.testing.assert_array_equal(self.search._evaluate_batch(ps)[0], logl)
+        self.assertEqual(len(self.search._logl_cache), 0)
+
+    def test_transient_MCMC_pool_with_two_searches(self):
+        theta = {
+            **self.basic_theta,
+            "transient_tstart": {
+                "type": "unif",
+                "lower": self.Writer.tstart,
+                "upper": self.Writer.tend - 2 * self.Writer.Tsft,
+            },
+            "transient_duration": self.transientTau,
+        }
+        search_kwargs = dict(
+            label=self.label,
+            outdir=self.outdir,
+            theta_prior=theta,
+            tref=self.tref,
+            sftfilepattern=self.Writer.sftfilepath,
+            **self.MCMC_params,
+            transientWindowType=self.transientWindowType,
+        )
+        ps = np.array([[self.transientStartTime], [self.Writer.tstart + 1800]])
+        # same label and outdir, but different data:
+        # the pool workers must not mix up their search objects
+        searches = [
+            pyfstat.MCMCTransientSearch(**search_kwargs),
+            pyfstat.MCMCTransientSearch(
+                **search_kwargs, maxStartTime=self.Writer.tend - self.Writer.Tsft
+            ),
+        ]
+        logls_serial = []
+        for search in searches:
+            search._initiate_search_object()
+            logls_serial.append(search._evaluate_batch(ps)[0])
+        self.assertFalse(np.array_equal(*logls_serial))
+        with multiprocessing.Pool(2) as pool:
+            for search, logl_serial in zip(searches, logls_serial):
+                search.pool = pool
+                np.testing.assert_array_equal(
+                    search._evaluate_batch(ps)[0], logl_serial
+                )
+
+    def test_transient_MCMC_reuse_saved_chain(self):
+        theta = {
+            **self.basic_theta,
+            "transient_tstart": {
+                "type": "unif",
+                "lower": self.Writer.tstart,
+                "upper": self.Writer.tend - 2 * self.Writer.Tsft,
+            },
+            "transient_duration": self.transientTau,
+        }
+        search_kwargs = dict(
+            label=self.label,
+            outdir=self.outdir,
+            theta_prior=theta,
+            tref=self.tref,
+            sftfilepattern=self.Writer.sftfilepath,
+            **self.MCMC_params,
+            transientWindowType=self.transientWindowType,
+        )
+        self.search = pyfstat.MCMCTransientSearch(**search_kwargs)
+        self.search.run(plot_walkers=False)
+        chain = self.search.chain.copy()
+        self.assertTrue(os.path.isfile(self.search._get_chain_path()))
+        # a second identical search reuses the saved results
+        self.search = pyfstat.MCMCTransientSearch(**search_kwargs)
+        self.search.run(plot_walkers=False)
+        self.assertIsInstance(self.search.chain, np.memmap)
+        np.testing.assert_array_equal(self.search.chain, chain)
+        self.search.print_summary()
+
+    def test_transient_MCMC_sets_up_data_once(self):
+        theta = {
+            **self.basic_theta,
+            "transient_tstart": {
+                "type": "unif",
+                "lower": self.Writer.tstart,
+                "upper": self.Writer.tend - 2 * self.Writer.Tsft,
+            },
+            "transient_duration": self.transientTau,
+        }
+        self.search = pyfstat.MCMCTransientSearch(
+            label=self.label,
+            outdir=self.outdir,
+            theta_prior=theta,
+            tref=self.tref,
+            sftfilepattern=self.Writer.sftfilepath,
+            **self.MCMC_params,
+            transientWindowType=self.transientWindowType,
+            clean=True,
+        )
+        # all likelihood calls of a run share one ComputeFstat setup
+        with mock.patch(
+            "pyfstat.core.lalpulsar.SFTdataFind", wraps=lalpulsar.SFTdataFind
+        ) as SFTdataFind, mock.patch(
+            "pyfstat.core.lalpulsar.CreateFstatInput",
+            wraps=lalpulsar.CreateFstatInput,
+        ) as CreateFstatInput:
+            self.search.run(plot_walkers=False)
+        self.assertEqual(SFTdataFind.call_count, 1)
+        self.assertEqual(CreateFstatInput.call_count, 1)
+
+
+class TestPriorDistributions(unittest.TestCase):
+    # the prior helpers only need theta_keys and theta_prior,
+    # so test them on a bare instance without any data
+    def setUp(self):
+        self.search = pyfstat.MCMCSearch.__new__(pyfstat.MCMCSearch)
+        np.random.seed(1)
+
+    def test_lognorm_lnprior(self):
+        prior = {"type": "lognorm", "loc": np.log(30.0), "scale": 0.1}
+        lnprior = self.search._generic_lnprior(**prior)
+        x = np.linspace(20, 40, 11)
+        expected = stats.lognorm(s=prior["scale"], scale=np.exp(prior["loc"])).logpdf(x)
+        np.testing.assert_allclose(lnprior(x), expected)
+        self.assertAlmostEqual(lnprior(x[3]), expected[3])
+        self.assertEqual(lnprior(-1.0), -np.inf)
+        np.testing.assert_array_equal(lnprior(np.array([-1.0, 0.0])), -np.inf)
+        # and the draws follow the same distribution
+        draws = self.search._generate_rv(size=10000, **prior)
+        self.assertGreater(
+            stats.kstest(draws, stats.lognorm(s=0.1, scale=30.0).cdf).pvalue, 1e-3
+        )
+
+    def test_halfnorm_draws(self):
+        for Type, sign in [("halfnorm", 1), ("neghalfnorm", -1)]:
+            prior = {"type": Type, "loc": 1.0, "scale": 0.5}
+            draws = self.search._generate_rv(size=10000, **prior)
+            # halfnorm draws lie above loc, neghalfnorm ones below -loc
+            self.assertTrue(np.all(sign * draws >= prior["loc"]))
+            self.assertGreater(
+                stats.kstest(
+                    sign * draws, stats.halfnorm(loc=1.0, scale=0.5).cdf
+                ).pvalue,
+                1e-3,
+            )
+            lnprior = self.search._generic_lnprior(**prior)
+            self.assertTrue(np.all(np.isfinite(lnprior(draws))))
+            self.assertEqual(lnprior(-sign * 1.0), -np.inf)
+            # and the prior bounds cover the draws
+            self.search.theta_keys = ["F1"]
+            self.search.theta_prior = {"F1": prior}
+            bounds, norm_trunc_warning = self.search._get_prior_bounds(normal_stds=3)
+            self.assertTrue(norm_trunc_warning)
+            lower, upper = bounds["F1"]["lower"], bounds["F1"]["upper"]
+            self.assertLess(lower, upper)
+            self.assertGreater(np.mean((draws >= lower) & (draws <= upper)), 0.99)
@@ -11,11 +11,11 @@ import pyfstat
 
 @pytest.mark.parametrize("snr", [0, 10])
 @pytest.mark.parametrize("window", ["rect", "exp"])
-@pytest.mark.parametrize("tCWFstatMapVersion", ["lal", "pycuda"])
+@pytest.mark.parametrize("tCWFstatMapVersion", ["lal", "pycuda", "numba"])
 def test_compute_transient_fstat_map(tCWFstatMapVersion, window, snr):
     logging.info("Initialising transient FstatMap features...")
     features = pyfstat.tcw_fstat_map_funcs._get_transient_fstat_map_features()
-    if tCWFstatMapVersion == "pycuda" and not features[tCWFstatMapVersion]:
+    if tCWFstatMapVersion != "lal" and not features[tCWFstatMapVersion]:
         pytest.skip(f"Feature {tCWFstatMapVersion} not available.")
     (
         tCWFstatMapFeatures,
@@ -0,0 +1,111 @@
+import shlex
+from unittest import mock
+
+import lal
+import lalpulsar
+import numpy as np
+import pytest
+
+from pyfstat.utils import generate_loudest_file, get_covering_band, make_loudest_runner
+from pyfstat.utils.runlalsuite import _as_gps_tuple, _get_covering_band_cached
+
+sftfilepattern = "/data dir/H-*_H1_1800SFT_*.sft;/data dir/L-[0-9]_L1*.sft"
+
+runner_kwargs = {
+    "sftfilepattern": sftfilepattern,
+    "minStartTime": 1000000000,
+    "maxStartTime": 1000086400,
+    "earth_ephem": "earth00-40-DE405.dat.gz",
+}
+
+# the options take precedence over the same keys in max_params
+max_params = {"Freq": 30.0, "Alpha": 1.5, "Delta": -0.5, "minStartTime": 5}
+
+expected_argv = [
+    "lalpulsar_ComputeFstatistic_v2",
+    f"--DataFiles={sftfilepattern}",
+    "--outputLoudest=/some/outdir/test.loudest",
+    "--refTime=1000043200",
+    "--Freq=30.0",
+    "--Alpha=1.5",
+    "--Delta=-0.5",
+    "--minStartTime=1000000000",
+    "--maxStartTime=1000086400",
+    "--ephemEarth=earth00-40-DE405.dat.gz",
+]
+
+
+@pytest.fixture
+def run_commandline():
+    with mock.patch("pyfstat.utils.runlalsuite.run_commandline") as run_commandline:
+        yield run_commandline
+
+
+def test_make_loudest_runner(run_commandline):
+    run_loudest = make_loudest_runner(**runner_kwargs)
+    loudest_file = run_loudest(max_params, 1000043200, "/some/outdir", "test")
+    assert loudest_file == "/some/outdir/test.loudest"
+    run_commandline.assert_called_once()
+    cmd = run_commandline.call_args.args[0]
+    assert cmd == (
+        "lalpulsar_ComputeFstatistic_v2"
+        " '--DataFiles=/data dir/H-*_H1_1800SFT_*.sft;/data dir/L-[0-9]_L1*.sft'"
+        " --outputLoudest=/some/outdir/test.loudest --refTime=1000043200"
+        " --Freq=30.0 --Alpha=1.5 --Delta=-0.5"
+        " --minStartTime=1000000000 --maxStartTime=1000086400"
+        " --ephemEarth=earth00-40-DE405.dat.gz"
+    )
+    # the shell sees the SFT pattern as a single, unexpanded argument
+    assert shlex.split(cmd) == expected_argv
+    # repeated calls only change the point-dependent arguments
+    run_loudest({"Freq": 31.0}, 1000043200, "/some/outdir", "test2")
+    assert shlex.split(run_commandline.call_args.args[0]) == [
+        expected_argv[0],
+        expected_argv[1],
+        "--outputLoudest=/some/outdir/test2.loudest",
+        "--refTime=1000043200",
+        "--Freq=31.0",
+        *expected_argv[-3:],
+    ]
+
+
+def test_generate_loudest_file(run_commandline):
+    loudest_file = generate_loudest_file(
+        max_params, 1000043200, "/some/outdir", "test", **runner_kwargs
+    )
+    assert loudest_file == "/some/outdir/test.loudest"
+    run_commandline.assert_called_once()
+    assert shlex.split(run_commandline.call_args.args[0]) == expected_argv
+
+
+def test_get_covering_band_cache():
+    tstart = lal.LIGOTimeGPS(1000000000)
+    band_kwargs = {
+        "tref": 1000000000,
+        "tstart": tstart,
+        "tend": 1000086400,
+        "fkdot": np.zeros(lalpulsar.PULSAR_MAX_SPINS),
+        "fkdotBand": np.zeros(lalpulsar.PULSAR_MAX_SPINS),
+    }
+    band_kwargs["fkdot"][:2] = [30.0, -1e-10]
+    band_kwargs["fkdotBand"][:2] = [0.1, 1e-10]
+    _get_covering_band_cached.cache_clear()
+    band = get_covering_band(**band_kwargs)
+    assert 0 < band[0] < 30.0 < 30.1 < band[1]
+    # equivalent inputs of other types hit the cache and return the same band
+    band_kwargs.update(
+        tref=lal.LIGOTimeGPS(1000000000),
+        tstart=1000000000.0,
+        fkdot=band_kwargs["fkdot"].tolist(),
+    )
+    assert get_covering_band(**band_kwargs) == band
+    info = _get_covering_band_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    # the times are only cached as plain (gpsSeconds, gpsNanoSeconds) tuples
+    for t in [1000000000, 1000000000.0, tstart]:
+        assert _as_gps_tuple(t) == (1000000000, 0)
+    assert _as_gps_tuple(lal.LIGOTimeGPS(1000000000, 5)) == (1000000000, 5)
+    # while different times are new cache entries
+    band_kwargs["tend"] = lal.LIGOTimeGPS(1000000000 + 10 * 86400)
+    assert get_covering_band(**band_kwargs) != band
+    assert _get_covering_band_cached.cache_info().misses == 2
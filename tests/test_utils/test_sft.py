@@ -56,6 +56,7 @@ def test_get_sft_as_arrays(data_for_test):
     np.testing.assert_allclose(frequencies, expected_frequencies)
     np.testing.assert_equal(times[ifo], timestamps[ifo])
     assert frequencies.shape + times[ifo].shape == amplitudes[ifo].shape
+    assert amplitudes[ifo].flags.f_contiguous
 
     # Multi-detector
     frequencies, times, amplitudes = get_sft_as_arrays(single_detector_path)
@@ -64,6 +65,40 @@ def test_get_sft_as_arrays(data_for_test):
         np.testing.assert_equal(times[ifo], timestamps[ifo])
         assert frequencies.shape + times[ifo].shape == amplitudes[ifo].shape
 
+    # Each call returns its own, writable frequencies
+    assert get_sft_as_arrays(single_detector_path)[0] is not frequencies
+    assert frequencies.flags.writeable
+
+
+@pytest.mark.parametrize("fMin, fMax", [(None, None), (9.97, 10.02)])
+def test_get_sft_as_arrays_with_memmap(data_for_test, fMin, fMax):
+
+    writer, _ = data_for_test
+
+    frequencies, times, amplitudes = get_sft_as_arrays(writer.sftfilepath, fMin, fMax)
+    mm_frequencies, mm_times, mm_amplitudes = get_sft_as_arrays(
+        writer.sftfilepath, fMin, fMax, use_memmap=True
+    )
+    np.testing.assert_equal(mm_frequencies, frequencies)
+    assert mm_times.keys() == times.keys()
+    for ifo in times:
+        np.testing.assert_equal(mm_times[ifo], times[ifo])
+        assert mm_amplitudes[ifo].dtype == amplitudes[ifo].dtype
+        np.testing.assert_equal(mm_amplitudes[ifo], amplitudes[ifo])
+        # each detector's SFTs are in a single file, so no copy is needed
+        assert not mm_amplitudes[ifo].flags.writeable
+
+
+@pytest.mark.parametrize(
+    "fMin, fMax", [(10.02, 9.98), (9.9, 10.0), (10.0, 10.2), (11.0, 12.0)]
+)
+def test_get_sft_as_arrays_invalid_band(data_for_test, fMin, fMax):
+
+    writer, _ = data_for_test
+
+    with pytest.raises(ValueError):
+        get_sft_as_arrays(writer.sftfilepath, fMin, fMax)
+
 
 @pytest.mark.parametrize("quantity", ["power", "normpower", "real", "imag"])
 def test_spectrogram(data_for_test, quantity):
@@ -84,3 +119,17 @@ def test_spectrogram(data_for_test, quantity):
 
     plotfile = os.path.join(writer.outdir, plotlabel + ".png")
     assert os.path.isfile(plotfile)
+
+
+@pytest.mark.parametrize("quantity, sqrtSX", [("amplitude", 1), ("normpower", None)])
+def test_spectrogram_invalid_quantity(data_for_test, quantity, sqrtSX):
+
+    writer, _ = data_for_test
+
+    with pytest.raises(ValueError):
+        plot_spectrogram(
+            sftfilepattern=writer.sftfilepath,
+            quantity=quantity,
+            sqrtSX=sqrtSX,
+            detector=writer.detectors.split(",")[0],
+        )